@@ -14,14 +14,26 @@ See README.md or go to https://github.com/cda-tum/mqt-bench for more information
 
 from __future__ import annotations
 
+from mqt.bench.batch import generate_benchmarks, iter_benchmarks
 from mqt.bench.benchmark_generation import (
     CompilerSettings,
     QiskitSettings,
+    get_all_levels,
     get_benchmark,
 )
+from mqt.bench.binding import bind, bind_many
+from mqt.bench.estimation import estimate_duration, estimate_success_probability, estimate_success_probability_many
 
 __all__ = [
     "CompilerSettings",
     "QiskitSettings",
+    "bind",
+    "bind_many",
+    "estimate_duration",
+    "estimate_success_probability",
+    "estimate_success_probability_many",
+    "generate_benchmarks",
+    "get_all_levels",
     "get_benchmark",
+    "iter_benchmarks",
 ]
@@ -0,0 +1,458 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Batch generation of benchmarks from `Benchmark` configurations."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import cache, partial
+from typing import TYPE_CHECKING
+
+from .benchmark_generation import (
+    CompilerSettings,
+    QiskitSettings,
+    create_circuit,
+    generate_filename,
+    get_alg_level,
+    get_benchmark,
+    get_indep_level,
+    get_mapped_level,
+    get_native_gates_level,
+    get_supported_benchmarks,
+    get_supported_levels,
+)
+from .devices import (
+    get_available_device_names,
+    get_available_native_gatesets,
+    get_device_by_name,
+    get_native_gateset_by_name,
+)
+from .limits import GenerationFailure, run_with_limits
+from .manifest import clear_manifests, is_up_to_date
+from .output import OutputFormat, save_circuit
+from .registry import get_runtime_registrations, get_spec, restore_runtime_registrations
+from .resources import check_gate_budget
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+
+    from qiskit import QuantumCircuit
+
+    from .benchmark_generation import Benchmark
+
+logger = logging.getLogger(__name__)
+
+LEVEL_NAMES = {0: "alg", 1: "indep", 2: "nativegates", 3: "mapped"}
+
+
+@dataclass(frozen=True)
+class BenchmarkJob:
+    """A single benchmark circuit that is generated on all requested levels.
+
+    Attributes:
+        benchmark_name: name of the benchmark (including the ancillary mode for grover and qwalk)
+        circuit_size: input for the benchmark creation, ``None`` for instance-based benchmarks
+        benchmark_instance_name: instance of the benchmark, only used for "shor"
+        file_precheck: whether existing files are kept instead of being generated again
+    """
+
+    benchmark_name: str
+    circuit_size: int | None
+    benchmark_instance_name: str | None = None
+    file_precheck: bool = False
+
+
+@dataclass(frozen=True)
+class BatchSettings:
+    """Targets that every job of a batch is generated for.
+
+    Attributes:
+        levels: abstraction levels to generate
+        gatesets: names of the gatesets used for the "nativegates" level
+        devices: names of the devices used for the "mapped" level
+        opt_levels: Qiskit optimization levels used for the "nativegates" and "mapped" level
+        target_directory: directory to store the created circuits in
+        output_format: one of supported formats, as defined in `OutputFormat`
+        synthesis_jobs: number of worker processes per job for the Solovay-Kitaev synthesis of the "clifford+t" gateset
+    """
+
+    levels: tuple[str, ...]
+    gatesets: tuple[str, ...]
+    devices: tuple[str, ...]
+    opt_levels: tuple[int, ...]
+    target_directory: str = "./"
+    output_format: OutputFormat = OutputFormat.QASM3
+    synthesis_jobs: int | None = None
+
+
+def expand_benchmark_configs(configs: Iterable[Benchmark]) -> list[BenchmarkJob]:
+    """Expands benchmark configurations into the list of circuits to generate.
+
+    Each configuration is expanded over its qubit range ``min_qubits`` to ``max_qubits`` (inclusive) using
+    ``stepsize``, over its ``ancillary_mode`` entries for benchmarks with ancillary modes such as "grover" and "qwalk"
+    (default: all modes), and over its ``instances`` for benchmarks selected by instance such as "shor" (default: all
+    named instances). Configurations with ``include`` set to ``False`` are skipped.
+
+    Arguments:
+        configs: benchmark configurations
+
+    Returns:
+        the jobs in the order of the configurations
+    """
+    return list(_iter_benchmark_jobs(configs))
+
+
+def _iter_benchmark_jobs(configs: Iterable[Benchmark]) -> Iterator[BenchmarkJob]:
+    """Lazily expands benchmark configurations into jobs (see `expand_benchmark_configs`)."""
+    for config in configs:
+        if not config.get("include", True):
+            continue
+
+        name = config["name"]
+        file_precheck = config.get("precheck_possible", False)
+
+        # the name of a benchmark with ancillary modes may already include one of them (e.g., "grover-v-chain")
+        spec = get_spec(name)
+
+        if spec is not None and spec.selected_by_instance:
+            for instance in config.get("instances", spec.instances):
+                yield BenchmarkJob(name, None, instance, file_precheck=file_precheck)
+            continue
+
+        if spec is not None and spec.ancillary_modes:
+            names = [f"{name}-{mode}" for mode in config.get("ancillary_mode", spec.ancillary_modes)]
+        else:
+            names = [name]
+
+        for benchmark_name in names:
+            if benchmark_name not in get_supported_benchmarks():
+                msg = f"Selected benchmark is not supported. Valid benchmarks are {get_supported_benchmarks()}."
+                raise ValueError(msg)
+            for size in range(config["min_qubits"], config["max_qubits"] + 1, config.get("stepsize", 1)):
+                yield BenchmarkJob(benchmark_name, size, file_precheck=file_precheck)
+
+
+def generate_benchmarks(
+    configs: Iterable[Benchmark],
+    levels: Sequence[str | int] = ("alg", "indep", "nativegates", "mapped"),
+    devices: Sequence[str] | None = None,
+    gatesets: Sequence[str] | None = None,
+    opt_levels: Sequence[int] = (1,),
+    jobs: int | None = None,
+    target_directory: str = "./",
+    output_format: OutputFormat = OutputFormat.QASM3,
+    timeout_s: float | None = None,
+    max_memory_mb: int | None = None,
+    synthesis_jobs: int | None = None,
+) -> list[bool]:
+    """Generates and saves all benchmarks described by the configurations using a pool of worker processes.
+
+    Every configuration is expanded into a grid of circuits (see `expand_benchmark_configs`). Each circuit is created
+    once on the algorithm level and then compiled for all requested levels, gatesets, devices and optimization levels.
+    For the "mapped" level, only devices with enough qubits are considered.
+
+    Arguments:
+        configs: benchmark configurations
+        levels: abstraction levels to generate, either as strings or as numbers between 0 and 3
+        devices: names of the devices for the "mapped" level (default: all available devices)
+        gatesets: names of the gatesets for the "nativegates" level (default: all available gatesets)
+        opt_levels: Qiskit optimization levels for the "nativegates" and "mapped" level
+        jobs: number of worker processes (default: number of CPUs); with ``1``, everything runs in the current process
+        target_directory: directory to store the created circuits in
+        output_format: one of supported formats, as defined in `OutputFormat`
+        timeout_s: maximum wall-clock time per job in seconds, see `get_benchmark`
+        max_memory_mb: maximum memory per job in MiB, see `get_benchmark`
+        synthesis_jobs: number of worker processes per job for the Solovay-Kitaev synthesis of the "clifford+t"
+            gateset (default: ``1``), see `mqt.bench.compilation.synthesize_single_qubit_gates`; mostly useful with
+            ``jobs=1``, since the workers of the batch already run in parallel
+
+    Returns:
+        one entry per expanded job indicating whether all of its files were created successfully
+    """
+    settings = _make_settings(levels, devices, gatesets, opt_levels, target_directory, output_format, synthesis_jobs)
+    benchmark_jobs = expand_benchmark_configs(configs)
+    # the manifest of the target directory is read once per batch and process
+    clear_manifests()
+    supervised = timeout_s is not None or max_memory_mb is not None
+    if supervised:
+        worker = partial(_generate_job_with_limits, settings=settings, timeout_s=timeout_s, max_memory_mb=max_memory_mb)
+    else:
+        worker = partial(_generate_job, settings=settings)
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs == 1 or len(benchmark_jobs) <= 1:
+        return [worker(job) for job in benchmark_jobs]
+
+    with _make_executor(jobs, supervised) as executor:
+        return list(executor.map(worker, benchmark_jobs))
+
+
+def iter_benchmarks(
+    configs: Iterable[Benchmark],
+    level: str | int = "indep",
+    gateset: str = "ibm_falcon",
+    device_name: str = "ibm_washington",
+    opt_level: int = 1,
+    jobs: int | None = None,
+    max_in_flight: int | None = None,
+    timeout_s: float | None = None,
+    max_memory_mb: int | None = None,
+) -> Iterator[tuple[BenchmarkJob, QuantumCircuit]]:
+    """Generates the benchmarks described by the configurations and yields them one by one as they are completed.
+
+    In contrast to `generate_benchmarks`, nothing is written to disk and the circuits are generated for one level and
+    target only. The configurations are expanded lazily (see `expand_benchmark_configs`) and at most ``max_in_flight``
+    circuits are generated or waiting to be consumed at any time, so that memory consumption does not grow with the
+    size of the sweep. Circuits that cannot be generated are logged and skipped.
+
+    Arguments:
+        configs: benchmark configurations
+        level: abstraction level, either as a string or as a number between 0 and 3
+        gateset: name of the gateset for the "nativegates" level
+        device_name: name of the device for the "mapped" level
+        opt_level: Qiskit optimization level for the "nativegates" and "mapped" level
+        jobs: number of worker processes (default: number of CPUs); with ``1``, everything runs in the current process
+            and the circuits are yielded in the order of the configurations
+        max_in_flight: maximum number of circuits being generated at once (default: twice the number of workers)
+        timeout_s: maximum wall-clock time per circuit in seconds, see `get_benchmark`
+        max_memory_mb: maximum memory per circuit in MiB, see `get_benchmark`
+
+    Yields:
+        the job describing each circuit together with the circuit, in the order of completion
+    """
+    if level not in get_supported_levels():
+        msg = f"Selected level must be in {get_supported_levels()}."
+        raise ValueError(msg)
+    worker = partial(
+        _get_benchmark_for_job,
+        level=level,
+        gateset=get_native_gateset_by_name(gateset).name,
+        device_name=get_device_by_name(device_name).name,
+        opt_level=opt_level,
+        timeout_s=timeout_s,
+        max_memory_mb=max_memory_mb,
+    )
+    benchmark_jobs = _iter_benchmark_jobs(configs)
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs == 1:
+        for job in benchmark_jobs:
+            qc = worker(job)
+            if qc is not None:
+                yield job, qc
+        return
+
+    if max_in_flight is None:
+        max_in_flight = 2 * jobs
+
+    executor = _make_executor(jobs, supervised=timeout_s is not None or max_memory_mb is not None)
+    try:
+        in_flight: dict[Future[QuantumCircuit | None], BenchmarkJob] = {}
+        while True:
+            for job in itertools.islice(benchmark_jobs, max_in_flight - len(in_flight)):
+                in_flight[executor.submit(worker, job)] = job
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                completed_job = in_flight.pop(future)
+                qc = future.result()
+                if qc is not None:
+                    yield completed_job, qc
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _make_executor(jobs: int, supervised: bool) -> Executor:
+    """Creates the pool that runs the jobs of a batch.
+
+    Supervised jobs already run in a subprocess of their own, so that threads suffice to run them concurrently. The
+    spawned worker processes register the benchmarks registered at runtime in the parent process.
+    """
+    if supervised:
+        return ThreadPoolExecutor(max_workers=jobs)
+    # Qiskit's internal thread pools do not survive a fork, hence, the workers are spawned
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=restore_runtime_registrations,
+        initargs=(get_runtime_registrations(),),
+    )
+
+
+def _make_settings(
+    levels: Sequence[str | int],
+    devices: Sequence[str] | None,
+    gatesets: Sequence[str] | None,
+    opt_levels: Sequence[int],
+    target_directory: str,
+    output_format: OutputFormat,
+    synthesis_jobs: int | None,
+) -> BatchSettings:
+    """Validates the batch targets and resolves the defaults."""
+    level_names = []
+    for level in levels:
+        if level not in get_supported_levels():
+            msg = f"Selected level must be in {get_supported_levels()}."
+            raise ValueError(msg)
+        level_names.append(LEVEL_NAMES[level] if isinstance(level, int) else level)
+
+    if devices is None:
+        devices = get_available_device_names()
+    if gatesets is None:
+        gatesets = [gateset.name for gateset in get_available_native_gatesets()]
+
+    # resolve the names once so that invalid ones fail before any worker is started
+    for device_name in devices:
+        get_device_by_name(device_name)
+    for gateset_name in gatesets:
+        get_native_gateset_by_name(gateset_name)
+
+    return BatchSettings(
+        levels=tuple(level_names),
+        gatesets=tuple(gatesets),
+        devices=tuple(devices),
+        opt_levels=tuple(opt_levels),
+        target_directory=target_directory,
+        output_format=output_format,
+        synthesis_jobs=synthesis_jobs,
+    )
+
+
+def _generate_job(job: BenchmarkJob, settings: BatchSettings) -> bool:
+    """Runs a single job and reports failures instead of raising them, so that one job cannot abort the batch."""
+    try:
+        return _save_on_all_levels(job, settings)
+    except Exception:
+        logger.exception("Generating %s failed.", job)
+        return False
+
+
+def _generate_job_with_limits(
+    job: BenchmarkJob, settings: BatchSettings, timeout_s: float | None, max_memory_mb: int | None
+) -> bool:
+    """Runs a single job in a supervised subprocess and reports failures instead of raising them."""
+    result = run_with_limits(_save_on_all_levels, (job, settings), timeout_s=timeout_s, max_memory_mb=max_memory_mb)
+    if isinstance(result, GenerationFailure):
+        logger.error("Generating %s failed (%s): %s", job, result.reason, result.message)
+        return False
+    return result
+
+
+def _get_benchmark_for_job(
+    job: BenchmarkJob,
+    level: str | int,
+    gateset: str,
+    device_name: str,
+    opt_level: int,
+    timeout_s: float | None = None,
+    max_memory_mb: int | None = None,
+) -> QuantumCircuit | None:
+    """Returns the circuit of a job or ``None`` if it cannot be generated, so that one job cannot abort the sweep."""
+    try:
+        return get_benchmark(
+            job.benchmark_name,
+            level,
+            job.circuit_size,
+            job.benchmark_instance_name,
+            CompilerSettings(QiskitSettings(opt_level)),
+            gateset,
+            device_name,
+            timeout_s=timeout_s,
+            max_memory_mb=max_memory_mb,
+        )
+    except Exception:
+        logger.exception("Generating %s failed.", job)
+        return None
+
+
+def _save_on_all_levels(job: BenchmarkJob, settings: BatchSettings) -> bool:
+    """Creates the circuit of a job and saves it on all levels of the batch settings."""
+    precheck = job.file_precheck
+    directory = settings.target_directory
+    fmt = settings.output_format
+
+    check_gate_budget(job.benchmark_name, job.circuit_size, job.benchmark_instance_name)
+    qc = create_circuit(job.benchmark_name, job.circuit_size, job.benchmark_instance_name)
+    num_qubits = job.circuit_size if job.circuit_size is not None else qc.num_qubits
+
+    # the target-independent circuit is the starting point for all target-dependent levels, so that the high-level
+    # building blocks of the circuit are synthesized only once, and only if any of these levels is not up to date
+    get_indep_circuit = cache(lambda: get_indep_level(qc, num_qubits, False, True))
+
+    results: list[bool] = []
+    for level in settings.levels:
+        if level == "alg":
+            results.append(bool(get_alg_level(qc, num_qubits, precheck, False, directory, output_format=fmt)))
+        elif level == "indep":
+            filename = generate_filename(qc.name, "indep", num_qubits)
+            if precheck and is_up_to_date(directory, filename, fmt):
+                results.append(True)
+            else:
+                results.append(save_circuit(get_indep_circuit(), filename, fmt, target_directory=directory))
+        elif level == "nativegates":
+            for gateset_name in settings.gatesets:
+                gateset = get_native_gateset_by_name(gateset_name)
+                for opt_level in settings.opt_levels:
+                    filename = generate_filename(
+                        qc.name, "nativegates", num_qubits, gateset=gateset, opt_level=opt_level
+                    )
+                    if precheck and is_up_to_date(directory, filename, fmt, gateset.gates):
+                        results.append(True)
+                        continue
+                    results.append(
+                        get_native_gates_level(
+                            get_indep_circuit(),
+                            gateset,
+                            num_qubits,
+                            opt_level,
+                            False,
+                            False,
+                            directory,
+                            filename,
+                            output_format=fmt,
+                            synthesis_jobs=settings.synthesis_jobs,
+                        )
+                    )
+        elif level == "mapped":
+            for device_name in settings.devices:
+                device = get_device_by_name(device_name)
+                if device.num_qubits < qc.num_qubits:
+                    continue
+                for opt_level in settings.opt_levels:
+                    filename = generate_filename(qc.name, "mapped", num_qubits, device=device, opt_level=opt_level)
+                    if precheck and is_up_to_date(directory, filename, fmt, device.gateset.gates, device.coupling_map):
+                        results.append(True)
+                        continue
+                    results.append(
+                        get_mapped_level(
+                            get_indep_circuit(),
+                            num_qubits,
+                            device,
+                            opt_level,
+                            False,
+                            False,
+                            directory,
+                            filename,
+                            output_format=fmt,
+                        )
+                    )
+
+    return all(results)
@@ -11,21 +11,27 @@
 from __future__ import annotations
 
 from importlib import import_module
-from pathlib import Path
 from typing import TYPE_CHECKING, Literal, TypedDict, overload
 
-from qiskit import QuantumCircuit, transpile
-
-from .devices import get_available_device_names, get_device_by_name, get_native_gateset_by_name
+from .cache import circuit_fingerprint, get_cache
+from .compilation import SEED_TRANSPILER, compile_circuits, get_pass_manager
+from .devices import Device, Gateset, get_available_device_names, get_device_by_name, get_native_gateset_by_name
+from .limits import GenerationFailure, GenerationLimitError, run_with_limits
+from .manifest import is_up_to_date
+from .multi_controlled import expand_multi_controlled_gates
 from .output import (
     OutputFormat,
     save_circuit,
 )
+from .registry import get_benchmark_spec, get_spec, get_supported_benchmark_names
+from .resources import DEFAULT_GATE_BUDGET, check_gate_budget
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
     from types import ModuleType
 
-    from .devices import Device, Gateset
+    from qiskit import QuantumCircuit
+    from typing_extensions import Unpack
 
 from dataclasses import dataclass
 
@@ -49,6 +55,30 @@ class Benchmark(TypedDict, total=False):
     precheck_possible: bool
 
 
+class BenchmarkOptions(TypedDict, total=False):
+    """Additional arguments of the benchmark generation, which are passed on to the ``create_circuit`` functions."""
+
+    N: int
+    a: int | None
+    probability: float
+    dynamic: bool
+    hidden_string: str | None
+    balanced: bool
+    degree: int
+    color_edges: bool
+    use_for_loop: bool
+    repetitions: int
+    seed: int
+    graph: str
+    edge_probability: float
+    parameterized: bool
+    depth: int
+    coin_state_preparation: QuantumCircuit | None
+    native: bool
+    depth_ratio: float
+    two_qubit_gate_density: float
+
+
 @dataclass
 class QiskitSettings:
     """Data class for the Qiskit compiler settings."""
@@ -110,7 +140,7 @@ def get_alg_level(
     Arguments:
         qc: quantum circuit which the to be created benchmark circuit is based on
         num_qubits: number of qubits
-        file_precheck: flag indicating whether to check whether the file already exists before creating it (again)
+        file_precheck: flag indicating whether to skip the file if the manifest of the target directory lists it as up to date
         return_qc: flag if the actual circuit shall be returned
         target_directory: alternative directory to the default one to store the created circuit
         target_filename: alternative filename to the default one
@@ -128,9 +158,7 @@ def get_alg_level(
         raise ValueError(msg)
 
     filename_alg = target_filename or generate_filename(benchmark_name=qc.name, level="alg", num_qubits=num_qubits)
-    path = Path(target_directory, f"{filename_alg}.{output_format.extension()}")
-
-    if file_precheck and path.is_file():
+    if file_precheck and is_up_to_date(target_directory, filename_alg, output_format):
         return True
 
     return save_circuit(
@@ -179,7 +207,7 @@ def get_indep_level(
     Arguments:
         qc: quantum circuit which the to be created benchmark circuit is based on
         num_qubits: number of qubits
-        file_precheck: flag indicating whether to check whether the file already exists before creating it (again)
+        file_precheck: flag indicating whether to skip the file if the manifest of the target directory lists it as up to date
         return_qc: flag if the actual circuit shall be returned
         target_directory: alternative directory to the default one to store the created circuit
         target_filename: alternative filename to the default one
@@ -190,18 +218,10 @@ def get_indep_level(
         else: True/False indicating whether the function call was successful or not
     """
     filename_indep = target_filename or generate_filename(benchmark_name=qc.name, level="indep", num_qubits=num_qubits)
-    path = Path(target_directory, f"{filename_indep}.{output_format.extension()}")
-
-    if file_precheck and path.is_file():
+    if file_precheck and is_up_to_date(target_directory, filename_indep, output_format):
         return True
 
-    openqasm_gates = get_openqasm_gates()
-    target_independent = transpile(
-        qc,
-        basis_gates=openqasm_gates,
-        optimization_level=1,
-        seed_transpiler=10,
-    )
+    target_independent = _compile_cached(qc, "indep", lambda: _compile_indep(qc))
 
     if return_qc:
         return target_independent
@@ -225,6 +245,7 @@ def get_native_gates_level(
     target_directory: str = "./",
     target_filename: str = "",
     output_format: OutputFormat = OutputFormat.QASM3,
+    synthesis_jobs: int | None = None,
 ) -> QuantumCircuit: ...
 
 
@@ -239,6 +260,7 @@ def get_native_gates_level(
     target_directory: str = "./",
     target_filename: str = "",
     output_format: OutputFormat = OutputFormat.QASM3,
+    synthesis_jobs: int | None = None,
 ) -> bool: ...
 
 
@@ -252,6 +274,7 @@ def get_native_gates_level(
     target_directory: str = "./",
     target_filename: str = "",
     output_format: OutputFormat = OutputFormat.QASM3,
+    synthesis_jobs: int | None = None,
 ) -> bool | QuantumCircuit:
     """Handles the creation of the benchmark on the target-dependent native gates level.
 
@@ -260,11 +283,13 @@ def get_native_gates_level(
         gateset: contains the name of the gateset and a list of native gates
         num_qubits: number of qubits
         opt_level: optimization level
-        file_precheck: flag indicating whether to check whether the file already exists before creating it (again)
+        file_precheck: flag indicating whether to skip the file if the manifest of the target directory lists it as up to date
         return_qc: flag if the actual circuit shall be returned
         target_directory: alternative directory to the default one to store the created circuit
         target_filename: alternative filename to the default one
         output_format: one of supported formats, as defined in `OutputFormat`
+        synthesis_jobs: number of worker processes for the Solovay-Kitaev synthesis of the "clifford+t" gateset
+            (default: ``1``), see `mqt.bench.compilation.synthesize_single_qubit_gates`
 
     Returns:
         if return_qc == True: quantum circuit object
@@ -272,41 +297,21 @@ def get_native_gates_level(
     """
     filename_native = target_filename or generate_filename(
         benchmark_name=qc.name,
-        level="native",
+        level="nativegates",
         num_qubits=num_qubits,
         gateset=gateset,
         opt_level=opt_level,
     )
-    path = Path(target_directory, f"{filename_native}.{output_format.extension()}")
-
-    if file_precheck and path.is_file():
+    if file_precheck and is_up_to_date(target_directory, filename_native, output_format, gateset.gates):
         return True
 
-    if gateset.name == "clifford+t":
-        from qiskit.transpiler import PassManager  # noqa: PLC0415
-        from qiskit.transpiler.passes.synthesis import SolovayKitaev  # noqa: PLC0415
-
-        # Transpile the circuit to single- and two-qubit gates including rotations
-        compiled_for_sk = transpile(
-            qc,
-            basis_gates=[*gateset.gates, "rx", "ry", "rz"],
-            optimization_level=opt_level,
-            seed_transpiler=10,
-        )
-        # Synthesize the rotations to Clifford+T gates
-        # Measurements are removed and added back after the synthesis to avoid errors in the Solovay-Kitaev pass
-        pm = PassManager(SolovayKitaev())
-        new_qc = pm.run(compiled_for_sk.remove_final_measurements(inplace=False))
-        new_qc.measure_all()
-        # Transpile once more to remove unnecessary gates and optimize the circuit
-        compiled = transpile(
-            new_qc,
-            basis_gates=gateset.gates,
-            optimization_level=opt_level,
-            seed_transpiler=10,
-        )
-    else:
-        compiled = transpile(qc, basis_gates=gateset.gates, optimization_level=opt_level, seed_transpiler=10)
+    compiled = _compile_cached(
+        qc,
+        "nativegates",
+        lambda: _compile_native_gates(qc, gateset, opt_level, synthesis_jobs),
+        gateset=gateset,
+        opt_level=opt_level,
+    )
 
     if return_qc:
         return compiled
@@ -366,7 +371,7 @@ def get_mapped_level(
         num_qubits: number of qubits
         device: target device
         opt_level: optimization level
-        file_precheck: flag indicating whether to check whether the file already exists before creating it (again)
+        file_precheck: flag indicating whether to skip the file if the manifest of the target directory lists it as up to date
         return_qc: flag if the actual circuit shall be returned
         target_directory: alternative directory to the default one to store the created circuit
         target_filename: alternative filename to the default one
@@ -379,18 +384,12 @@ def get_mapped_level(
     filename_mapped = target_filename or generate_filename(
         benchmark_name=qc.name, level="mapped", num_qubits=num_qubits, device=device, opt_level=opt_level
     )
-    path = Path(target_directory, f"{filename_mapped}.{output_format.extension()}")
-
-    if file_precheck and path.is_file():
+    c_map = device.coupling_map
+    if file_precheck and is_up_to_date(target_directory, filename_mapped, output_format, device.gateset.gates, c_map):
         return True
 
-    c_map = device.coupling_map
-    compiled = transpile(
-        qc,
-        optimization_level=opt_level,
-        basis_gates=device.gateset.gates,
-        coupling_map=c_map,
-        seed_transpiler=10,
+    compiled = _compile_cached(
+        qc, "mapped", lambda: _compile_mapped(qc, device, opt_level), device=device, opt_level=opt_level
     )
 
     if return_qc:
@@ -414,7 +413,10 @@ def get_benchmark(
     compiler_settings: CompilerSettings | None = None,
     gateset: str | Gateset = "ibm_falcon",
     device_name: str = "ibm_washington",
-    **kwargs: str,
+    gate_budget: int | None = DEFAULT_GATE_BUDGET,
+    timeout_s: float | None = None,
+    max_memory_mb: int | None = None,
+    **kwargs: Unpack[BenchmarkOptions],
 ) -> QuantumCircuit:
     """Returns one benchmark as a qiskit.QuantumCircuit object.
 
@@ -422,55 +424,61 @@ def get_benchmark(
         benchmark_name: name of the to be generated benchmark
         level: Choice of level, either as a string ("alg", "indep", "nativegates" or "mapped") or as a number between 0-3 where 0 corresponds to "alg" level and 3 to "mapped" level
         circuit_size: Input for the benchmark creation, in most cases this is equal to the qubit number
-        benchmark_instance_name: Input selection for some benchmarks, namely "shor"
+        benchmark_instance_name: Input selection for some benchmarks, namely "shor" (e.g., "xsmall" or "<N>_<a>")
         compiler_settings: Data class containing the respective compiler settings for the specified compiler (e.g., optimization level for Qiskit)
         gateset: Name of the gateset or tuple containing the name of the gateset and the gateset itself (required for "nativegates" level)
         device_name: "ibm_washington", "ibm_montreal", "rigetti_aspen_m3", "ionq_harmony", "ionq_aria1", "oqc_lucy", "quantinuum_h2" (required for "mapped" level)
-        kwargs: Additional arguments for the benchmark generation
+        gate_budget: Maximum estimated number of gates of the benchmark (see `estimate_resources`) or None to disable the check
+        timeout_s: Maximum wall-clock time in seconds, if set the benchmark is generated in a supervised subprocess
+        max_memory_mb: Maximum memory in MiB (Unix only), if set the benchmark is generated in a supervised subprocess
+        kwargs: Additional arguments for the benchmark generation, e.g., the number ``N`` to be factorized and
+            optionally the integer ``a`` for "shor" instead of a benchmark_instance_name, ``use_for_loop`` for
+            "grover" and "qwalk" or the ``graph`` model (with ``edge_probability`` or ``degree``) for "qaoa" (see
+            `BenchmarkOptions`)
 
     Returns:
         Qiskit::QuantumCircuit object representing the benchmark with the selected options
-    """
-    if benchmark_name not in get_supported_benchmarks():
-        msg = f"Selected benchmark is not supported. Valid benchmarks are {get_supported_benchmarks()}."
-        raise ValueError(msg)
 
+    Raises:
+        GenerationLimitError: if the generation in the supervised subprocess exceeds one of the limits or fails
+    """
     if level not in get_supported_levels():
         msg = f"Selected level must be in {get_supported_levels()}."
         raise ValueError(msg)
 
-    if benchmark_name != "shor" and not (isinstance(circuit_size, int) and circuit_size > 0):
-        msg = "circuit_size must be None or int for this benchmark."
-        raise ValueError(msg)
-
-    if benchmark_name == "shor" and not isinstance(benchmark_instance_name, str):
-        msg = "benchmark_instance_name must be defined for this benchmark."
-        raise ValueError(msg)
-
-    lib = get_module_for_benchmark(
-        benchmark_name.split("-")[0]
-    )  # split is used to filter the ancillary mode for grover and qwalk
-
-    if "grover" in benchmark_name or "qwalk" in benchmark_name:
-        if "noancilla" in benchmark_name:
-            anc_mode = "noancilla"
-        elif "v-chain" in benchmark_name:
-            anc_mode = "v-chain"
-        else:
-            msg = "Either `noancilla` or `v-chain` must be specified for ancillary mode of Grover and QWalk benchmarks."
+    if benchmark_name == "shor" and "N" in kwargs:
+        if benchmark_instance_name is not None:
+            msg = "Either benchmark_instance_name or N can be specified for shor, but not both."
             raise ValueError(msg)
+        benchmark_instance_name = get_module_for_benchmark("shor").instance_name(kwargs.pop("N"), kwargs.pop("a", None))
+
+    _validate_benchmark(benchmark_name, circuit_size, benchmark_instance_name)
+    check_gate_budget(benchmark_name, circuit_size, benchmark_instance_name, gate_budget, **kwargs)
+
+    if timeout_s is not None or max_memory_mb is not None:
+        result = run_with_limits(
+            get_benchmark,
+            (benchmark_name, level, circuit_size, benchmark_instance_name, compiler_settings, gateset, device_name),
+            {"gate_budget": None, **kwargs},
+            timeout_s=timeout_s,
+            max_memory_mb=max_memory_mb,
+        )
+        if isinstance(result, GenerationFailure):
+            raise GenerationLimitError(result)
+        return result
 
-        qc = lib.create_circuit(circuit_size, ancillary_mode=anc_mode)
-
-    elif benchmark_name == "shor":
-        to_be_factored_number, a_value = lib.get_instance(benchmark_instance_name)
-        qc = lib.create_circuit(to_be_factored_number, a_value)
-
-    else:
-        qc = lib.create_circuit(circuit_size)
+    benchmark = {
+        "benchmark_name": benchmark_name,
+        "circuit_size": circuit_size,
+        "instance": benchmark_instance_name,
+        **kwargs,
+    }
 
     if level in ("alg", 0):
-        return qc
+        return _get_cached(
+            {**benchmark, "level": "alg"},
+            lambda: create_circuit(benchmark_name, circuit_size, benchmark_instance_name, **kwargs),
+        )
 
     if compiler_settings is None:
         compiler_settings = CompilerSettings(QiskitSettings())
@@ -480,15 +488,24 @@ def get_benchmark(
 
     independent_level = 1
     if level in ("indep", independent_level):
-        return get_indep_level(qc, circuit_size, False, True)
+        return _get_cached(
+            {**benchmark, "level": "indep"},
+            lambda: _compile_indep(create_circuit(benchmark_name, circuit_size, benchmark_instance_name, **kwargs)),
+        )
 
     native_gates_level = 2
     if level in ("nativegates", native_gates_level):
-        if isinstance(gateset, str):
-            gateset = get_native_gateset_by_name(gateset)
+        resolved_gateset = get_native_gateset_by_name(gateset) if isinstance(gateset, str) else gateset
         assert compiler_settings.qiskit is not None
         opt_level = compiler_settings.qiskit.optimization_level
-        return get_native_gates_level(qc, gateset, circuit_size, opt_level, False, True)
+        return _get_cached(
+            {**benchmark, "level": "nativegates", "gateset": resolved_gateset, "opt_level": opt_level},
+            lambda: _compile_native_gates(
+                create_circuit(benchmark_name, circuit_size, benchmark_instance_name, **kwargs),
+                resolved_gateset,
+                opt_level,
+            ),
+        )
 
     if device_name not in get_available_device_names():
         msg = f"Selected device_name must be in {get_available_device_names()}."
@@ -500,44 +517,203 @@ def get_benchmark(
         assert compiler_settings.qiskit is not None
         opt_level = compiler_settings.qiskit.optimization_level
         assert isinstance(opt_level, int)
-        return get_mapped_level(
-            qc,
-            circuit_size,
-            device,
-            opt_level,
-            False,
-            True,
+        return _get_cached(
+            {**benchmark, "level": "mapped", "device": device, "opt_level": opt_level},
+            lambda: _compile_mapped(
+                create_circuit(benchmark_name, circuit_size, benchmark_instance_name, **kwargs), device, opt_level
+            ),
         )
 
     msg = f"Invalid level specified. Must be in {get_supported_levels()}."
     raise ValueError(msg)
 
 
+def get_all_levels(
+    benchmark_name: str,
+    circuit_size: int | None = None,
+    benchmark_instance_name: str | None = None,
+    compiler_settings: CompilerSettings | None = None,
+    gateset: str | Gateset = "ibm_falcon",
+    device_name: str = "ibm_washington",
+) -> dict[str, QuantumCircuit]:
+    """Returns one benchmark on all abstraction levels, where each level is compiled from the previous one.
+
+    The algorithm-level circuit is created once and its high-level building blocks are synthesized only once when
+    compiling it to the target-independent level. The native gates level is compiled from the target-independent
+    circuit and the mapped level from the native gates circuit if the device uses the selected gateset (otherwise, from
+    the target-independent circuit). Hence, the resulting circuits may differ slightly from the ones returned by
+    `get_benchmark`, which compiles every level from the algorithm level.
+
+    Arguments:
+        benchmark_name: name of the to be generated benchmark
+        circuit_size: Input for the benchmark creation, in most cases this is equal to the qubit number
+        benchmark_instance_name: Input selection for some benchmarks, namely "shor" (e.g., "xsmall" or "<N>_<a>")
+        compiler_settings: Data class containing the respective compiler settings for the specified compiler (e.g., optimization level for Qiskit)
+        gateset: Name of the gateset or the gateset itself used for the "nativegates" level
+        device_name: name of the device used for the "mapped" level
+
+    Returns:
+        the circuits keyed by their level ("alg", "indep", "nativegates" and "mapped")
+    """
+    _validate_benchmark(benchmark_name, circuit_size, benchmark_instance_name)
+
+    if compiler_settings is None:
+        compiler_settings = CompilerSettings(QiskitSettings())
+    elif not isinstance(compiler_settings, CompilerSettings):
+        msg = "compiler_settings must be of type CompilerSettings or None."  # type: ignore[unreachable]
+        raise ValueError(msg)
+    assert compiler_settings.qiskit is not None
+    opt_level = compiler_settings.qiskit.optimization_level
+
+    resolved_gateset = get_native_gateset_by_name(gateset) if isinstance(gateset, str) else gateset
+    if device_name not in get_available_device_names():
+        msg = f"Selected device_name must be in {get_available_device_names()}."
+        raise ValueError(msg)
+    device = get_device_by_name(device_name)
+
+    benchmark = {"benchmark_name": benchmark_name, "circuit_size": circuit_size, "instance": benchmark_instance_name}
+    alg = _get_cached(
+        {**benchmark, "level": "alg"},
+        lambda: create_circuit(benchmark_name, circuit_size, benchmark_instance_name),
+    )
+    indep = _compile_cached(alg, "indep", lambda: _compile_indep(alg))
+    native_gates = _compile_cached(
+        indep,
+        "nativegates",
+        lambda: _compile_native_gates(indep, resolved_gateset, opt_level),
+        gateset=resolved_gateset,
+        opt_level=opt_level,
+    )
+    mapping_input = native_gates if device.gateset.name == resolved_gateset.name else indep
+    mapped = _compile_cached(
+        mapping_input,
+        "mapped",
+        lambda: _compile_mapped(mapping_input, device, opt_level),
+        device=device,
+        opt_level=opt_level,
+    )
+
+    return {"alg": alg, "indep": indep, "nativegates": native_gates, "mapped": mapped}
+
+
+def _validate_benchmark(benchmark_name: str, circuit_size: int | None, benchmark_instance_name: str | None) -> None:
+    """Checks that the benchmark exists and that its size or instance is specified as required."""
+    spec, _ = get_benchmark_spec(benchmark_name)
+
+    if not spec.selected_by_instance and not (isinstance(circuit_size, int) and circuit_size > 0):
+        msg = "circuit_size must be None or int for this benchmark."
+        raise ValueError(msg)
+
+    if spec.selected_by_instance:
+        if not isinstance(benchmark_instance_name, str):
+            msg = "benchmark_instance_name must be defined for this benchmark."
+            raise ValueError(msg)
+        spec.parse_instance(benchmark_instance_name)  # raises for invalid instances
+
+
+def _compile_indep(qc: QuantumCircuit) -> QuantumCircuit:
+    """Compiles a circuit to the target-independent level."""
+    return get_pass_manager(get_openqasm_gates(), optimization_level=1).run(expand_multi_controlled_gates(qc))
+
+
+def _compile_native_gates(
+    qc: QuantumCircuit, gateset: Gateset, opt_level: int, synthesis_jobs: int | None = None
+) -> QuantumCircuit:
+    """Compiles a circuit to the native gates of a gateset."""
+    return compile_circuits([qc], gateset, opt_level, synthesis_jobs)[0]
+
+
+def _compile_mapped(qc: QuantumCircuit, device: Device, opt_level: int) -> QuantumCircuit:
+    """Compiles and maps a circuit to a device."""
+    return compile_circuits([qc], device, opt_level)[0]
+
+
+def _get_cached(key_parts: dict[str, object], compute: Callable[[], QuantumCircuit]) -> QuantumCircuit:
+    """Returns the circuit from the circuit cache or computes and stores it if it is not cached (yet).
+
+    Arguments:
+        key_parts: everything that determines the circuit
+        compute: function computing the circuit in case of a cache miss
+
+    Returns:
+        the cached or computed circuit
+    """
+    cache = get_cache()
+    if cache is None:
+        return compute()
+
+    key = cache.make_key(**_serializable_key_parts(key_parts), seed_transpiler=SEED_TRANSPILER)
+    qc = cache.get(key)
+    if qc is None:
+        qc = compute()
+        cache.put(key, qc)
+    return qc
+
+
+def _compile_cached(
+    qc: QuantumCircuit,
+    level: str,
+    compile_circuit: Callable[[], QuantumCircuit],
+    **target: object,
+) -> QuantumCircuit:
+    """Compiles a circuit with the given function unless the result is already cached.
+
+    Arguments:
+        qc: circuit to compile
+        level: abstraction level the circuit is compiled to
+        compile_circuit: function compiling the circuit in case of a cache miss
+        target: gateset or device and optimization level the circuit is compiled for
+
+    Returns:
+        the compiled circuit
+    """
+    if get_cache() is None:
+        return compile_circuit()
+    return _get_cached({"circuit": circuit_fingerprint(qc), "level": level, **target}, compile_circuit)
+
+
+def _serializable_key_parts(key_parts: dict[str, object]) -> dict[str, object]:
+    """Replaces gatesets and devices in cache key parts by the information that determines the compilation.
+
+    The gates and the edges of the coupling map are sorted, since their order may differ between processes, e.g., for
+    the gates of IBM devices, which Qiskit provides as a set.
+    """
+    serializable: dict[str, object] = {}
+    for name, value in key_parts.items():
+        if isinstance(value, Gateset):
+            serializable[name] = [value.name, sorted(value.gates)]
+        elif isinstance(value, Device):
+            edges = sorted(tuple(edge) for edge in value.coupling_map)
+            serializable[name] = [value.name, sorted(value.gateset.gates), edges]
+        else:
+            serializable[name] = value
+    return serializable
+
+
+def create_circuit(
+    benchmark_name: str,
+    circuit_size: int | None,
+    benchmark_instance_name: str | None = None,
+    **kwargs: Unpack[BenchmarkOptions],
+) -> QuantumCircuit:
+    """Creates the algorithm-level circuit of a benchmark.
+
+    Arguments:
+        benchmark_name: name of the benchmark (including the ancillary mode for grover and qwalk)
+        circuit_size: input for the benchmark creation, in most cases this is equal to the qubit number
+        benchmark_instance_name: input selection for some benchmarks, namely "shor"
+        kwargs: additional arguments passed on to the ``create_circuit`` function of the benchmark
+
+    Returns:
+        the quantum circuit on the algorithm level
+    """
+    spec, ancillary_mode = get_benchmark_spec(benchmark_name)
+    return spec.create_circuit(circuit_size, benchmark_instance_name, ancillary_mode, **kwargs)
+
+
 def get_supported_benchmarks() -> list[str]:
-    """Returns a list of all supported benchmarks."""
-    return [
-        "ae",
-        "bv",
-        "dj",
-        "grover-noancilla",
-        "grover-v-chain",
-        "ghz",
-        "graphstate",
-        "qaoa",
-        "qft",
-        "qftentangled",
-        "qnn",
-        "qpeexact",
-        "qpeinexact",
-        "qwalk-noancilla",
-        "qwalk-v-chain",
-        "randomcircuit",
-        "vqerealamprandom",
-        "vqesu2random",
-        "vqetwolocalrandom",
-        "wstate",
-        "shor",
-    ]
+    """Returns a list of all supported benchmarks, i.e., the built-in and registered ones (see `mqt.bench.registry`)."""
+    return get_supported_benchmark_names()
 
 
 def get_supported_levels() -> list[str | int]:
@@ -595,5 +771,8 @@ def get_openqasm_gates() -> list[str]:
 
 
 def get_module_for_benchmark(benchmark_name: str) -> ModuleType:
-    """Returns the module for a specific benchmark."""
-    return import_module("mqt.bench.benchmarks." + benchmark_name)
+    """Returns the module for a specific benchmark (without ancillary mode), i.e., the module of its factory."""
+    spec = get_spec(benchmark_name)
+    if spec is None or not isinstance(spec.factory, str):
+        return import_module("mqt.bench.benchmarks." + benchmark_name)
+    return import_module(spec.factory.partition(":")[0])
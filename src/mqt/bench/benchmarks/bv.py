@@ -12,6 +12,8 @@ from __future__ import annotations
 
 from qiskit import QuantumCircuit
 
+from mqt.bench.bulk import STANDARD_GATES, append_measurements, append_resets, append_standard_gates
+
 
 def create_circuit(num_qubits: int, dynamic: bool = False, hidden_string: str | None = None) -> QuantumCircuit:
     """Create a quantum circuit for the Bernstein-Vazirani algorithm.
@@ -35,47 +37,47 @@ def create_circuit(num_qubits: int, dynamic: bool = False, hidden_string: str |
 
     # Create a quantum circuit: num_qubits (flag + inputs) and num_qubits - 1 classical bits
     circuit = QuantumCircuit(num_qubits, num_qubits - 1)
+    qubits, clbits = circuit.qubits, circuit.clbits
+    ones = [i for i, bit in enumerate(hidden_string) if bit == "1"]
 
     # Prepare the flag qubit in the |1⟩ state
-    circuit.x(0)
+    append_standard_gates(circuit, STANDARD_GATES["x"], [(qubits[0],)])
 
     if dynamic:
         # Dynamic layout: process one input qubit at a time
+        flag, work = qubits[0], qubits[1]
+        ones_set = set(ones)
         for i in range(num_qubits - 1):
             # Apply Hadamard to the working qubit
-            circuit.h(1)
+            append_standard_gates(circuit, STANDARD_GATES["h"], [(work,)])
 
             # Apply controlled-Z based on the hidden bitstring
-            if hidden_string[i] == "1":
-                circuit.cz(1, 0)
+            if i in ones_set:
+                append_standard_gates(circuit, STANDARD_GATES["cz"], [(work, flag)])
 
             # Apply Hadamard to the working qubit again
-            circuit.h(1)
+            append_standard_gates(circuit, STANDARD_GATES["h"], [(work,)])
 
             # Measure the working qubit
-            circuit.measure(1, i)
+            append_measurements(circuit, [(work, clbits[i])])
 
             # Reset the working qubit if more rounds are needed
             if i < num_qubits - 2:
-                circuit.reset(1)
+                append_resets(circuit, [work])
     else:
         # Static layout: process all input qubits at once
+        inputs = [(qubit,) for qubit in qubits[1:]]
         # Apply Hadamard to all input qubits
-        for i in range(1, num_qubits):
-            circuit.h(i)
+        append_standard_gates(circuit, STANDARD_GATES["h"], inputs)
 
         # Apply controlled-Z gates based on the hidden bitstring
-        for i in range(1, num_qubits):
-            if hidden_string[i - 1] == "1":
-                circuit.cz(i, 0)
+        append_standard_gates(circuit, STANDARD_GATES["cz"], [(qubits[i + 1], qubits[0]) for i in ones])
 
         # Apply Hadamard to all input qubits again
-        for i in range(1, num_qubits):
-            circuit.h(i)
+        append_standard_gates(circuit, STANDARD_GATES["h"], inputs)
 
         # Measure all input qubits
-        for i in range(1, num_qubits):
-            circuit.measure(i, i - 1)
+        append_measurements(circuit, zip(qubits[1:], clbits))
     circuit.name = "bv"
 
     return circuit
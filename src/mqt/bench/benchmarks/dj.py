@@ -10,61 +10,68 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 from qiskit import QuantumCircuit
 
+from mqt.bench.bulk import STANDARD_GATES, append_measurements, append_standard_gates
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from qiskit.circuit import Gate
 
-def dj_oracle(case: str, n: int) -> QuantumCircuit:
+
+def dj_oracle(case: str, n: int) -> Gate:
     """Returns a quantum circuit implementing the Deutsch-Josza oracle."""
     # plus one output qubit
     oracle_qc = QuantumCircuit(n + 1)
-    rng = np.random.default_rng(10)
+    _append_oracle(oracle_qc, case, n)
 
-    if case == "balanced":
-        b_str = ""
-        for _ in range(n):
-            b = rng.integers(0, 2)
-            b_str = b_str + str(b)
+    oracle_gate = oracle_qc.to_gate()
+    oracle_gate.name = "Oracle"  # To show when we display the circuit
+    return oracle_gate
 
-        for qubit in range(len(b_str)):
-            if b_str[qubit] == "1":
-                oracle_qc.x(qubit)
 
-        for qubit in range(n):
-            oracle_qc.cx(qubit, n)
+def _append_oracle(qc: QuantumCircuit, case: str, n: int) -> None:
+    """Appends the gates of the Deutsch-Josza oracle to the first n + 1 qubits of the circuit."""
+    qubits = qc.qubits
+    rng = np.random.default_rng(10)
 
-        for qubit in range(len(b_str)):
-            if b_str[qubit] == "1":
-                oracle_qc.x(qubit)
+    if case == "balanced":
+        flipped = [(qubits[qubit],) for qubit in np.flatnonzero(rng.integers(0, 2, size=n)).tolist()]
+        append_standard_gates(qc, STANDARD_GATES["x"], flipped)
+        append_standard_gates(qc, STANDARD_GATES["cx"], [(qubit, qubits[n]) for qubit in qubits[:n]])
+        append_standard_gates(qc, STANDARD_GATES["x"], flipped)
 
     if case == "constant":
         output = rng.integers(2)
         if output == 1:
-            oracle_qc.x(n)
-
-    oracle_gate = oracle_qc.to_gate()
-    oracle_gate.name = "Oracle"  # To show when we display the circuit
-    return oracle_gate
+            append_standard_gates(qc, STANDARD_GATES["x"], [(qubits[n],)])
 
 
-def dj_algorithm(oracle: QuantumCircuit, n: int) -> QuantumCircuit:
+def dj_algorithm(oracle: Gate, n: int) -> QuantumCircuit:
     """Returns a quantum circuit implementing the Deutsch-Josza algorithm."""
-    dj_circuit = QuantumCircuit(n + 1, n)
+    return _dj_circuit(n, lambda dj_circuit: dj_circuit.append(oracle, range(n + 1)))
+
 
-    dj_circuit.x(n)
-    dj_circuit.h(n)
+def _dj_circuit(n: int, append_oracle: Callable[[QuantumCircuit], object]) -> QuantumCircuit:
+    """Returns the Deutsch-Josza circuit, whose oracle is appended by the given function."""
+    dj_circuit = QuantumCircuit(n + 1, n)
+    qubits = dj_circuit.qubits
+    inputs = [(qubit,) for qubit in qubits[:n]]
 
-    for qubit in range(n):
-        dj_circuit.h(qubit)
+    append_standard_gates(dj_circuit, STANDARD_GATES["x"], [(qubits[n],)])
+    append_standard_gates(dj_circuit, STANDARD_GATES["h"], [(qubits[n],)])
+    append_standard_gates(dj_circuit, STANDARD_GATES["h"], inputs)
 
-    dj_circuit.append(oracle, range(n + 1))
+    append_oracle(dj_circuit)
 
-    for qubit in range(n):
-        dj_circuit.h(qubit)
+    append_standard_gates(dj_circuit, STANDARD_GATES["h"], inputs)
 
     dj_circuit.barrier()
-    for i in range(n):
-        dj_circuit.measure(i, i)
+    append_measurements(dj_circuit, zip(qubits[:n], dj_circuit.clbits))
 
     return dj_circuit
 
@@ -72,14 +79,16 @@ def dj_algorithm(oracle: QuantumCircuit, n: int) -> QuantumCircuit:
 def create_circuit(num_qubits: int, balanced: bool = True) -> QuantumCircuit:
     """Returns a quantum circuit implementing the Deutsch-Josza algorithm.
 
+    The gates of the oracle are part of the circuit instead of being wrapped into a gate (see `dj_oracle`), so that
+    they do not have to be decomposed by the compilation.
+
     Arguments:
         num_qubits: number of qubits of the returned quantum circuit
         balanced: True for a balanced and False for a constant oracle
     """
     oracle_mode = "balanced" if balanced else "constant"
     num_qubits = num_qubits - 1  # because of ancilla qubit
-    oracle_gate = dj_oracle(oracle_mode, num_qubits)
-    qc = dj_algorithm(oracle_gate, num_qubits)
+    qc = _dj_circuit(num_qubits, lambda dj_circuit: _append_oracle(dj_circuit, oracle_mode, num_qubits))
     qc.name = "dj"
 
     return qc
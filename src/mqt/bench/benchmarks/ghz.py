@@ -12,6 +12,8 @@ from __future__ import annotations
 
 from qiskit import QuantumCircuit, QuantumRegister
 
+from mqt.bench.bulk import STANDARD_GATES, append_standard_gates, measure_all
+
 
 def create_circuit(num_qubits: int) -> QuantumCircuit:
     """Returns a quantum circuit implementing the GHZ state.
@@ -21,9 +23,9 @@ def create_circuit(num_qubits: int) -> QuantumCircuit:
     """
     q = QuantumRegister(num_qubits, "q")
     qc = QuantumCircuit(q, name="ghz")
-    qc.h(q[-1])
-    for i in range(1, num_qubits):
-        qc.cx(q[num_qubits - i], q[num_qubits - i - 1])
-    qc.measure_all()
+    append_standard_gates(qc, STANDARD_GATES["h"], [(q[-1],)])
+    # CX gates from the last to the first qubit
+    append_standard_gates(qc, STANDARD_GATES["cx"], zip(q[:0:-1], q[-2::-1]))
+    measure_all(qc)
 
     return qc
@@ -10,23 +10,109 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import networkx as nx
 from qiskit import QuantumCircuit, QuantumRegister
-from qiskit.circuit.library import GraphState
+
+from mqt.bench.bulk import STANDARD_GATES, append_standard_gates
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
 
 
-def create_circuit(num_qubits: int, degree: int = 2) -> QuantumCircuit:
+def create_circuit(num_qubits: int, degree: int = 2, color_edges: bool = False) -> QuantumCircuit:
     """Returns a quantum circuit implementing a graph state.
 
+    The circuit is built directly from the edges of the graph (a Hadamard gate per node and a CZ gate per edge) and is
+    equivalent to Qiskit's ``GraphState`` of the adjacency matrix.
+
     Arguments:
         num_qubits: number of qubits of the returned quantum circuit
         degree: number of edges per node
+        color_edges: whether the CZ gates are ordered by an edge coloring of the graph, which groups them into at most
+            ``degree + 1`` layers of parallel gates, instead of ordering them lexicographically
     """
     q = QuantumRegister(num_qubits, "q")
     qc = QuantumCircuit(q, name="graphstate")
 
     g = nx.random_regular_graph(degree, num_qubits)
-    a = nx.convert_matrix.to_numpy_array(g)
-    qc.compose(GraphState(a), inplace=True)
+    edges = sorted((min(edge), max(edge)) for edge in g.edges)
+    if color_edges:
+        colors = get_edge_coloring(edges, num_qubits)
+        edges = [edge for _, edge in sorted(zip(colors, edges))]
+
+    append_standard_gates(qc, STANDARD_GATES["h"], [(qubit,) for qubit in q])
+    append_standard_gates(qc, STANDARD_GATES["cz"], [(q[i], q[j]) for i, j in edges])
     qc.measure_all()
-    return qc.decompose(gates_to_decompose="graph_state")
+    return qc
+
+
+def get_edge_coloring(edges: Sequence[tuple[int, int]], num_nodes: int) -> list[int]:
+    """Colors the edges of a graph such that edges sharing a node have different colors (Misra-Gries algorithm).
+
+    At most one color more than the maximum degree of the graph is used, which is at most one more than optimal.
+
+    Arguments:
+        edges: edges of the graph
+        num_nodes: number of nodes of the graph
+
+    Returns:
+        the colors (starting at 0) of the edges in the order of the input edges
+    """
+    # colors of the edges incident to each node, mapped to the respective neighbor
+    incident: list[dict[int, int]] = [{} for _ in range(num_nodes)]
+    edge_colors: dict[tuple[int, int], int] = {}
+
+    def free_color(node: int) -> int:
+        color = 0
+        while color in incident[node]:
+            color += 1
+        return color
+
+    def set_color(node1: int, node2: int, color: int) -> None:
+        incident[node1][color] = node2
+        incident[node2][color] = node1
+        edge_colors[min(node1, node2), max(node1, node2)] = color
+
+    def remove_color(node1: int, node2: int) -> int:
+        color = edge_colors.pop((min(node1, node2), max(node1, node2)))
+        del incident[node1][color]
+        del incident[node2][color]
+        return color
+
+    for u, v in edges:
+        # maximal fan of u starting at v, i.e., the color of each edge (u, fan[k + 1]) is free on fan[k]
+        fan = [v]
+        in_fan = {v}
+        extended = True
+        while extended:
+            extended = False
+            for color, neighbor in incident[u].items():
+                if neighbor not in in_fan and color not in incident[fan[-1]]:
+                    fan.append(neighbor)
+                    in_fan.add(neighbor)
+                    extended = True
+                    break
+
+        # invert the path alternating between the colors d and c that starts at u, so that d becomes free on u
+        c = free_color(u)
+        d = free_color(fan[-1])
+        if c != d:
+            path = []
+            node, color = u, d
+            while color in incident[node]:
+                neighbor = incident[node][color]
+                path.append((node, neighbor))
+                node, color = neighbor, c if color == d else d
+            inverted = [(node1, node2, remove_color(node1, node2)) for node1, node2 in path]
+            for node1, node2, color in inverted:
+                set_color(node1, node2, c if color == d else d)
+
+        # rotate the fan up to the first node on which d is free and color the last edge with d
+        end = next(k for k, node in enumerate(fan) if d not in incident[node])
+        for k in range(end):
+            set_color(u, fan[k], remove_color(u, fan[k + 1]))
+        set_color(u, fan[end], d)
+
+    return [edge_colors[min(edge), max(edge)] for edge in edges]
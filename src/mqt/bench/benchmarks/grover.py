@@ -14,13 +14,17 @@ import numpy as np
 from qiskit import AncillaRegister, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import GroverOperator
 
+from mqt.bench.multi_controlled import get_mcp_gate
 
-def create_circuit(num_qubits: int, ancillary_mode: str = "noancilla") -> QuantumCircuit:
+
+def create_circuit(num_qubits: int, ancillary_mode: str = "noancilla", use_for_loop: bool = False) -> QuantumCircuit:
     """Returns a quantum circuit implementing Grover's algorithm.
 
     Arguments:
         num_qubits: number of qubits of the returned quantum circuit
         ancillary_mode: defining the decomposition scheme
+        use_for_loop: whether the Grover iterations are represented by a single iteration wrapped in a for loop
+            instead of being repeated
     """
     num_qubits = num_qubits - 1  # -1 because of the flag qubit
     q = QuantumRegister(num_qubits, "q")
@@ -31,7 +35,7 @@ def create_circuit(num_qubits: int, ancillary_mode: str = "noancilla") -> Quantu
     state_preparation.x(flag)
 
     oracle = QuantumCircuit(q, flag)
-    oracle.mcp(np.pi, q, flag)
+    oracle.append(get_mcp_gate(np.pi, num_qubits), [*q, *flag])
 
     operator = GroverOperator(oracle, mcx_mode=ancillary_mode)
     iterations = int(np.pi / 4 * np.sqrt(2**num_qubits))
@@ -43,7 +47,12 @@ def create_circuit(num_qubits: int, ancillary_mode: str = "noancilla") -> Quantu
     qc = QuantumCircuit(q2, flag, name="grover")
     qc.compose(state_preparation, inplace=True)
 
-    qc.compose(operator.power(iterations), inplace=True)
+    if use_for_loop:
+        body = QuantumCircuit(q2, flag)
+        body.compose(operator, inplace=True)
+        qc.for_loop(range(iterations), None, body, qc.qubits, [])
+    else:
+        qc.compose(operator.power(iterations), inplace=True)
     qc.measure_all()
     qc.name = qc.name + "-" + ancillary_mode
 
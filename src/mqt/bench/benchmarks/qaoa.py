@@ -10,17 +10,47 @@
 
 from __future__ import annotations
 
+import math
+from collections import deque
+from typing import TYPE_CHECKING
+
+import networkx as nx
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+from qiskit.transpiler import CouplingMap
+
+from mqt.bench.bulk import STANDARD_GATES, append_standard_gates
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+    from qiskit.circuit import ParameterExpression
 
+GRAPH_MODELS = ("dense", "erdos-renyi", "regular", "lattice", "heavy-hex")
 
-def create_circuit(num_qubits: int, repetitions: int = 2, seed: int = 42) -> QuantumCircuit:
+
+def create_circuit(
+    num_qubits: int,
+    repetitions: int = 2,
+    seed: int = 42,
+    graph: str = "dense",
+    edge_probability: float = 0.5,
+    degree: int = 3,
+    parameterized: bool = False,
+) -> QuantumCircuit:
     """Constructs a quantum circuit implementing QAOA for a Max-Cut example with random parameters.
 
     Arguments:
         num_qubits: Number of qubits in the circuit (equal to the number of graph nodes).
         repetitions: Number of QAOA layers (repetitions of the ansatz).
         seed: Random seed for reproducibility.
+        graph: Model of the Max-Cut graph (see `get_edges`).
+        edge_probability: Probability of each edge for the "erdos-renyi" model.
+        degree: Degree of the nodes for the "regular" model.
+        parameterized: Whether the angles are left as parameters "beta" and "gamma" (see `mqt.bench.bind`) instead of
+            random values.
 
     Returns:
         QuantumCircuit: Quantum circuit implementing QAOA.
@@ -28,32 +58,149 @@ def create_circuit(num_qubits: int, repetitions: int = 2, seed: int = 42) -> Qua
     # Set the random number generator
     rng = np.random.default_rng(seed)
 
-    # Example adjacency matrix for Max-Cut (toy problem)
-    adjacency_matrix = rng.integers(0, 2, size=(num_qubits, num_qubits))
-    adjacency_matrix = np.triu(adjacency_matrix, 1)  # Upper triangular part for undirected graph
+    # Edges of the Max-Cut graph (toy problem)
+    edges = get_edges(num_qubits, rng, graph, edge_probability, degree)
 
     # Random initialization of parameters
-    gamma_values = rng.uniform(0, np.pi, repetitions)
-    beta_values = rng.uniform(0, np.pi, repetitions)
+    gamma_values: Sequence[float | ParameterExpression]
+    beta_values: Sequence[float | ParameterExpression]
+    if parameterized:
+        gamma_values = ParameterVector("gamma", repetitions)
+        beta_values = ParameterVector("beta", repetitions)
+    else:
+        gamma_values = rng.uniform(0, np.pi, repetitions).tolist()
+        beta_values = rng.uniform(0, np.pi, repetitions).tolist()
 
     # Initialize QAOA circuit
     qc = QuantumCircuit(num_qubits)
+    qubits = [(qubit,) for qubit in qc.qubits]
+    edge_qubits = [(qc.qubits[i], qc.qubits[j]) for i, j in edges.tolist()]
 
     # Start in uniform superposition
-    qc.h(range(num_qubits))
+    append_standard_gates(qc, STANDARD_GATES["h"], qubits)
 
     # Define cost and mixer operators for each layer
     for layer in range(repetitions):
         # Cost Hamiltonian
-        for i in range(num_qubits):
-            for j in range(i + 1, num_qubits):
-                if adjacency_matrix[i, j] != 0:
-                    qc.rzz(2 * gamma_values[layer], i, j)
+        append_standard_gates(qc, STANDARD_GATES["rzz"], edge_qubits, (2 * gamma_values[layer],))
 
         # Mixer Hamiltonian
-        for i in range(num_qubits):
-            qc.rx(2 * beta_values[layer], i)
+        append_standard_gates(qc, STANDARD_GATES["rx"], qubits, (2 * beta_values[layer],))
 
     qc.name = "qaoa"
 
     return qc
+
+
+def get_edges(
+    num_nodes: int,
+    rng: np.random.Generator,
+    graph: str = "dense",
+    edge_probability: float = 0.5,
+    degree: int = 3,
+) -> NDArray[np.int64]:
+    """Generates the edges of a Max-Cut graph without materializing its adjacency matrix (except for "dense").
+
+    The models are:
+
+    - "dense": every edge is included with probability 1/2, drawn from a dense adjacency matrix (the original model)
+    - "erdos-renyi": every edge is included with probability ``edge_probability``
+    - "regular": uniformly random graph in which every node has ``degree`` neighbors
+    - "lattice": two-dimensional square lattice with ``isqrt(num_nodes)`` rows, filled row by row
+    - "heavy-hex": connected part of a generic heavy-hex lattice (the topology family of IBM devices), which is
+      device-independent, i.e., not the coupling map of any particular device and not aligned with its qubit indices
+
+    Arguments:
+        num_nodes: number of nodes of the graph
+        rng: random number generator, which is only used by the random models
+        graph: model of the graph
+        edge_probability: probability of each edge for the "erdos-renyi" model
+        degree: degree of the nodes for the "regular" model
+
+    Returns:
+        array of shape (number of edges, 2) containing the edges (i, j) with i < j in lexicographical order
+    """
+    if graph == "dense":
+        adjacency_matrix = np.triu(rng.integers(0, 2, size=(num_nodes, num_nodes)), 1)
+        edges = np.argwhere(adjacency_matrix)
+    elif graph == "erdos-renyi":
+        edges = _erdos_renyi_edges(num_nodes, edge_probability, rng)
+    elif graph == "regular":
+        if degree >= num_nodes or num_nodes * degree % 2:
+            msg = f"A {degree}-regular graph with {num_nodes} nodes does not exist."
+            raise ValueError(msg)
+        regular_graph = nx.random_regular_graph(degree, num_nodes, seed=int(rng.integers(2**32)))
+        edges = np.sort(np.array(regular_graph.edges, dtype=np.int64).reshape(-1, 2), axis=1)
+    elif graph == "lattice":
+        edges = _lattice_edges(num_nodes)
+    elif graph == "heavy-hex":
+        edges = _heavy_hex_edges(num_nodes)
+    else:
+        msg = f"Unknown graph model {graph}, choose one of {list(GRAPH_MODELS)}."
+        raise ValueError(msg)
+    edges = edges.astype(np.int64, copy=False).reshape(-1, 2)
+    return edges[np.lexsort((edges[:, 1], edges[:, 0]))]
+
+
+def _erdos_renyi_edges(num_nodes: int, edge_probability: float, rng: np.random.Generator) -> NDArray[np.int64]:
+    """Draws the number of edges and then as many distinct pairs of nodes, which is equivalent to drawing every edge."""
+    if not 0 <= edge_probability <= 1:
+        msg = "edge_probability must be between 0 and 1."
+        raise ValueError(msg)
+    num_pairs = num_nodes * (num_nodes - 1) // 2
+    num_edges = int(rng.binomial(num_pairs, edge_probability))
+    # for few edges, the sampling without replacement only keeps the drawn indices instead of permuting all pairs
+    indices = np.sort(rng.choice(num_pairs, size=num_edges, replace=False))
+
+    # index k corresponds to the pair (i, j) with row i starting at offset i * (2n - i - 1) / 2
+    def offset(i: NDArray[np.int64]) -> NDArray[np.int64]:
+        return i * (2 * num_nodes - i - 1) // 2
+
+    b = 2 * num_nodes - 1
+    rows = np.floor((b - np.sqrt(np.maximum(b * b - 8 * indices.astype(np.float64), 0))) / 2).astype(np.int64)
+    # correct rounding errors of the floating-point computation
+    rows += offset(rows + 1) <= indices
+    rows -= offset(rows) > indices
+    columns = indices - offset(rows) + rows + 1
+    return np.column_stack((rows, columns))
+
+
+def _lattice_edges(num_nodes: int) -> NDArray[np.int64]:
+    """Edges of the square lattice with ``isqrt(num_nodes)`` rows whose nodes are numbered row by row."""
+    num_columns = math.ceil(num_nodes / max(1, math.isqrt(num_nodes)))
+    nodes = np.arange(num_nodes)
+    horizontal = nodes[(nodes % num_columns != num_columns - 1) & (nodes + 1 < num_nodes)]
+    vertical = nodes[nodes + num_columns < num_nodes]
+    return np.concatenate((
+        np.column_stack((horizontal, horizontal + 1)),
+        np.column_stack((vertical, vertical + num_columns)),
+    ))
+
+
+def _heavy_hex_edges(num_nodes: int) -> NDArray[np.int64]:
+    """Edges of the first ``num_nodes`` nodes of the smallest heavy-hex lattice in breadth-first order from node 0.
+
+    The lattice is Qiskit's ``CouplingMap.from_heavy_hex`` of the smallest code distance with enough nodes, which is
+    independent of any device.
+    """
+    distance = 3
+    while (5 * distance**2 - 2 * distance - 1) // 2 < num_nodes:
+        distance += 2
+    lattice_edges = CouplingMap.from_heavy_hex(distance, bidirectional=False).get_edges()
+
+    neighbors: dict[int, list[int]] = {}
+    for i, j in lattice_edges:
+        neighbors.setdefault(i, []).append(j)
+        neighbors.setdefault(j, []).append(i)
+    labels = {0: 0}
+    queue = deque([0])
+    while queue and len(labels) < num_nodes:
+        for neighbor in sorted(neighbors[queue.popleft()]):
+            if neighbor not in labels and len(labels) < num_nodes:
+                labels[neighbor] = len(labels)
+                queue.append(neighbor)
+
+    edges = [
+        (min(labels[i], labels[j]), max(labels[i], labels[j])) for i, j in lattice_edges if i in labels and j in labels
+    ]
+    return np.array(edges, dtype=np.int64).reshape(-1, 2)
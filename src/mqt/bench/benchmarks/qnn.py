@@ -15,11 +15,13 @@ from qiskit import QuantumCircuit
 from qiskit.circuit.library import RealAmplitudes, ZZFeatureMap
 
 
-def create_circuit(num_qubits: int) -> QuantumCircuit:
+def create_circuit(num_qubits: int, parameterized: bool = False) -> QuantumCircuit:
     """Returns a quantum circuit implementing a Quantum Neural Network (QNN) with a ZZ FeatureMap and a RealAmplitudes ansatz.
 
     Arguments:
         num_qubits: number of qubits of the returned quantum circuit
+        parameterized: whether the parameters of the ansatz are left unbound (see `mqt.bench.bind`) instead of random
+            values, while the inputs of the feature map are bound in either case
     """
     feature_map = ZZFeatureMap(feature_dimension=num_qubits)
     ansatz = RealAmplitudes(num_qubits=num_qubits, reps=1)
@@ -27,8 +29,9 @@ def create_circuit(num_qubits: int) -> QuantumCircuit:
     qc = QuantumCircuit(num_qubits)
     feature_map = feature_map.assign_parameters([1 for _ in range(feature_map.num_parameters)])
 
-    rng = np.random.default_rng(10)
-    ansatz = ansatz.assign_parameters(rng.random(ansatz.num_parameters) * 2 * np.pi)
+    if not parameterized:
+        rng = np.random.default_rng(10)
+        ansatz = ansatz.assign_parameters(rng.random(ansatz.num_parameters) * 2 * np.pi)
     qc.compose(feature_map, inplace=True)
     qc.compose(ansatz, inplace=True)
 
@@ -12,12 +12,15 @@ from __future__ import annotations
 
 from qiskit import AncillaRegister, QuantumCircuit, QuantumRegister
 
+from mqt.bench.multi_controlled import append_mcx
+
 
 def create_circuit(
     num_qubits: int,
     ancillary_mode: str = "noancilla",
     depth: int = 3,
     coin_state_preparation: QuantumCircuit | None = None,
+    use_for_loop: bool = False,
 ) -> QuantumCircuit:
     """Returns a quantum circuit implementing the Quantum Walk algorithm.
 
@@ -26,6 +29,8 @@ def create_circuit(
         depth: number of quantum steps
         coin_state_preparation: optional quantum circuit for state preparation
         ancillary_mode: defining the decomposition scheme
+        use_for_loop: whether the quantum steps are represented by a single step wrapped in a for loop instead of
+            being repeated
 
     Returns:
         qc: a quantum circuit implementing the Quantum Walk algorithm
@@ -42,65 +47,43 @@ def create_circuit(
     if (ancillary_mode in ("v-chain", "v-chain-dirty")) and num_qubits > ancillary_cutoff_vchain:
         n_anc = num_qubits - 2
 
-    if n_anc == 0:
-        qc = QuantumCircuit(node, coin, name="qwalk")
-
-        # coin state preparation
-        if coin_state_preparation is not None:
-            qc.append(coin_state_preparation, coin[:])
-
-        for _ in range(depth):
-            # Hadamard coin operator
-            qc.h(coin)
-
-            # controlled increment
-            for i in range(num_qubits - 1):
-                qc.mcx(coin[:] + node[i + 1 :], node[i], mode=ancillary_mode)
-            qc.cx(coin, node[num_qubits - 1])
-
-            # controlled decrement
-            qc.x(coin)
-            qc.x(node[1:])
-            for i in range(num_qubits - 1):
-                qc.mcx(coin[:] + node[i + 1 :], node[i], mode=ancillary_mode)
-            qc.cx(coin, node[num_qubits - 1])
-            qc.x(node[1:])
-            qc.x(coin)
-    else:
+    registers = [node, coin]
+    ancilla_qubits = None
+    if n_anc > 0:
         anc = AncillaRegister(n_anc, "anc")
-        qc = QuantumCircuit(node, coin, anc, name="qwalk")
-
-        # coin state preparation
-        if coin_state_preparation is not None:
-            qc.append(coin_state_preparation, coin[:])
-
+        registers.append(anc)
+        ancilla_qubits = anc[:]
+    qc = QuantumCircuit(*registers, name="qwalk")
+
+    # coin state preparation
+    if coin_state_preparation is not None:
+        qc.append(coin_state_preparation, coin[:])
+
+    # a single quantum step, which is built once and repeated depth times
+    step = QuantumCircuit(*registers)
+
+    # Hadamard coin operator
+    step.h(coin)
+
+    # controlled increment
+    for i in range(num_qubits - 1):
+        append_mcx(step, coin[:] + node[i + 1 :], node[i], mode=ancillary_mode, ancilla_qubits=ancilla_qubits)
+    step.cx(coin, node[num_qubits - 1])
+
+    # controlled decrement
+    step.x(coin)
+    step.x(node[1:])
+    for i in range(num_qubits - 1):
+        append_mcx(step, coin[:] + node[i + 1 :], node[i], mode=ancillary_mode, ancilla_qubits=ancilla_qubits)
+    step.cx(coin, node[num_qubits - 1])
+    step.x(node[1:])
+    step.x(coin)
+
+    if use_for_loop:
+        qc.for_loop(range(depth), None, step, qc.qubits, [])
+    else:
         for _ in range(depth):
-            # Hadamard coin operator
-            qc.h(coin)
-
-            # controlled increment
-            for i in range(num_qubits - 1):
-                qc.mcx(
-                    coin[:] + node[i + 1 :],
-                    node[i],
-                    mode=ancillary_mode,
-                    ancilla_qubits=anc[:],
-                )
-            qc.cx(coin, node[num_qubits - 1])
-
-            # controlled decrement
-            qc.x(coin)
-            qc.x(node[1:])
-            for i in range(num_qubits - 1):
-                qc.mcx(
-                    coin[:] + node[i + 1 :],
-                    node[i],
-                    mode=ancillary_mode,
-                    ancilla_qubits=anc[:],
-                )
-            qc.cx(coin, node[num_qubits - 1])
-            qc.x(node[1:])
-            qc.x(coin)
+            qc.compose(step, inplace=True)
 
     qc.measure_all()
     qc.name = qc.name + "-" + ancillary_mode
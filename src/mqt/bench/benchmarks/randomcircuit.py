@@ -6,33 +6,129 @@
 #
 # Licensed under the MIT License
 
+
 """Random benchmark definition."""
 
 from __future__ import annotations
 
+from functools import cache
+from typing import TYPE_CHECKING
+
+import numpy as np
 from qiskit import QuantumCircuit, transpile
+from qiskit.circuit.library import get_standard_gate_name_mapping
 from qiskit.circuit.random import random_circuit
 
 from mqt.bench.benchmark_generation import get_openqasm_gates
+from mqt.bench.bulk import STANDARD_GATES, append_instructions
+
+if TYPE_CHECKING:  # pragma: no cover
+    from qiskit._accelerate.circuit import StandardGate
+    from qiskit.circuit import Qubit
+
+# gates of the OpenQASM 2.0 standard header that are not used in random circuits
+EXCLUDED_GATES = frozenset({"rccx", "csx", "cu"})
+
 
+def create_circuit(
+    num_qubits: int,
+    native: bool = False,
+    depth_ratio: float = 2.0,
+    two_qubit_gate_density: float = 0.5,
+    seed: int = 10,
+) -> QuantumCircuit:
+    """Returns a random quantum circuit twice as deep as wide (by default).
 
-def create_circuit(num_qubits: int) -> QuantumCircuit:
-    """Returns a random quantum circuit twice as deep as wide. The random gate span over four qubits maximum.
+    By default, the circuit is generated by Qiskit's ``random_circuit``, whose gates span over four qubits maximum, and
+    transpiled to the gates of the OpenQASM 2.0 standard header. With ``native``, the gates are sampled directly from
+    these gates instead (see `generate_random_circuit`), which skips the transpilation.
 
     Arguments:
         num_qubits: number of qubits of the returned quantum circuit
+        native: whether the gates are sampled directly from the OpenQASM 2.0 gates
+        depth_ratio: ratio of the number of layers (i.e., the depth without measurements) to the number of qubits
+        two_qubit_gate_density: expected fraction of the qubits of a layer acted on by two-qubit gates (only used with
+            ``native``)
+        seed: seed of the random number generator
 
     Returns:
-        QuantumCircuit: a random quantum circuit twice as deep as wide
+        QuantumCircuit: a random quantum circuit
     """
-    qc = random_circuit(num_qubits, num_qubits * 2, measure=False, seed=10)
-    gates = list(set(get_openqasm_gates()) - {"rccx", "csx", "cu"})
-    qc = transpile(
-        qc,
-        basis_gates=gates,
-        seed_transpiler=10,
-        optimization_level=1,
-    )
+    depth = max(1, round(depth_ratio * num_qubits))
+    if native:
+        qc = generate_random_circuit(num_qubits, depth, two_qubit_gate_density, seed)
+    else:
+        qc = random_circuit(num_qubits, depth, measure=False, seed=seed)
+        gates = list(set(get_openqasm_gates()) - EXCLUDED_GATES)
+        qc = transpile(
+            qc,
+            basis_gates=gates,
+            seed_transpiler=10,
+            optimization_level=1,
+        )
     qc.measure_all()
     qc.name = "randomcircuit"
     return qc
+
+
+def generate_random_circuit(
+    num_qubits: int, depth: int, two_qubit_gate_density: float = 0.5, seed: int | None = None
+) -> QuantumCircuit:
+    """Samples a random circuit of one- and two-qubit gates of the OpenQASM 2.0 standard header (except `EXCLUDED_GATES`).
+
+    The circuit consists of ``depth`` layers, in each of which every qubit is acted on by exactly one gate. For each
+    layer, the number of two-qubit gates is drawn from a binomial distribution, so that on average the given fraction
+    of the qubits is acted on by two-qubit gates. The qubits are paired randomly and all angles are uniformly distributed.
+    All random numbers are drawn at once for all layers.
+
+    Arguments:
+        num_qubits: number of qubits of the circuit
+        depth: number of layers of the circuit
+        two_qubit_gate_density: expected fraction of the qubits of a layer acted on by two-qubit gates
+        seed: seed of the random number generator
+
+    Returns:
+        the random circuit without measurements
+    """
+    if not 0 <= two_qubit_gate_density <= 1:
+        msg = "two_qubit_gate_density must be between 0 and 1."
+        raise ValueError(msg)
+    one_qubit_gates, two_qubit_gates = _get_gates()
+    rng = np.random.default_rng(seed)
+
+    # in each layer, the qubits are permuted and the first 2k of them are paired for the k two-qubit gates
+    orders = rng.permuted(np.tile(np.arange(num_qubits), (depth, 1)), axis=1)
+    num_pairs = rng.binomial(num_qubits // 2, two_qubit_gate_density, size=depth).tolist()
+    one_qubit_choices = rng.integers(len(one_qubit_gates), size=(depth, num_qubits))
+    two_qubit_choices = rng.integers(len(two_qubit_gates), size=(depth, max(1, num_qubits // 2)))
+    angles = rng.uniform(0, 2 * np.pi, size=(depth, num_qubits, 3))
+
+    qc = QuantumCircuit(num_qubits)
+    qubits = qc.qubits
+    for layer, pairs in enumerate(num_pairs):
+        order = orders[layer].tolist()
+        layer_angles = angles[layer].tolist()
+        instructions: list[tuple[StandardGate, tuple[Qubit, ...], list[float]]] = []
+        for i, choice in enumerate(two_qubit_choices[layer, :pairs].tolist()):
+            gate, num_params = two_qubit_gates[choice]
+            operands = (qubits[order[2 * i]], qubits[order[2 * i + 1]])
+            instructions.append((gate, operands, layer_angles[i][:num_params]))
+        for j in range(2 * pairs, num_qubits):
+            gate, num_params = one_qubit_gates[one_qubit_choices[layer, j]]
+            instructions.append((gate, (qubits[order[j]],), layer_angles[j][:num_params]))
+        append_instructions(qc, instructions)
+    return qc
+
+
+@cache
+def _get_gates() -> tuple[list[tuple[StandardGate, int]], list[tuple[StandardGate, int]]]:
+    """Returns the standard gates and their numbers of parameters acting on one and on two qubits, respectively."""
+    gate_mapping = get_standard_gate_name_mapping()
+    gates: dict[int, list[tuple[StandardGate, int]]] = {1: [], 2: []}
+    for name in get_openqasm_gates():
+        if name in EXCLUDED_GATES or name not in STANDARD_GATES:
+            continue
+        gate = gate_mapping[name]
+        if gate.num_qubits in gates:
+            gates[gate.num_qubits].append((STANDARD_GATES[name], len(gate.params)))
+    return gates[1], gates[2]
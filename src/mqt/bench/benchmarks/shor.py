@@ -22,26 +22,45 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
     from numpy.typing import NDArray
+    from qiskit._accelerate.circuit import StandardGate
+    from qiskit.circuit import Qubit
 import math
 from typing import cast
 
 import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister
-from qiskit.circuit import Instruction, ParameterVector
 from qiskit.circuit.library import QFT
+from qiskit.synthesis.qft import synth_qft_full
+
+from mqt.bench.bulk import STANDARD_GATES, append_instructions, append_standard_gates
+
+_CPHASE = STANDARD_GATES["cp"]
+_CX = STANDARD_GATES["cx"]
+_PHASE = STANDARD_GATES["p"]
+_X = STANDARD_GATES["x"]
 
+# A step of a circuit template: the gate, the indices of the qubits it acts on, its fixed parameters and the index of
+# its angle together with the coefficient of the angle (or -1 for gates with fixed parameters)
+_Step = tuple["StandardGate", tuple[int, ...], tuple[float, ...], int, float]
 
-def create_circuit(num_to_be_factorized: int, a: int = 2) -> QuantumCircuit:
+
+def create_circuit(num_to_be_factorized: int, a: int | None = None) -> QuantumCircuit:
     """Returns a quantum circuit implementing the Shor's algorithm.
 
     Arguments:
         num_to_be_factorized: number which shall be factorized
-        a: any integer that satisfies 1 < a < num_to_be_factorized and gcd(a, num_to_be_factorized) = 1
+        a: any integer that satisfies 1 < a < num_to_be_factorized and gcd(a, num_to_be_factorized) = 1 (chosen by
+            `choose_a` if omitted)
     """
+    if a is None:
+        a = choose_a(num_to_be_factorized)
     qc = Shor().construct_circuit(num_to_be_factorized, a)
     qc.measure_all()
     qc.name = "shor_" + str(num_to_be_factorized) + "_" + str(a)
@@ -50,7 +69,11 @@ def create_circuit(num_to_be_factorized: int, a: int = 2) -> QuantumCircuit:
 
 
 def get_instance(choice: str) -> list[int]:
-    """Returns the number to be factorized and the integer a for the Shor's algorithm."""
+    """Returns the number to be factorized and the integer a for the Shor's algorithm.
+
+    Besides the named instances, custom instances of the form "<N>" or "<N>_<a>" are supported (see `instance_name`).
+    If a is omitted, it is chosen by `choose_a`.
+    """
     instances = {
         "xsmall": [9, 4],  # 18 qubits
         "small": [15, 4],  # 18 qubits
@@ -58,147 +81,221 @@ def get_instance(choice: str) -> list[int]:
         "large": [11777, 4],  # 58 qubits
         "xlarge": [201209, 4],  # 74 qubits
     }
-    return instances[choice]
+    if choice in instances:
+        return instances[choice]
 
+    number, separator, a = choice.partition("_")
+    if not number.isdigit() or (separator and not a.isdigit()):
+        msg = f"Unknown instance {choice}. Valid instances are {list(instances)} or custom ones of the form '<N>_<a>'."
+        raise ValueError(msg)
+    to_be_factored_number = int(number)
+    a_value = int(a) if a else choose_a(to_be_factored_number)
+    Shor._validate_input(to_be_factored_number, a_value)  # noqa: SLF001
+    return [to_be_factored_number, a_value]
 
-class Shor:
-    """Shor's algorithm implementation."""
 
-    @staticmethod
-    def _get_angles(a: int, n: int) -> NDArray[np.float64]:
-        """Calculates the array of angles to be used in the addition in Fourier Space."""
-        bits_little_endian = (f"{a:b}".zfill(n))[::-1]
+def instance_name(to_be_factored_number: int, a: int | None = None) -> str:
+    """Returns the name of the custom instance for the number to be factorized and (optionally) the integer a."""
+    return str(to_be_factored_number) if a is None else f"{to_be_factored_number}_{a}"
 
-        angles = np.zeros(n)
-        for i in range(n):
-            for j in range(i + 1):
-                k = i - j
-                if bits_little_endian[j] == "1":
-                    angles[i] += pow(2, -k)
 
-        return cast("NDArray[np.float64]", angles * np.pi)
+def choose_a(to_be_factored_number: int) -> int:
+    """Chooses the smallest integer a for which Shor's algorithm finds a factor of N.
 
-    @staticmethod
-    def _phi_add_gate(angles: NDArray[np.float64] | ParameterVector) -> QuantumCircuit:
-        """Gate that performs addition by a in Fourier Space."""
-        circuit = QuantumCircuit(len(angles), name="phi_add_a")
-        for i, angle in enumerate(angles):
-            circuit.p(angle, i)
-        return circuit
-
-    def _double_controlled_phi_add_mod_n(
-        self,
-        angles: NDArray[np.float64] | ParameterVector,
-        c_phi_add_n: QuantumCircuit,
-        iphi_add_n: QuantumCircuit,
-        qft: QuantumCircuit,
-        iqft: QuantumCircuit,
-    ) -> QuantumCircuit:
-        """Creates a circuit which implements double-controlled modular addition by a."""
-        ctrl_qreg = QuantumRegister(2, "ctrl")
-        b_qreg = QuantumRegister(len(angles), "b")
-        flag_qreg = QuantumRegister(1, "flag")
-
-        circuit = QuantumCircuit(ctrl_qreg, b_qreg, flag_qreg, name="ccphi_add_a_mod_N")
-
-        cc_phi_add_a = self._phi_add_gate(angles).control(2)
-        cc_iphi_add_a = cc_phi_add_a.inverse()
+    Such an a is coprime to N and its order r modulo N is even with a^(r/2) != -1 (mod N). If N is a prime power,
+    there is no such a and the smallest a with an order larger than 2 is chosen instead, so that the period finding is
+    still non-trivial (or 2 if there is none either).
 
-        circuit.compose(cc_phi_add_a, [*ctrl_qreg, *b_qreg], inplace=True)
+    Arguments:
+        to_be_factored_number: the odd integer to be factored, has a min. value of 3
+    """
+    Shor._validate_input(to_be_factored_number, 2)  # noqa: SLF001
+
+    # the order of every a divides the Carmichael function of N
+    carmichael = 1
+    prime_factors = _factorize(to_be_factored_number)
+    for p, k in prime_factors.items():
+        carmichael = math.lcm(carmichael, p ** (k - 1) * (p - 1))
+    carmichael_factors = _factorize(carmichael)
+
+    fallback = None
+    for a in range(2, to_be_factored_number):
+        if math.gcd(a, to_be_factored_number) != 1:
+            continue
+        order = carmichael
+        for p in carmichael_factors:
+            while order % p == 0 and pow(a, order // p, to_be_factored_number) == 1:
+                order //= p
+        if order % 2 == 0 and pow(a, order // 2, to_be_factored_number) != to_be_factored_number - 1:
+            return a
+        if fallback is None and order > 2:
+            fallback = a
+            if len(prime_factors) == 1:
+                break
+    return fallback or 2
+
+
+def _factorize(n: int) -> dict[int, int]:
+    """Factorizes n by trial division and returns its prime factors with their multiplicities."""
+    factors: dict[int, int] = {}
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        p += 1 if p == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+@cache
+def _qft_template(num_qubits: int, inverse: bool) -> tuple[_Step, ...]:
+    """QFT without swaps as a template on qubits 0 to num_qubits - 1."""
+    qft = synth_qft_full(num_qubits, do_swaps=False, inverse=inverse)
+    return tuple(
+        (
+            STANDARD_GATES[instruction.operation.name],
+            tuple(qft.find_bit(qubit).index for qubit in instruction.qubits),
+            tuple(float(param) for param in instruction.operation.params),
+            -1,
+            0.0,
+        )
+        for instruction in qft.data
+    )
+
+
+@cache
+def _modular_adder_template(num_bits: int, inverse: bool) -> tuple[_Step, ...]:
+    """Template of the double-controlled addition of a constant modulo N in Fourier space.
+
+    The template acts on the qubits (ctrl_0, ctrl_1, b_0, ..., b_num_bits, flag). Its angles are the concatenation of
+    the angles of the constant and of N (see `Shor._get_angles`), so that one template serves all constants and all N
+    of the given bit width. The double-controlled phase gates are built from controlled phase gates that share two CX
+    gates per addition. All gates of the template are inverted by negating their parameters.
+    """
+    size = num_bits + 1
+    b = range(2, size + 2)
+    flag = size + 2
+    steps: list[_Step] = []
+
+    def add_constant(sign: float) -> None:
+        steps.extend((_CPHASE, (1, b[i]), (), i, sign / 2) for i in range(size))
+        steps.append((_CX, (0, 1), (), -1, 0.0))
+        steps.extend((_CPHASE, (1, b[i]), (), i, -sign / 2) for i in range(size))
+        steps.append((_CX, (0, 1), (), -1, 0.0))
+        steps.extend((_CPHASE, (0, b[i]), (), i, sign / 2) for i in range(size))
+
+    def fourier(inverse: bool) -> None:
+        steps.extend(
+            (gate, tuple(b[qubit] for qubit in qubits), params, index, coefficient)
+            for gate, qubits, params, index, coefficient in _qft_template(size, inverse)
+        )
+
+    add_constant(1.0)
+    steps.extend((_PHASE, (b[i],), (), size + i, -1.0) for i in range(size))
+    fourier(inverse=True)
+    steps.append((_CX, (b[-1], flag), (), -1, 0.0))
+    fourier(inverse=False)
+    steps.extend((_CPHASE, (flag, b[i]), (), size + i, 1.0) for i in range(size))
+    add_constant(-1.0)
+    fourier(inverse=True)
+    steps.extend([(_X, (b[-1],), (), -1, 0.0), (_CX, (b[-1], flag), (), -1, 0.0), (_X, (b[-1],), (), -1, 0.0)])
+    fourier(inverse=False)
+    add_constant(1.0)
+
+    if not inverse:
+        return tuple(steps)
+    return tuple(
+        (gate, qubits, tuple(-param for param in params), index, -coefficient)
+        for gate, qubits, params, index, coefficient in reversed(steps)
+    )
+
+
+def _append_template(
+    circuit: QuantumCircuit, template: Sequence[_Step], qubits: Sequence[Qubit], angles: Sequence[float] = ()
+) -> None:
+    """Appends the steps of a template to the circuit, acting on the given qubits and with the given angles."""
+    append_instructions(
+        circuit,
+        (
+            (gate, [qubits[i] for i in indices], (coefficient * angles[index],) if index >= 0 else params)
+            for gate, indices, params, index, coefficient in template
+        ),
+    )
 
-        circuit.compose(iphi_add_n, b_qreg, inplace=True)
 
-        circuit.compose(iqft, b_qreg, inplace=True)
-        circuit.cx(b_qreg[-1], flag_qreg[0])
-        circuit.compose(qft, b_qreg, inplace=True)
+class Shor:
+    """Shor's algorithm implementation.
 
-        circuit.compose(c_phi_add_n, [*flag_qreg, *b_qreg], inplace=True)
+    The modular exponentiation is emitted gate by gate into the circuit. The double-controlled modular adders, which
+    make up most of the circuit, are instantiated from templates built once per bit width.
+    """
 
-        circuit.compose(cc_iphi_add_a, [*ctrl_qreg, *b_qreg], inplace=True)
+    @staticmethod
+    def _get_angles(a: int, n: int) -> NDArray[np.float64]:
+        """Calculates the array of angles to be used in the addition in Fourier Space."""
+        return cast("NDArray[np.float64]", Shor._get_angles_many([a], n)[0])
 
-        circuit.compose(iqft, b_qreg, inplace=True)
-        circuit.x(b_qreg[-1])
-        circuit.cx(b_qreg[-1], flag_qreg[0])
-        circuit.x(b_qreg[-1])
-        circuit.compose(qft, b_qreg, inplace=True)
+    @staticmethod
+    def _get_angles_many(constants: Sequence[int], n: int) -> NDArray[np.float64]:
+        """Calculates the angles for the addition of each of the constants in Fourier space.
 
-        return circuit.compose(cc_phi_add_a, [*ctrl_qreg, *b_qreg])
+        The angle on qubit i is pi times the sum of 2^(j - i) over the set bits j <= i of the constant.
+        """
+        num_bytes = (n + 7) // 8
+        mask = (1 << n) - 1
+        data = b"".join((constant & mask).to_bytes(num_bytes, "little") for constant in constants)
+        bits = np.unpackbits(
+            np.frombuffer(data, dtype=np.uint8).reshape(len(constants), num_bytes), axis=1, count=n, bitorder="little"
+        )
+        i, j = np.indices((n, n))
+        weights = np.where(j <= i, np.exp2(j - i), 0.0)
+        return cast("NDArray[np.float64]", np.pi * (bits @ weights.T))
 
     def _controlled_multiple_mod_n(
         self,
-        num_bits_necessary: int,
+        circuit: QuantumCircuit,
+        ctrl: Qubit,
+        x_qubits: Sequence[Qubit],
+        b_qubits: Sequence[Qubit],
+        flag: Qubit,
         to_be_factored_number: int,
         a: int,
-        c_phi_add_n: QuantumCircuit,
-        iphi_add_n: QuantumCircuit,
-        qft: QuantumCircuit,
-        iqft: QuantumCircuit,
-    ) -> QuantumCircuit:
-        """Implements modular multiplication by a as an instruction."""
-        ctrl_qreg = QuantumRegister(1, "ctrl")
-        x_qreg = QuantumRegister(num_bits_necessary, "x")
-        b_qreg = QuantumRegister(num_bits_necessary + 1, "b")
-        flag_qreg = QuantumRegister(1, "flag")
-
-        circuit = QuantumCircuit(ctrl_qreg, x_qreg, b_qreg, flag_qreg, name="cmult_a_mod_N")
-
-        angle_params = ParameterVector("angles", length=num_bits_necessary + 1)
-        modulo_adder = self._double_controlled_phi_add_mod_n(angle_params, c_phi_add_n, iphi_add_n, qft, iqft)
-
-        def append_adder(adder: QuantumCircuit, constant: int, idx: int) -> None:
-            partial_constant = (pow(2, idx, to_be_factored_number) * constant) % to_be_factored_number
-            angles = self._get_angles(partial_constant, num_bits_necessary + 1)
-            bound = adder.assign_parameters({angle_params: angles})
-            circuit.append(bound, [*ctrl_qreg, x_qreg[idx], *b_qreg, *flag_qreg])
-
-        circuit.compose(qft, b_qreg, inplace=True)
+    ) -> None:
+        """Appends the controlled modular multiplication by a to the circuit."""
+        num_bits = len(x_qubits)
+        qft = _qft_template(num_bits + 1, inverse=False)
+        iqft = _qft_template(num_bits + 1, inverse=True)
+        angles_n = self._get_angles(to_be_factored_number, num_bits + 1)
+
+        def angles(constant: int) -> NDArray[np.float64]:
+            constants = [(pow(2, i, to_be_factored_number) * constant) % to_be_factored_number for i in range(num_bits)]
+            angles_constants = self._get_angles_many(constants, num_bits + 1)
+            return np.hstack([angles_constants, np.broadcast_to(angles_n, angles_constants.shape)])
+
+        _append_template(circuit, qft, b_qubits)
 
         # perform controlled addition by a on the aux register in Fourier space
-        for i in range(num_bits_necessary):
-            append_adder(modulo_adder, a, i)
+        adder = _modular_adder_template(num_bits, inverse=False)
+        for i, angles_i in enumerate(angles(a).tolist()):
+            _append_template(circuit, adder, [ctrl, x_qubits[i], *b_qubits, flag], angles_i)
 
-        circuit.compose(iqft, b_qreg, inplace=True)
+        _append_template(circuit, iqft, b_qubits)
 
         # perform controlled subtraction by a in Fourier space on both the aux and down register
-        for i in range(num_bits_necessary):
-            circuit.cswap(ctrl_qreg, x_qreg[i], b_qreg[i])
+        append_standard_gates(
+            circuit, STANDARD_GATES["cswap"], [(ctrl, x_qubits[i], b_qubits[i]) for i in range(num_bits)]
+        )
 
-        circuit.compose(qft, b_qreg, inplace=True)
+        _append_template(circuit, qft, b_qubits)
 
         a_inv = pow(a, -1, mod=to_be_factored_number)
+        adder_inv = _modular_adder_template(num_bits, inverse=True)
+        for i, angles_i in reversed(list(enumerate(angles(a_inv).tolist()))):
+            _append_template(circuit, adder_inv, [ctrl, x_qubits[i], *b_qubits, flag], angles_i)
 
-        modulo_adder_inv = modulo_adder.inverse()
-        for i in reversed(range(num_bits_necessary)):
-            append_adder(modulo_adder_inv, a_inv, i)
-
-        return circuit.compose(iqft, b_qreg)
-
-    def _power_mod_n(self, num_bits_necessary: int, to_be_factored_number: int, a: int) -> Instruction:
-        """Implements modular exponentiation a^x as an instruction."""
-        up_qreg = QuantumRegister(2 * num_bits_necessary, name="up")
-        down_qreg = QuantumRegister(num_bits_necessary, name="down")
-        aux_qreg = QuantumRegister(num_bits_necessary + 2, name="aux")
-
-        circuit = QuantumCircuit(up_qreg, down_qreg, aux_qreg, name=f"{a}^x mod {to_be_factored_number}")
-
-        qft = QFT(num_bits_necessary + 1, do_swaps=False)
-        iqft = qft.inverse()
-
-        # Create gates to perform addition/subtraction by N in Fourier Space
-        phi_add_n = self._phi_add_gate(self._get_angles(to_be_factored_number, num_bits_necessary + 1))
-        iphi_add_n = phi_add_n.inverse()
-        c_phi_add_n = phi_add_n.control(1)
-
-        # Apply the multiplication gates as showed in
-        # the report in order to create the exponentiation
-        for i in range(2 * num_bits_necessary):
-            partial_a = pow(a, pow(2, i), to_be_factored_number)
-            modulo_multiplier = self._controlled_multiple_mod_n(
-                num_bits_necessary, to_be_factored_number, partial_a, c_phi_add_n, iphi_add_n, qft, iqft
-            )
-            circuit.compose(modulo_multiplier, [up_qreg[i], *down_qreg, *aux_qreg], inplace=True)
-
-        return circuit
+        _append_template(circuit, iqft, b_qubits)
 
     @staticmethod
     def _validate_input(to_be_factored_number: int, a: int) -> None:
@@ -258,9 +355,12 @@ class Shor:
         # Initialize down register to 1
         circuit.x(down_qreg[0])
 
-        # Apply modulo exponentiation
-        modulo_power = self._power_mod_n(num_bits_necessary, to_be_factored_number, a)
-        circuit.compose(modulo_power.decompose(reps=4), circuit.qubits, inplace=True)
+        # Apply modulo exponentiation as a sequence of multiplications by a^(2^i)
+        for i in range(2 * num_bits_necessary):
+            partial_a = pow(a, pow(2, i), to_be_factored_number)
+            self._controlled_multiple_mod_n(
+                circuit, up_qreg[i], down_qreg, aux_qreg[:-1], aux_qreg[-1], to_be_factored_number, partial_a
+            )
 
         # Apply inverse QFT
         iqft = QFT(len(up_qreg)).inverse()
@@ -19,19 +19,20 @@ if TYPE_CHECKING:  # pragma: no cover
     from qiskit import QuantumCircuit
 
 
-def create_circuit(num_qubits: int) -> QuantumCircuit:
+def create_circuit(num_qubits: int, parameterized: bool = False) -> QuantumCircuit:
     """Returns a quantum circuit implementing the RealAmplitudes ansatz with random parameter values.
 
     Arguments:
         num_qubits: number of qubits of the returned quantum circuit
+        parameterized: whether the parameters are left unbound (see `mqt.bench.bind`) instead of random values
 
     Returns:
         QuantumCircuit: a quantum circuit implementing the RealAmplitudes ansatz with random parameter values
     """
-    rng = np.random.default_rng(10)
     qc = RealAmplitudes(num_qubits, entanglement="full", reps=3)
-    num_params = qc.num_parameters
-    qc = qc.assign_parameters(2 * np.pi * rng.random(num_params))
+    if not parameterized:
+        rng = np.random.default_rng(10)
+        qc = qc.assign_parameters(2 * np.pi * rng.random(qc.num_parameters))
     qc.measure_all()
     qc.name = "vqerealamprandom"
 
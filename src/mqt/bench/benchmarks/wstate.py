@@ -13,6 +13,8 @@ from __future__ import annotations
 import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister
 
+from mqt.bench.bulk import STANDARD_GATES, append_instructions, append_standard_gates, measure_all
+
 
 def create_circuit(num_qubits: int) -> QuantumCircuit:
     """Returns a quantum circuit implementing the W state.
@@ -26,20 +28,24 @@ def create_circuit(num_qubits: int) -> QuantumCircuit:
     q = QuantumRegister(num_qubits, "q")
     qc = QuantumCircuit(q, name="wstate")
 
-    def f_gate(qc: QuantumCircuit, q: QuantumRegister, i: int, j: int, n: int, k: int) -> None:
-        theta = np.arccos(np.sqrt(1 / (n - k + 1)))
-        qc.ry(-theta, q[j])
-        qc.cz(q[i], q[j])
-        qc.ry(theta, q[j])
-
-    qc.x(q[-1])
-
-    for m in range(1, num_qubits):
-        f_gate(qc, q, num_qubits - m, num_qubits - m - 1, num_qubits, m)
-
-    for k in reversed(range(1, num_qubits)):
-        qc.cx(k - 1, k)
-
-    qc.measure_all()
+    append_standard_gates(qc, STANDARD_GATES["x"], [(q[-1],)])
+
+    # F gates between the qubits i = n - m and j = n - m - 1 for m = 1, ..., n - 1
+    m = np.arange(1, num_qubits)
+    thetas = np.arccos(np.sqrt(1 / (num_qubits - m + 1))).tolist()
+    ry, cz = STANDARD_GATES["ry"], STANDARD_GATES["cz"]
+    append_instructions(
+        qc,
+        (
+            instruction
+            for theta, i, j in zip(thetas, q[:0:-1], q[-2::-1])
+            for instruction in ((ry, (j,), (-theta,)), (cz, (i, j), ()), (ry, (j,), (theta,)))
+        ),
+    )
+
+    # CX gates from qubit k - 1 to qubit k for k = n - 1, ..., 1
+    append_standard_gates(qc, STANDARD_GATES["cx"], zip(q[-2::-1], q[:0:-1]))
+
+    measure_all(qc)
 
     return qc
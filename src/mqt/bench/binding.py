@@ -0,0 +1,54 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Binding of parameterized benchmark templates to concrete parameter values."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import ArrayLike
+    from qiskit import QuantumCircuit
+
+
+def bind(qc: QuantumCircuit, values: ArrayLike) -> QuantumCircuit:
+    """Returns a copy of a parameterized circuit with its parameters bound to concrete values.
+
+    The circuit may be a template on any level, e.g., ``get_benchmark("vqesu2random", "mapped", 5, parameterized=True)``,
+    so that it is compiled only once for all parameter values it is bound to.
+
+    Arguments:
+        qc: parameterized circuit
+        values: values of the parameters in the order of ``qc.parameters``
+
+    Returns:
+        the circuit with bound parameters
+    """
+    return bind_many(qc, np.reshape(np.asarray(values, dtype=np.float64), (1, -1)))[0]
+
+
+def bind_many(qc: QuantumCircuit, values: ArrayLike) -> list[QuantumCircuit]:
+    """Returns a copy of a parameterized circuit for each of several parameter vectors (see `bind`).
+
+    Arguments:
+        qc: parameterized circuit
+        values: array of shape (number of parameter vectors, ``qc.num_parameters``), whose rows contain the values of
+            the parameters in the order of ``qc.parameters``
+
+    Returns:
+        the circuits with bound parameters in the order of the rows
+    """
+    values = np.asarray(values, dtype=np.float64)
+    parameters = list(qc.parameters)
+    if values.ndim != 2 or values.shape[1] != len(parameters):
+        msg = f"Expected parameter values of shape (n, {len(parameters)}), but got shape {values.shape}."
+        raise ValueError(msg)
+    return [qc.assign_parameters(dict(zip(parameters, row)), flat_input=True) for row in values.tolist()]
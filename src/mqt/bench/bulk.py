@@ -0,0 +1,98 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Helpers for constructing large benchmark circuits in bulk.
+
+The operands of the benchmark circuits are known to be valid, hence, their instructions are appended via the unchecked
+``QuantumCircuit._append`` instead of ``QuantumCircuit.append`` with its argument broadcasting and validation, which
+is much faster for circuits with many gates. Standard gates are appended as Rust-native gates (see `STANDARD_GATES`)
+without creating a Python gate object per instruction. All qubits and clbits passed to these helpers must belong to
+the circuit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from qiskit import ClassicalRegister
+from qiskit.circuit import CircuitInstruction, Measure, Reset
+from qiskit.circuit.library import get_standard_gate_name_mapping
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Sequence
+
+    from qiskit import QuantumCircuit
+    from qiskit._accelerate.circuit import StandardGate
+    from qiskit.circuit import Clbit, ParameterExpression, Qubit
+
+# Rust-native standard gates by name, e.g., "cx"
+STANDARD_GATES: dict[str, StandardGate] = {
+    name: gate._standard_gate  # noqa: SLF001
+    for name, gate in get_standard_gate_name_mapping().items()
+    if getattr(gate, "_standard_gate", None) is not None
+}
+
+_MEASURE = Measure()
+_RESET = Reset()
+
+
+def append_instructions(
+    qc: QuantumCircuit,
+    instructions: Iterable[tuple[StandardGate, Sequence[Qubit], Sequence[float | ParameterExpression]]],
+) -> None:
+    """Appends a sequence of standard gates, each given by the gate, its qubits and its parameters, to the circuit.
+
+    Arguments:
+        qc: circuit to append the gates to
+        instructions: gates to append, e.g., ``(STANDARD_GATES["rz"], (qubit,), (angle,))``
+    """
+    append = qc._append  # noqa: SLF001
+    from_standard = CircuitInstruction.from_standard
+    for gate, qubits, params in instructions:
+        append(from_standard(gate, qubits, params))
+
+
+def append_standard_gates(
+    qc: QuantumCircuit,
+    gate: StandardGate,
+    operands: Iterable[tuple[Qubit, ...]],
+    params: tuple[float | ParameterExpression, ...] = (),
+) -> None:
+    """Appends a standard gate with the same parameters to each of the operands.
+
+    Arguments:
+        qc: circuit to append the gates to
+        gate: standard gate to append, e.g., ``STANDARD_GATES["cx"]``
+        operands: qubits of the gates
+        params: parameters of the gates
+    """
+    append = qc._append  # noqa: SLF001
+    for qubits in operands:
+        append(CircuitInstruction.from_standard(gate, qubits, params))
+
+
+def append_measurements(qc: QuantumCircuit, operands: Iterable[tuple[Qubit, Clbit]]) -> None:
+    """Appends a measurement for each of the (qubit, clbit) operands."""
+    append = qc._append  # noqa: SLF001
+    for qubit, clbit in operands:
+        append(CircuitInstruction(_MEASURE, (qubit,), (clbit,)))
+
+
+def append_resets(qc: QuantumCircuit, qubits: Iterable[Qubit]) -> None:
+    """Appends a reset of each of the qubits."""
+    append = qc._append  # noqa: SLF001
+    for qubit in qubits:
+        append(CircuitInstruction(_RESET, (qubit,), ()))
+
+
+def measure_all(qc: QuantumCircuit) -> None:
+    """Adds a barrier and measures all qubits into a new register "meas", like ``QuantumCircuit.measure_all``."""
+    creg = ClassicalRegister(qc.num_qubits, "meas")
+    qc.add_register(creg)
+    qc.barrier()
+    append_measurements(qc, zip(qc.qubits, creg))
@@ -0,0 +1,239 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Persistent, content-addressed cache for generated and compiled benchmark circuits."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit import __version__ as __qiskit_version__
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.qpy import QpyError
+from qiskit.qpy import dump as dump_qpy
+from qiskit.qpy import load as load_qpy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from qiskit.circuit import Instruction
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV_VAR = "MQT_BENCH_CACHE_DIR"
+DEFAULT_MAX_SIZE_BYTES = 2**30  # 1 GiB
+
+_STANDARD_GATES = get_standard_gate_name_mapping()
+
+
+class CircuitCache:
+    """Stores circuits as QPY blobs in a directory, keyed by a hash of everything that determines them.
+
+    The cache is bounded in size. Whenever storing a circuit exceeds the limit, the least recently used entries are
+    evicted. Usage is tracked via the modification time of the entries, which is refreshed on every hit.
+    """
+
+    def __init__(self, directory: str | Path, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES) -> None:
+        """Initialize the cache.
+
+        Arguments:
+            directory: directory to store the cached circuits in (created if it does not exist)
+            max_size_bytes: maximum total size of all cached circuits
+        """
+        self.directory = Path(directory).expanduser()
+        self.max_size_bytes = max_size_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(**parts: object) -> str:
+        """Compute the cache key for the given parts.
+
+        The versions of mqt.bench and Qiskit are always part of the key, so that upgrading either of them never
+        returns stale circuits.
+
+        Arguments:
+            parts: everything that determines the cached circuit, e.g., benchmark name, size, level, target
+
+        Returns:
+            the hex digest identifying the cache entry
+        """
+        try:
+            version = metadata.version("mqt.bench")
+        except metadata.PackageNotFoundError:
+            version = "unknown"
+        parts = {**parts, "mqt.bench": version, "qiskit": __qiskit_version__}
+        serialized = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.qpy"
+
+    def get(self, key: str) -> QuantumCircuit | None:
+        """Return the cached circuit for the key or ``None`` if there is none."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                qc = load_qpy(f)[0]
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        except (QpyError, OSError, IndexError):
+            logger.warning("Ignoring unreadable cache entry %s.", path)
+            path.unlink(missing_ok=True)
+            return None
+        return qc
+
+    def put(self, key: str, qc: QuantumCircuit) -> None:
+        """Store a circuit under the key and evict the least recently used entries if the cache is full."""
+        buffer = io.BytesIO()
+        try:
+            dump_qpy(qc, buffer)
+        except QpyError:
+            logger.warning("Circuit %s cannot be serialized to QPY and is not cached.", qc.name)
+            return
+
+        # write to a temporary file first so that concurrent readers never see partial entries
+        fd, name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        tmp_name: str | None = name
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buffer.getvalue())
+            Path(name).replace(self._path(key))
+            tmp_name = None
+        finally:
+            if tmp_name is not None:  # the temporary file was not moved into place, errors are raised nonetheless
+                Path(tmp_name).unlink(missing_ok=True)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits into its maximum size."""
+        entries = []
+        total_size = 0
+        for path in self.directory.glob("*.qpy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed concurrently
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for path in self.directory.glob("*.qpy"):
+            path.unlink(missing_ok=True)
+
+
+_cache: CircuitCache | None = None
+_configured = False
+
+
+def configure_cache(directory: str | Path | None, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES) -> CircuitCache | None:
+    """Enable the circuit cache in the given directory or disable it by passing ``None``.
+
+    Without an explicit configuration, the cache is enabled if the environment variable ``MQT_BENCH_CACHE_DIR`` is set.
+
+    Arguments:
+        directory: directory to store the cached circuits in
+        max_size_bytes: maximum total size of all cached circuits
+
+    Returns:
+        the configured cache or ``None`` if caching is disabled
+    """
+    global _cache, _configured  # noqa: PLW0603
+    _cache = None if directory is None else CircuitCache(directory, max_size_bytes)
+    _configured = True
+    return _cache
+
+
+def get_cache() -> CircuitCache | None:
+    """Return the active circuit cache or ``None`` if caching is disabled."""
+    if not _configured:
+        configure_cache(os.environ.get(CACHE_DIR_ENV_VAR) or None)
+    return _cache
+
+
+def get_user_cache_dir() -> Path:
+    """Return the per-user directory for persistent data of mqt.bench, e.g., precomputed synthesis tables.
+
+    The directory follows the XDG base directory specification, i.e., it is located in ``$XDG_CACHE_HOME`` if set and
+    in ``~/.cache`` otherwise. It is not created by this function.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mqt.bench"
+
+
+def circuit_fingerprint(qc: QuantumCircuit) -> str:
+    """Compute a hash that identifies a circuit in cache keys.
+
+    The hash covers the name and size of the circuit as well as the name, parameters and operands of every
+    instruction. The definitions of all instructions that are not standard gates are hashed recursively, so that, e.g.,
+    two custom gates of the same name but with different definitions never share a cache entry.
+    """
+    return _fingerprint_circuit(qc, {})
+
+
+def _fingerprint_circuit(qc: QuantumCircuit, memo: dict[int, tuple[Instruction, str]]) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{qc.name}|{qc.num_qubits}|{qc.num_clbits}|{qc.global_phase!r}".encode())
+    qubit_indices = {qubit: index for index, qubit in enumerate(qc.qubits)}
+    clbit_indices = {clbit: index for index, clbit in enumerate(qc.clbits)}
+    for instruction in qc.data:
+        operation = instruction.operation
+        qubits = [qubit_indices[qubit] for qubit in instruction.qubits]
+        clbits = [clbit_indices[clbit] for clbit in instruction.clbits]
+        digest.update(f"{_fingerprint_operation(operation, memo)}|{qubits}|{clbits};".encode())
+    return digest.hexdigest()
+
+
+def _fingerprint_operation(operation: Instruction, memo: dict[int, tuple[Instruction, str]]) -> str:
+    if _is_standard_gate(operation):
+        return f"{operation.name}|{[_fingerprint_param(param, memo) for param in operation.params]}"
+    # the same custom operation is often appended many times, e.g., a gate created once by ``to_gate``, and it is kept
+    # in the memo, so that its id cannot be reused by another object while fingerprinting
+    key = id(operation)
+    if key not in memo:
+        params = [_fingerprint_param(param, memo) for param in operation.params]
+        definition = operation.definition
+        digest = hashlib.sha256()
+        digest.update(f"{type(operation).__qualname__}|{operation.name}|{operation.num_qubits}|".encode())
+        digest.update(f"{operation.num_clbits}|{getattr(operation, 'ctrl_state', None)}|{params}|".encode())
+        digest.update(b"" if definition is None else _fingerprint_circuit(definition, memo).encode())
+        memo[key] = (operation, digest.hexdigest())
+    return memo[key][1]
+
+
+def _fingerprint_param(param: object, memo: dict[int, tuple[Instruction, str]]) -> str:
+    if isinstance(param, QuantumCircuit):
+        return _fingerprint_circuit(param, memo)
+    if isinstance(param, np.ndarray):
+        # arrays are hashed in full, since their string representation is truncated
+        return hashlib.sha256(
+            f"{param.dtype.str}{param.shape}".encode() + np.ascontiguousarray(param).tobytes()
+        ).hexdigest()
+    return repr(param)
+
+
+def _is_standard_gate(operation: Instruction) -> bool:
+    standard_gate = _STANDARD_GATES.get(operation.name)
+    return standard_gate is not None and operation.base_class is standard_gate.base_class
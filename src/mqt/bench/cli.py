@@ -17,11 +17,13 @@ from pathlib import Path
 
 from . import CompilerSettings, QiskitSettings, get_benchmark
 from .benchmark_generation import generate_filename
+from .benchmarks import shor
 from .devices import (
     get_device_by_name,
     get_native_gateset_by_name,
 )
 from .output import OutputFormat, save_circuit, write_circuit
+from .registry import get_spec
 
 
 class CustomArgumentParser(argparse.ArgumentParser):
@@ -38,9 +40,10 @@ class CustomArgumentParser(argparse.ArgumentParser):
 
 def parse_benchmark_name_and_instance(algorithm: str) -> tuple[str, str | None]:
     """Parse an algorithm name like "shor_xlarge" into a benchmark and instance name."""
-    if algorithm.startswith("shor_"):
-        parts = algorithm.split("_", 1)
-        return parts[0], parts[1]
+    name, separator, instance = algorithm.partition("_")
+    spec = get_spec(name) if separator else None
+    if spec is not None and spec.selected_by_instance:
+        return name, instance
     return algorithm, None
 
 
@@ -57,14 +60,23 @@ def main() -> None:
     parser.add_argument(
         "--algorithm",
         type=str,
-        help="Name of the benchmark (e.g., 'grover-v-chain', 'shor_xsmall').",
+        help="Name of the benchmark (e.g., 'grover-v-chain', 'shor_xsmall', 'shor_1000003_2' or 'shor' with --shor-n).",
         required=True,
     )
     parser.add_argument(
         "--num-qubits",
         type=int,
-        help="Number of qubits for the benchmark.",
-        required=True,
+        help="Number of qubits for the benchmark (not used for 'shor').",
+    )
+    parser.add_argument(
+        "--shor-n",
+        type=int,
+        help="Number to be factorized by the 'shor' benchmark.",
+    )
+    parser.add_argument(
+        "--shor-a",
+        type=int,
+        help="Integer a of the 'shor' benchmark (chosen automatically if omitted, requires --shor-n).",
     )
     parser.add_argument(
         "--qiskit-optimization-level",
@@ -109,6 +121,15 @@ def main() -> None:
 
     # Parse algorithm and optional instance
     benchmark_name, benchmark_instance = parse_benchmark_name_and_instance(args.algorithm)
+    spec = get_spec(benchmark_name)
+    if not (spec is not None and spec.selected_by_instance) and args.num_qubits is None:
+        parser.error("--num-qubits is required for this benchmark.")
+    if args.shor_a is not None and args.shor_n is None:
+        parser.error("--shor-a requires --shor-n.")
+    if args.shor_n is not None:
+        if benchmark_name != "shor" or benchmark_instance is not None:
+            parser.error("--shor-n can only be used with --algorithm shor.")
+        benchmark_instance = shor.instance_name(args.shor_n, args.shor_a)
 
     # Generate circuit
     circuit = get_benchmark(
@@ -134,9 +155,9 @@ def main() -> None:
 
     # Otherwise, save to file
     filename = generate_filename(
-        benchmark_name=benchmark_name,
+        benchmark_name=circuit.name if benchmark_name == "shor" else benchmark_name,
         level=args.level,
-        num_qubits=args.num_qubits,
+        num_qubits=args.num_qubits or circuit.num_qubits,
         gateset=get_native_gateset_by_name(args.gateset) if args.gateset else None,
         device=get_device_by_name(args.device) if args.device else None,
         opt_level=args.qiskit_optimization_level,
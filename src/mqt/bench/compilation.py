@@ -0,0 +1,358 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Registry of reusable Qiskit pass managers for compiling benchmarks."""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from qiskit.circuit import ControlFlowOp, Gate
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.synthesis import generate_basic_approximations
+from qiskit.synthesis.discrete_basis.solovay_kitaev import SolovayKitaevDecomposition
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+
+from .bulk import STANDARD_GATES, append_instructions
+from .cache import get_user_cache_dir
+from .devices import Device
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Operation
+    from qiskit.transpiler import StagedPassManager
+
+    from .devices import Gateset
+
+logger = logging.getLogger(__name__)
+
+SEED_TRANSPILER = 10
+SOLOVAY_KITAEV_BASIS_GATES = ("h", "t", "tdg")
+SOLOVAY_KITAEV_DEPTH = 10
+SOLOVAY_KITAEV_RECURSION_DEGREE = 3
+MIN_PARALLEL_SYNTHESES = 128
+
+# name and parameters of a single-qubit gate
+GateKey = tuple[str, tuple[float, ...]]
+_STANDARD_GATE_NAMES = frozenset(get_standard_gate_name_mapping())
+
+
+def get_pass_manager(
+    basis_gates: Sequence[str],
+    optimization_level: int,
+    coupling_map: Sequence[Sequence[int]] | None = None,
+) -> StagedPassManager:
+    """Returns the preset pass manager for the given basis gates, optimization level and coupling map.
+
+    Pass managers are built only once per configuration and reused for all circuits compiled with it, since building
+    the pipeline (including the coupling map and the basis translation targets) often takes longer than running it on
+    small circuits. The pass managers are seeded, hence, compiling a circuit yields the same result as ``transpile``
+    with ``seed_transpiler=SEED_TRANSPILER``.
+
+    Arguments:
+        basis_gates: names of the gates the circuits are compiled to
+        optimization_level: Qiskit optimization level
+        coupling_map: edges of the coupling map the circuits are mapped to or ``None`` for all-to-all connectivity
+
+    Returns:
+        the shared pass manager (which must not be modified)
+    """
+    edges = None if coupling_map is None else tuple(tuple(edge) for edge in coupling_map)
+    return _build_pass_manager(tuple(basis_gates), optimization_level, edges)
+
+
+@cache
+def _build_pass_manager(
+    basis_gates: tuple[str, ...],
+    optimization_level: int,
+    coupling_map: tuple[tuple[int, ...], ...] | None,
+) -> StagedPassManager:
+    """Builds a pass manager; cached forever by functools.cache."""
+    return generate_preset_pass_manager(
+        optimization_level=optimization_level,
+        basis_gates=list(basis_gates),
+        coupling_map=None if coupling_map is None else CouplingMap([list(edge) for edge in coupling_map]),
+        seed_transpiler=SEED_TRANSPILER,
+    )
+
+
+def compile_circuits(
+    circuits: Sequence[QuantumCircuit],
+    target: Gateset | Device,
+    optimization_level: int,
+    jobs: int | None = None,
+) -> list[QuantumCircuit]:
+    """Compiles several circuits for the same gateset or device at once.
+
+    All circuits are run through one shared pass manager, which lets Qiskit distribute them over multiple processes.
+    For the "clifford+t" gateset, the rotations are additionally approximated using the Solovay-Kitaev algorithm.
+
+    Arguments:
+        circuits: circuits to compile
+        target: gateset the circuits are compiled to or device the circuits are mapped to
+        optimization_level: Qiskit optimization level
+        jobs: number of worker processes for the Solovay-Kitaev synthesis of the "clifford+t" gateset (default: ``1``),
+            see `synthesize_single_qubit_gates`
+
+    Returns:
+        the compiled circuits in the order of the input circuits
+    """
+    if isinstance(target, Device):
+        pm = get_pass_manager(target.gateset.gates, optimization_level, target.coupling_map)
+    elif target.name == "clifford+t":
+        return _compile_clifford_t(circuits, target, optimization_level, jobs)
+    else:
+        pm = get_pass_manager(target.gates, optimization_level)
+    return list(pm.run(list(circuits)))
+
+
+def _compile_clifford_t(
+    circuits: Sequence[QuantumCircuit], gateset: Gateset, optimization_level: int, jobs: int | None
+) -> list[QuantumCircuit]:
+    """Compiles circuits to the Clifford+T gateset."""
+    if any(qc.parameters for qc in circuits):
+        msg = "Parameterized circuits cannot be compiled to the clifford+t gateset, bind their parameters first."
+        raise ValueError(msg)
+    # Transpile the circuits to single- and two-qubit gates including rotations
+    pm = get_pass_manager([*gateset.gates, "rx", "ry", "rz"], optimization_level)
+    compiled_for_sk = pm.run(list(circuits))
+
+    # Synthesize the rotations to Clifford+T gates
+    # Measurements are removed and added back after the synthesis
+    synthesized = synthesize_single_qubit_gates(
+        [qc.remove_final_measurements(inplace=False) for qc in compiled_for_sk], jobs
+    )
+    for qc in synthesized:
+        qc.measure_all()
+
+    # Transpile once more to remove unnecessary gates and optimize the circuits
+    return list(get_pass_manager(gateset.gates, optimization_level).run(synthesized))
+
+
+def synthesize_single_qubit_gates(circuits: Sequence[QuantumCircuit], jobs: int | None = None) -> list[QuantumCircuit]:
+    """Approximates all single-qubit gates of the circuits by Clifford+T sequences using the Solovay-Kitaev algorithm.
+
+    The result is equivalent to running Qiskit's ``SolovayKitaev`` pass on each circuit. However, every distinct gate
+    (i.e., name and parameters) is synthesized only once, since circuits such as QFT contain many rotations but only
+    few distinct angles. The synthesized sequences are memoized in the user cache directory and, thus, reused across
+    circuits and runs. With ``jobs > 1``, many gates that have not been synthesized before are distributed over a pool
+    of spawned worker processes, which re-import the ``__main__`` module of the calling script. Gates within
+    control-flow blocks, e.g., the body of a for loop, are synthesized as well. Single-qubit gates that are not part of
+    Qiskit's standard gates are kept as they are.
+
+    Arguments:
+        circuits: circuits to synthesize
+        jobs: number of worker processes (default: ``1``, i.e., everything runs in the current process)
+
+    Returns:
+        the synthesized circuits in the order of the input circuits
+    """
+    memo = _get_synthesis_memo()
+    gate_keys: set[GateKey] = set()
+    for qc in circuits:
+        _collect_gate_keys(qc, gate_keys)
+    missing = gate_keys.difference(memo.sequences)
+    if missing:
+        memo.add(_synthesize_gates(sorted(missing), jobs))
+
+    return [_replace_gates(qc, memo.sequences) for qc in circuits]
+
+
+def _collect_gate_keys(qc: QuantumCircuit, gate_keys: set[GateKey]) -> None:
+    """Adds the keys of all single-qubit gates of the circuit, including those within control-flow blocks."""
+    for instruction in qc.data:
+        operation = instruction.operation
+        if isinstance(operation, ControlFlowOp):
+            for block in operation.blocks:
+                _collect_gate_keys(block, gate_keys)
+        elif (gate_key := _get_gate_key(operation)) is not None:
+            gate_keys.add(gate_key)
+
+
+def _replace_gates(qc: QuantumCircuit, sequences: dict[GateKey, tuple[list[str], float]]) -> QuantumCircuit:
+    """Replaces all single-qubit gates of the circuit, including those within control-flow blocks, by their sequences."""
+    new_qc = qc.copy_empty_like()
+    for instruction in qc.data:
+        operation = instruction.operation
+        if isinstance(operation, ControlFlowOp):
+            blocks = [_replace_gates(block, sequences) for block in operation.blocks]
+            new_qc.append(instruction.replace(operation=operation.replace_blocks(blocks)), copy=False)
+            continue
+        gate_key = _get_gate_key(operation)
+        if gate_key is None:
+            new_qc.append(instruction, copy=False)
+            continue
+        gate_names, global_phase = sequences[gate_key]
+        append_instructions(new_qc, ((STANDARD_GATES[name], instruction.qubits, ()) for name in gate_names))
+        new_qc.global_phase += global_phase
+    return new_qc
+
+
+def _get_gate_key(operation: Operation) -> GateKey | None:
+    """Returns the name and parameters identifying a single-qubit gate or ``None`` for all other operations."""
+    if not isinstance(operation, Gate) or operation.num_qubits != 1 or operation.name not in _STANDARD_GATE_NAMES:
+        return None
+    return operation.name, tuple(float(param) for param in operation.params)
+
+
+def _synthesize_gates(gate_keys: list[GateKey], jobs: int | None) -> list[tuple[GateKey, tuple[list[str], float]]]:
+    """Synthesizes the gates, using a process pool if requested, there are enough gates and this is no worker process."""
+    if (
+        jobs is None
+        or jobs == 1
+        or len(gate_keys) < MIN_PARALLEL_SYNTHESES
+        or multiprocessing.parent_process() is not None
+    ):
+        return list(zip(gate_keys, map(_synthesize_gate, gate_keys)))
+
+    # Qiskit's internal thread pools do not survive a fork, hence, the workers are spawned
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+        chunksize = max(1, len(gate_keys) // (4 * jobs))
+        return list(zip(gate_keys, executor.map(_synthesize_gate, gate_keys, chunksize=chunksize)))
+
+
+def _synthesize_gate(gate_key: GateKey) -> tuple[list[str], float]:
+    """Synthesizes a single-qubit gate and returns the names of the approximating gates and the global phase."""
+    name, params = gate_key
+    gate = get_standard_gate_name_mapping()[name].base_class(*params)
+    approximation = _get_solovay_kitaev_decomposition().run(
+        gate.to_matrix(), SOLOVAY_KITAEV_RECURSION_DEGREE, check_input=False
+    )
+    return [instruction.operation.name for instruction in approximation.data], float(approximation.global_phase)
+
+
+@cache
+def _get_solovay_kitaev_decomposition() -> SolovayKitaevDecomposition:
+    """Returns the Solovay-Kitaev decomposition; cached forever by functools.cache."""
+    return SolovayKitaevDecomposition(load_basic_approximations())
+
+
+class _SynthesisMemo:
+    """Synthesized single-qubit gates that are persisted as a JSON Lines file with one gate per line.
+
+    New gates are appended to the file, so that adding gates never rewrites the gates stored before and processes
+    synthesizing gates concurrently do not overwrite each other's gates.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.sequences: dict[GateKey, tuple[list[str], float]] = dict(self._read())
+
+    def _read(self) -> list[tuple[GateKey, tuple[list[str], float]]]:
+        entries = []
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        name, params, gate_names, phase = json.loads(line)
+                    except (ValueError, TypeError):
+                        # e.g., an empty line or one that is still being written by another process
+                        continue
+                    entries.append(((name, tuple(params)), (gate_names, phase)))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable synthesis memo %s.", self.path)
+        return entries
+
+    def add(self, entries: list[tuple[GateKey, tuple[list[str], float]]]) -> None:
+        """Adds synthesized gates and appends them to the file."""
+        self.sequences.update(entries)
+        # the leading line break terminates a line left incomplete by an interrupted writer
+        lines = "\n" + "".join(
+            json.dumps([name, list(params), gate_names, phase]) + "\n"
+            for (name, params), (gate_names, phase) in entries
+        )
+
+        # append all lines with a single write, so that concurrent writers do not interleave them
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, lines.encode())
+            finally:
+                os.close(fd)
+        except OSError:
+            logger.warning("Synthesized gates cannot be stored in %s.", self.path)
+
+
+@cache
+def _get_synthesis_memo() -> _SynthesisMemo:
+    """Returns the memo of synthesized gates; cached forever by functools.cache."""
+    basis = "_".join(SOLOVAY_KITAEV_BASIS_GATES)
+    name = f"{basis}_depth{SOLOVAY_KITAEV_DEPTH}_recursion{SOLOVAY_KITAEV_RECURSION_DEGREE}_sequences.jsonl"
+    return _SynthesisMemo(get_user_cache_dir() / "solovay_kitaev" / name)
+
+
+def load_basic_approximations(
+    basis_gates: Sequence[str] = SOLOVAY_KITAEV_BASIS_GATES,
+    depth: int = SOLOVAY_KITAEV_DEPTH,
+    directory: str | Path | None = None,
+) -> dict[str, tuple[np.ndarray, float]]:
+    """Loads the basic approximations of the Solovay-Kitaev algorithm and generates them on first use.
+
+    Generating the approximations takes a few seconds, hence, they are stored as a ``.npy`` file per basis and depth.
+    The file is memory-mapped when loading, so that all processes using it share the same pages.
+
+    Arguments:
+        basis_gates: names of the single-qubit gates the approximations consist of
+        depth: maximum number of gates of a basic approximation
+        directory: directory of the stored approximations (default: "solovay_kitaev" in the user cache directory)
+
+    Returns:
+        the SO(3) matrix and global phase of each approximation keyed by its space-separated gate names
+    """
+    directory = Path(directory) if directory is not None else get_user_cache_dir() / "solovay_kitaev"
+    path = directory / f"{'_'.join(basis_gates)}_depth{depth}.npy"
+
+    try:
+        table = np.load(path, mmap_mode="r")
+    except FileNotFoundError:
+        table = _generate_basic_approximations(basis_gates, depth, path)
+    except ValueError:
+        logger.warning("Regenerating unreadable basic approximations %s.", path)
+        table = _generate_basic_approximations(basis_gates, depth, path)
+
+    return {
+        str(label): (product, float(phase))
+        for label, product, phase in zip(table["label"], table["product"], table["phase"])
+    }
+
+
+def _generate_basic_approximations(basis_gates: Sequence[str], depth: int, path: Path) -> np.ndarray:
+    """Generates the basic approximations and stores them as a structured array in the given file."""
+    sequences = generate_basic_approximations(list(basis_gates), depth)
+    max_label_length = max(len(sequence.name) for sequence in sequences)
+    table = np.empty(
+        len(sequences), dtype=[("label", f"U{max_label_length}"), ("product", "f8", (3, 3)), ("phase", "f8")]
+    )
+    for i, sequence in enumerate(sequences):
+        table[i] = (sequence.name, sequence.product, sequence.global_phase)
+
+    # write to a temporary file first so that concurrent readers never see partial files
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, table)
+        Path(tmp_name).replace(path)
+    except OSError:
+        logger.warning("Basic approximations cannot be stored in %s.", path)
+    return table
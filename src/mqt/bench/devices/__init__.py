@@ -15,60 +15,79 @@ See README.md or go to https://github.com/cda-tum/mqt-bench for more information
 from __future__ import annotations
 
 from functools import cache
+from importlib import import_module
+from typing import Any, cast
 
 from .calibration import DeviceCalibration
 from .device import Device, Gateset
-from .ibm import IBMMontreal, IBMTorino, IBMWashington
-from .ionq import IonQAria1, IonQHarmony
-from .iqm import IQMAdonis, IQMApollo
-from .oqc import OQCLucy
-from .quantinuum import QuantinuumH2
-from .rigetti import RigettiAspenM3
+
+# device classes by device name in the order of `get_available_devices`, which are only imported once a device is
+# requested, so that, e.g., the IBM fake backends are not loaded for other devices
+_DEVICE_CLASSES = {
+    "ibm_torino": "ibm:IBMTorino",
+    "ibm_montreal": "ibm:IBMMontreal",
+    "ibm_washington": "ibm:IBMWashington",
+    "ionq_aria1": "ionq:IonQAria1",
+    "ionq_harmony": "ionq:IonQHarmony",
+    "iqm_adonis": "iqm:IQMAdonis",
+    "iqm_apollo": "iqm:IQMApollo",
+    "oqc_lucy": "oqc:OQCLucy",
+    "quantinuum_h2": "quantinuum:QuantinuumH2",
+    "rigetti_aspen_m3": "rigetti:RigettiAspenM3",
+}
+
+# first device providing each native gateset (in the order of `get_available_native_gatesets`)
+_GATESET_DEVICES = {
+    "ibm_heron_r1": "ibm_torino",
+    "ibm_falcon": "ibm_montreal",
+    "ionq": "ionq_aria1",
+    "iqm": "iqm_adonis",
+    "oqc": "oqc_lucy",
+    "quantinuum": "quantinuum_h2",
+    "rigetti": "rigetti_aspen_m3",
+}
 
 
 @cache
 def get_available_devices() -> list[Device]:
     """Get a list of all available devices."""
-    return [
-        IBMTorino(),
-        IBMMontreal(),
-        IBMWashington(),
-        IonQAria1(),
-        IonQHarmony(),
-        IQMAdonis(),
-        IQMApollo(),
-        OQCLucy(),
-        QuantinuumH2(),
-        RigettiAspenM3(),
-    ]
+    return [get_device_by_name(device_name) for device_name in _DEVICE_CLASSES]
 
 
 @cache
 def get_available_device_names() -> list[str]:
     """Get a list of all available device names."""
-    return [device.name for device in get_available_devices()]
-
-
-@cache
-def _device_map() -> dict[str, Device]:
-    """One-time build of name → Device map.
-
-    Cached forever by functools.cache.
-    """
-    return {d.name: d for d in get_available_devices()}
+    return list(_DEVICE_CLASSES)
 
 
 def get_device_by_name(device_name: str) -> Device:
     """Get a device by its name.
 
+    Only the module of the requested device is imported and only the requested device is created (once).
+
     Arguments:
         device_name: the name of the device
     """
-    try:
-        return _device_map()[device_name]
-    except KeyError:
+    if device_name not in _DEVICE_CLASSES:
         msg = f"Device {device_name} not found in available devices."
-        raise ValueError(msg) from None
+        raise ValueError(msg)
+    return _create_device(device_name)
+
+
+@cache
+def _create_device(device_name: str) -> Device:
+    module_name, _, class_name = _DEVICE_CLASSES[device_name].partition(":")
+    return cast("Device", getattr(import_module(f".{module_name}", __name__), class_name)())
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the device classes, e.g., ``IBMWashington``, lazily on first access."""
+    for device_class in _DEVICE_CLASSES.values():
+        module_name, _, class_name = device_class.partition(":")
+        if class_name == name:
+            return getattr(import_module(f".{module_name}", __name__), class_name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 __all__ = [
@@ -88,53 +107,50 @@ def get_available_native_gatesets() -> list[Gateset]:
     for device in get_available_devices():
         if device.gateset not in available_gatesets:
             available_gatesets.append(device.gateset)
-    available_gatesets.append(
-        Gateset(
-            "clifford+t",
-            [
-                "i",
-                "x",
-                "y",
-                "z",
-                "h",
-                "s",
-                "sdg",
-                "t",
-                "tdg",
-                "sx",
-                "sxdg",
-                "cx",
-                "cy",
-                "cz",
-                "swap",
-                "iswap",
-                "dcx",
-                "ecr",
-                "measure",
-                "barrier",
-            ],
-        )
-    )
+    available_gatesets.append(_get_clifford_t_gateset())
     return available_gatesets
 
 
 @cache
-def _native_gateset_map() -> dict[str, Gateset]:
-    """One-time build of name → Gateset map.
-
-    Cached forever by functools.cache.
-    """
-    return {g.name: g for g in get_available_native_gatesets()}
+def _get_clifford_t_gateset() -> Gateset:
+    return Gateset(
+        "clifford+t",
+        [
+            "i",
+            "x",
+            "y",
+            "z",
+            "h",
+            "s",
+            "sdg",
+            "t",
+            "tdg",
+            "sx",
+            "sxdg",
+            "cx",
+            "cy",
+            "cz",
+            "swap",
+            "iswap",
+            "dcx",
+            "ecr",
+            "measure",
+            "barrier",
+        ],
+    )
 
 
 def get_native_gateset_by_name(gateset_name: str) -> Gateset:
     """Get a native gateset by its name.
 
+    Only the device providing the gateset is created (see `get_device_by_name`).
+
     Arguments:
         gateset_name: the name of the gateset
     """
-    try:
-        return _native_gateset_map()[gateset_name]
-    except KeyError:
+    if gateset_name == "clifford+t":
+        return _get_clifford_t_gateset()
+    if gateset_name not in _GATESET_DEVICES:
         msg = f"Gateset {gateset_name} not found in available gatesets."
-        raise ValueError(msg) from None
+        raise ValueError(msg)
+    return get_device_by_name(_GATESET_DEVICES[gateset_name]).gateset
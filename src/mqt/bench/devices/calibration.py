@@ -10,15 +10,150 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import cached_property
 from importlib import resources
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass(frozen=True)
+class CalibrationArrays:
+    """Array representation of the calibration data of a device for vectorized lookups.
+
+    Missing values are NaN. Gates are identified by their index in ``gate_names`` (for single- and two-qubit gates
+    alike) and qubit pairs by their index in the edge index, which is stored in the compressed sparse row (CSR) format:
+    the pairs starting at qubit ``q`` are ``(q, edge_targets[i])`` for ``edge_offsets[q] <= i < edge_offsets[q + 1]``
+    with the targets in ascending order.
+
+    Attributes:
+        gate_names: names of all gates with calibration data
+        single_qubit_gate_fidelity: single-qubit fidelity indexed by ``[gate_id, qubit]``
+        single_qubit_gate_duration: single-qubit gate duration indexed by ``[gate_id, qubit]``
+        two_qubit_gate_fidelity: two-qubit fidelity indexed by ``[gate_id, edge_id]``
+        two_qubit_gate_duration: two-qubit gate duration indexed by ``[gate_id, edge_id]``
+        edge_offsets: offsets of the qubit pairs starting at each qubit, of length ``num_qubits + 1``
+        edge_targets: second qubit of each qubit pair
+        readout_fidelity: readout fidelity indexed by qubit
+        readout_duration: readout duration indexed by qubit
+        t1: T1 time indexed by qubit
+        t2: T2 time indexed by qubit
+    """
+
+    gate_names: tuple[str, ...]
+    single_qubit_gate_fidelity: NDArray[np.float64]
+    single_qubit_gate_duration: NDArray[np.float64]
+    two_qubit_gate_fidelity: NDArray[np.float64]
+    two_qubit_gate_duration: NDArray[np.float64]
+    edge_offsets: NDArray[np.int64]
+    edge_targets: NDArray[np.int64]
+    readout_fidelity: NDArray[np.float64]
+    readout_duration: NDArray[np.float64]
+    t1: NDArray[np.float64]
+    t2: NDArray[np.float64]
+
+    @property
+    def num_qubits(self) -> int:
+        """Number of qubits covered by the arrays."""
+        return len(self.edge_offsets) - 1
+
+    @cached_property
+    def _edge_keys(self) -> NDArray[np.int64]:
+        # the qubit pairs ordered by first and second qubit are sorted by the key first * num_qubits + second
+        first_qubits = np.repeat(np.arange(self.num_qubits, dtype=np.int64), np.diff(self.edge_offsets))
+        return first_qubits * self.num_qubits + self.edge_targets
+
+    @cached_property
+    def _gate_ids(self) -> dict[str, int]:
+        return {name: gate_id for gate_id, name in enumerate(self.gate_names)}
+
+    def get_gate_ids(self, gate_types: Iterable[str]) -> NDArray[np.int64]:
+        """Get the ids of the given gates (raises a ``ValueError`` for gates without calibration data)."""
+        gate_types = list(gate_types)
+        unknown = sorted(set(gate_types).difference(self._gate_ids))
+        if unknown:
+            msg = f"Calibration data for gates {unknown} not available."
+            raise ValueError(msg)
+        return np.array([self._gate_ids[gate_type] for gate_type in gate_types], dtype=np.int64)
+
+    def get_edge_ids(self, qubits1: ArrayLike, qubits2: ArrayLike) -> NDArray[np.int64]:
+        """Get the ids of the qubit pairs in the edge index, which are -1 for pairs without calibration data."""
+        qubits1, qubits2 = np.broadcast_arrays(np.asarray(qubits1, dtype=np.int64), np.asarray(qubits2, dtype=np.int64))
+        if not len(self._edge_keys):
+            return np.full(qubits1.shape, -1, dtype=np.int64)
+        num_qubits = self.num_qubits
+        valid = (qubits1 >= 0) & (qubits1 < num_qubits) & (qubits2 >= 0) & (qubits2 < num_qubits)
+        keys = qubits1 * num_qubits + qubits2
+        edge_ids = np.minimum(np.searchsorted(self._edge_keys, keys), len(self._edge_keys) - 1)
+        return np.where(valid & (self._edge_keys[edge_ids] == keys), edge_ids, -1)
+
+    @classmethod
+    def from_calibration(cls, calibration: DeviceCalibration) -> CalibrationArrays:
+        """Build the arrays from the dictionaries of the calibration data."""
+        single_qubit_tables = (calibration.single_qubit_gate_fidelity, calibration.single_qubit_gate_duration)
+        two_qubit_tables = (calibration.two_qubit_gate_fidelity, calibration.two_qubit_gate_duration)
+        qubit_tables = (calibration.readout_fidelity, calibration.readout_duration, calibration.t1, calibration.t2)
+
+        gate_names = sorted({
+            gate_type
+            for table in (*single_qubit_tables, *two_qubit_tables)
+            for row in table.values()
+            for gate_type in row
+        })
+        edges = sorted({(int(edge[0]), int(edge[1])) for table in two_qubit_tables for edge in table})
+        qubits = {qubit for table in (*single_qubit_tables, *qubit_tables) for qubit in table}
+        qubits.update(qubit for edge in edges for qubit in edge)
+        num_qubits = max(qubits) + 1 if qubits else 0
+
+        gate_ids = {gate_type: gate_id for gate_id, gate_type in enumerate(gate_names)}
+        edge_ids = {edge: edge_id for edge_id, edge in enumerate(edges)}
+
+        def gate_array(table: Mapping[int, Mapping[str, float]], size: int) -> NDArray[np.float64]:
+            values = np.full((len(gate_names), size), np.nan)
+            for index, row in table.items():
+                for gate_type, value in row.items():
+                    values[gate_ids[gate_type], index] = value
+            return values
+
+        def qubit_array(table: Mapping[int, float]) -> NDArray[np.float64]:
+            values = np.full(num_qubits, np.nan)
+            values[list(table)] = list(table.values())
+            return values
+
+        def edge_table(table: Mapping[tuple[int, ...], Mapping[str, float]]) -> dict[int, Mapping[str, float]]:
+            return {edge_ids[int(edge[0]), int(edge[1])]: row for edge, row in table.items()}
+
+        first_qubits = np.array([edge[0] for edge in edges], dtype=np.int64)
+        return cls(
+            gate_names=tuple(gate_names),
+            single_qubit_gate_fidelity=gate_array(calibration.single_qubit_gate_fidelity, num_qubits),
+            single_qubit_gate_duration=gate_array(calibration.single_qubit_gate_duration, num_qubits),
+            two_qubit_gate_fidelity=gate_array(edge_table(calibration.two_qubit_gate_fidelity), len(edges)),
+            two_qubit_gate_duration=gate_array(edge_table(calibration.two_qubit_gate_duration), len(edges)),
+            edge_offsets=np.searchsorted(first_qubits, np.arange(num_qubits + 1)).astype(np.int64),
+            edge_targets=np.array([edge[1] for edge in edges], dtype=np.int64),
+            readout_fidelity=qubit_array(calibration.readout_fidelity),
+            readout_duration=qubit_array(calibration.readout_duration),
+            t1=qubit_array(calibration.t1),
+            t2=qubit_array(calibration.t2),
+        )
 
 
 @dataclass
 class DeviceCalibration:
     """Calibration data for a (generic) device.
 
+    The array representation of the calibration data (see `arrays`) is built from the tables on first access, hence,
+    `reset_arrays` must be called after modifying the tables. Conversely, the tables of calibrations built by
+    `from_arrays` are built from the arrays on first access.
+
     Attributes:
         single_qubit_gate_fidelity: single-qubit fidelity for each qubit and gate
         single_qubit_gate_duration: single-qubit gate duration for each qubit and gate
@@ -38,6 +173,103 @@ class DeviceCalibration:
     readout_duration: dict[int, float] = field(default_factory=dict)
     t1: dict[int, float] = field(default_factory=dict)
     t2: dict[int, float] = field(default_factory=dict)
+    _arrays: CalibrationArrays | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def arrays(self) -> CalibrationArrays:
+        """Array representation of the calibration data, which is built on first access (see `reset_arrays`)."""
+        if self._arrays is None:
+            self._arrays = CalibrationArrays.from_calibration(self)
+        return self._arrays
+
+    def reset_arrays(self) -> None:
+        """Discard the array representation, which is required after modifying the tables (it is rebuilt on access)."""
+        for name in _TABLE_NAMES:
+            getattr(self, name)  # build the tables that were not accessed yet before the arrays are discarded
+        self._arrays = None
+
+    @classmethod
+    def from_arrays(cls, arrays: CalibrationArrays) -> DeviceCalibration:
+        """Build the calibration data from its array representation (the inverse of `CalibrationArrays.from_calibration`).
+
+        The tables are built from the arrays on first access, so that lookups through the array representation never
+        pay for them. Qubits and qubit pairs without any value in a table, e.g., an empty dictionary of gates, are not
+        restored.
+        """
+        calibration = cls.__new__(cls)
+        calibration._arrays = arrays  # noqa: SLF001
+        return calibration
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+            """Build a table of a calibration created by `from_arrays` from the arrays on first access."""
+            if name not in _TABLE_NAMES or self._arrays is None:
+                msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+                raise AttributeError(msg)
+            table = _build_table(self._arrays, name)
+            setattr(self, name, table)
+            return table
+
+    def get_single_qubit_gate_fidelity_many(self, gate_ids: ArrayLike, qubits: ArrayLike) -> NDArray[np.float64]:
+        """Get the single-qubit fidelities for arrays of gates and qubits, which are broadcast against each other.
+
+        Arguments:
+        gate_ids: ids of the gates (see `CalibrationArrays.get_gate_ids`)
+        qubits: indices of the qubits
+        """
+        return _lookup(self.arrays.single_qubit_gate_fidelity, gate_ids, qubits, "Single-qubit fidelity")
+
+    def get_single_qubit_gate_duration_many(self, gate_ids: ArrayLike, qubits: ArrayLike) -> NDArray[np.float64]:
+        """Get the single-qubit durations for arrays of gates and qubits, which are broadcast against each other.
+
+        Arguments:
+        gate_ids: ids of the gates (see `CalibrationArrays.get_gate_ids`)
+        qubits: indices of the qubits
+        """
+        return _lookup(self.arrays.single_qubit_gate_duration, gate_ids, qubits, "Single-qubit duration")
+
+    def get_two_qubit_gate_fidelity_many(
+        self, gate_ids: ArrayLike, qubits1: ArrayLike, qubits2: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Get the two-qubit fidelities for arrays of gates and qubit pairs, which are broadcast against each other.
+
+        Arguments:
+        gate_ids: ids of the gates (see `CalibrationArrays.get_gate_ids`)
+        qubits1: indices of the first qubits
+        qubits2: indices of the second qubits
+        """
+        edge_ids = self.arrays.get_edge_ids(qubits1, qubits2)
+        return _lookup(self.arrays.two_qubit_gate_fidelity, gate_ids, edge_ids, "Two-qubit fidelity")
+
+    def get_two_qubit_gate_duration_many(
+        self, gate_ids: ArrayLike, qubits1: ArrayLike, qubits2: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Get the two-qubit durations for arrays of gates and qubit pairs, which are broadcast against each other.
+
+        Arguments:
+        gate_ids: ids of the gates (see `CalibrationArrays.get_gate_ids`)
+        qubits1: indices of the first qubits
+        qubits2: indices of the second qubits
+        """
+        edge_ids = self.arrays.get_edge_ids(qubits1, qubits2)
+        return _lookup(self.arrays.two_qubit_gate_duration, gate_ids, edge_ids, "Two-qubit duration")
+
+    def get_readout_fidelity_many(self, qubits: ArrayLike) -> NDArray[np.float64]:
+        """Get the readout fidelities for an array of qubits."""
+        return _lookup(self.arrays.readout_fidelity[np.newaxis], 0, qubits, "Readout fidelity")
+
+    def get_readout_duration_many(self, qubits: ArrayLike) -> NDArray[np.float64]:
+        """Get the readout durations for an array of qubits."""
+        return _lookup(self.arrays.readout_duration[np.newaxis], 0, qubits, "Readout duration")
+
+    def get_t1_many(self, qubits: ArrayLike) -> NDArray[np.float64]:
+        """Get the T1 times for an array of qubits."""
+        return _lookup(self.arrays.t1[np.newaxis], 0, qubits, "T1")
+
+    def get_t2_many(self, qubits: ArrayLike) -> NDArray[np.float64]:
+        """Get the T2 times for an array of qubits."""
+        return _lookup(self.arrays.t2[np.newaxis], 0, qubits, "T2")
 
     def get_single_qubit_gate_fidelity(self, gate_type: str, qubit: int) -> float:
         """Get the single-qubit fidelity for a given gate type and qubit.
@@ -246,6 +478,40 @@ class DeviceCalibration:
         return sum(self.readout_duration.values()) / len(self.readout_duration)
 
 
+_TABLE_NAMES = frozenset(field.name for field in fields(DeviceCalibration) if field.name != "_arrays")
+
+
+def _build_table(arrays: CalibrationArrays, name: str) -> Any:  # noqa: ANN401
+    """Build the table ``name`` of `DeviceCalibration` from the array representation."""
+    values = getattr(arrays, name)
+    if values.ndim == 1:
+        qubits = np.flatnonzero(~np.isnan(values))
+        return dict(zip(qubits.tolist(), values[qubits].tolist()))
+
+    keys: Sequence[Any] = range(arrays.num_qubits)
+    if name.startswith("two_qubit"):
+        first_qubits = np.repeat(np.arange(arrays.num_qubits, dtype=np.int64), np.diff(arrays.edge_offsets))
+        keys = list(zip(first_qubits.tolist(), arrays.edge_targets.tolist()))
+    table: dict[Any, dict[str, float]] = {}
+    indices, gate_ids = np.nonzero(~np.isnan(values.T))
+    for index, gate_id, value in zip(indices.tolist(), gate_ids.tolist(), values[gate_ids, indices].tolist()):
+        table.setdefault(keys[index], {})[arrays.gate_names[gate_id]] = value
+    return table
+
+
+def _lookup(values: NDArray[np.float64], rows: ArrayLike, columns: ArrayLike, description: str) -> NDArray[np.float64]:
+    """Look up ``values[rows, columns]`` and raise a ``ValueError`` if any of the values is not available."""
+    rows, columns = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(columns, dtype=np.int64))
+    valid = (rows >= 0) & (rows < values.shape[0]) & (columns >= 0) & (columns < values.shape[1])
+    result = np.full(rows.shape, np.nan)
+    result[valid] = values[rows[valid], columns[valid]]
+    missing = np.isnan(result)
+    if missing.any():
+        msg = f"{description} not available for {np.count_nonzero(missing)} of the requested values."
+        raise ValueError(msg)
+    return result
+
+
 def get_device_calibration_path(filename: str) -> Path:
     """Get the path to the calibration file for a device."""
     calibration_path = resources.files("mqt.bench") / "calibration_files" / f"{filename}_calibration.json"
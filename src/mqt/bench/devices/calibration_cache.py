@@ -0,0 +1,217 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Binary cache of the normalized calibration data of devices whose calibration is read from JSON files.
+
+After a device read its JSON file once, the device properties and the array representation of its calibration data
+are stored in a binary file in the "calibrations" directory of the user cache directory (see
+`mqt.bench.cache.get_user_cache_dir`). The file is keyed by the path, modification time and size of the JSON file, so
+that modified or user-supplied calibration files never return stale data, and subsequent processes map the arrays
+from the file instead of reading, parsing and normalizing the JSON data again.
+
+A cache file consists of a single line with a JSON header, which holds the device properties and the data type and
+shape of each array, followed by the raw data of the arrays in the order of the header.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+from abc import abstractmethod
+from dataclasses import dataclass, fields
+from functools import cache, cached_property
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from mqt.bench.cache import get_user_cache_dir
+
+from .calibration import CalibrationArrays, DeviceCalibration
+from .device import Device, Gateset
+
+logger = logging.getLogger(__name__)
+
+# version of the layout of the cache files, which is part of their key
+CACHE_FORMAT_VERSION = 2
+
+_ARRAY_FIELDS = tuple(field.name for field in fields(CalibrationArrays) if field.name != "gate_names")
+
+
+@dataclass(frozen=True)
+class CachedCalibration:
+    """Device properties and normalized calibration data stored in the calibration cache.
+
+    Attributes:
+        name: name of the device
+        gateset: native gateset of the device
+        num_qubits: number of qubits of the device
+        coupling_map: coupling map of the device
+        arrays: array representation of the calibration data of the device
+    """
+
+    name: str
+    gateset: Gateset
+    num_qubits: int
+    coupling_map: list[list[int]]
+    arrays: CalibrationArrays
+
+
+def get_calibration_cache_path(calibration_path: Path) -> Path:
+    """Get the path of the cache file for a JSON calibration file.
+
+    The file is keyed by the absolute path, the modification time and the size of the JSON file, which, unlike a hash
+    of its content, does not require reading it. The format version of the cache and the version of mqt.bench are part
+    of the key as well, so that changes of the normalization of the calibration data never return stale data.
+    """
+    calibration_path = calibration_path.absolute()
+    stat = calibration_path.stat()
+    key = f"{calibration_path}|{stat.st_mtime_ns}|{stat.st_size}|{CACHE_FORMAT_VERSION}|{_get_version()}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+    return get_user_cache_dir() / "calibrations" / f"{calibration_path.stem}_{digest}.bin"
+
+
+@cache
+def _get_version() -> str:
+    try:
+        return metadata.version("mqt.bench")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _encode(cached: CachedCalibration) -> bytes:
+    """Encode the cached calibration data as a JSON header line followed by the raw data of the arrays."""
+    arrays = {
+        "coupling_map": np.array(cached.coupling_map, dtype=np.int64).reshape(-1, 2),
+        **{name: np.ascontiguousarray(getattr(cached.arrays, name)) for name in _ARRAY_FIELDS},
+    }
+    header = {
+        "name": cached.name,
+        "gateset": [cached.gateset.name, list(cached.gateset.gates)],
+        "num_qubits": cached.num_qubits,
+        "gate_names": list(cached.arrays.gate_names),
+        "arrays": [[name, values.dtype.str, list(values.shape)] for name, values in arrays.items()],
+    }
+    return b"".join([json.dumps(header).encode(), b"\n", *(values.tobytes() for values in arrays.values())])
+
+
+def _decode(data: bytes) -> CachedCalibration:
+    """Decode cached calibration data (raises a ``ValueError``, ``KeyError`` or ``TypeError`` for malformed data)."""
+    header_end = data.index(b"\n")
+    header = json.loads(data[:header_end])
+    offset = header_end + 1
+    arrays: dict[str, np.ndarray[Any, Any]] = {}
+    for name, dtype, shape in header["arrays"]:
+        # the arrays are read-only views of the data
+        values = np.frombuffer(data, dtype=dtype, count=math.prod(shape), offset=offset).reshape(shape)
+        offset += values.nbytes
+        arrays[name] = values
+    if offset != len(data):
+        msg = "Trailing data after the arrays."
+        raise ValueError(msg)
+    gateset_name, gateset_gates = header["gateset"]
+    return CachedCalibration(
+        name=header["name"],
+        gateset=Gateset(gateset_name, gateset_gates),
+        num_qubits=header["num_qubits"],
+        coupling_map=arrays["coupling_map"].tolist(),
+        arrays=CalibrationArrays(
+            gate_names=tuple(header["gate_names"]), **{name: arrays[name] for name in _ARRAY_FIELDS}
+        ),
+    )
+
+
+def load_cached_calibration(calibration_path: Path) -> CachedCalibration | None:
+    """Load the cached calibration data for a JSON calibration file, or ``None`` if it is not cached (yet)."""
+    path = get_calibration_cache_path(calibration_path)
+    try:
+        return _decode(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable calibration cache entry %s.", path)
+        return None
+
+
+def save_cached_calibration(calibration_path: Path, cached: CachedCalibration) -> None:
+    """Store the calibration data for a JSON calibration file in the cache (errors are logged and ignored)."""
+    path = get_calibration_cache_path(calibration_path)
+    data = _encode(cached)
+    # write to a temporary file first so that concurrent readers never see partial files
+    tmp_name: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        Path(tmp_name).replace(path)
+        tmp_name = None
+    except OSError:
+        logger.warning("Calibration data cannot be cached in %s.", path)
+    finally:
+        if tmp_name is not None:  # the temporary file was not moved into place
+            with contextlib.suppress(OSError):
+                Path(tmp_name).unlink()
+
+
+class JSONCalibrationDevice(Device):
+    """Device whose properties and calibration data are read from a JSON file, with the results being cached.
+
+    Subclasses set the device properties in `read_properties` and build the calibration data in
+    `read_json_calibration`, both from `json_calibration`. These methods are only called if the JSON file is not
+    cached yet, so that, e.g., the warnings emitted while normalizing the data only occur on the first read.
+    """
+
+    def __init__(self, calibration_path: Path) -> None:
+        """Initialize the device from the calibration cache or, if it is not cached, from the JSON file."""
+        self.calibration_path = calibration_path
+        self.calibration = None
+        self._cached = load_cached_calibration(calibration_path)
+        if self._cached is None:
+            self.read_properties()
+        else:
+            self.name = self._cached.name
+            self.gateset = self._cached.gateset
+            self.num_qubits = self._cached.num_qubits
+            self.coupling_map = self._cached.coupling_map  # freshly decoded for each device
+
+    @cached_property
+    def json_calibration(self) -> Any:  # noqa: ANN401
+        """Content of the JSON calibration file, which is only read on first access."""
+        with self.calibration_path.open(encoding="utf-8") as json_file:
+            return json.load(json_file)
+
+    @abstractmethod
+    def read_properties(self) -> None:
+        """Set the name, gateset, number of qubits and coupling map of the device from the JSON data."""
+
+    @abstractmethod
+    def read_json_calibration(self) -> DeviceCalibration:
+        """Build the calibration data of the device from the JSON data."""
+
+    def read_calibration(self) -> None:
+        """Read the calibration data for the device from the calibration cache or, if it is not cached, the JSON file."""
+        if self._cached is None:
+            calibration = self.read_json_calibration()
+            self._cached = CachedCalibration(
+                name=self.name,
+                gateset=self.gateset,
+                num_qubits=self.num_qubits,
+                coupling_map=[list(edge) for edge in self.coupling_map],
+                arrays=calibration.arrays,
+            )
+            save_cached_calibration(self.calibration_path, self._cached)
+            self.calibration = calibration
+        else:
+            self.calibration = DeviceCalibration.from_arrays(self._cached.arrays)
@@ -210,3 +210,5 @@ class Device(ABC):
                     or self.calibration.two_qubit_gate_fidelity[tuple(edge)][gate] == 0
                 ):
                     self.calibration.two_qubit_gate_fidelity[tuple(edge)][gate] = avg_fidelity
+
+        self.calibration.reset_arrays()
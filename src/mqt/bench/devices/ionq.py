@@ -10,32 +10,30 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, TypedDict, cast
+from typing import TypedDict, cast
 
 from .calibration import DeviceCalibration, get_device_calibration_path
-from .device import Device, Gateset
+from .calibration_cache import JSONCalibrationDevice
+from .device import Gateset
 
-if TYPE_CHECKING:
-    from pathlib import Path
 
-
-class IonQDevice(Device):
+class IonQDevice(JSONCalibrationDevice):
     """IonQ device."""
 
-    def __init__(self, calibration_path: Path) -> None:
-        """Initialize the IonQ device."""
-        with calibration_path.open() as json_file:
-            self.ionq_calibration = cast("IonQCalibration", json.load(json_file))
-        self.calibration = None
+    @property
+    def ionq_calibration(self) -> IonQCalibration:
+        """Content of the calibration file of the device."""
+        return cast("IonQCalibration", self.json_calibration)
 
+    def read_properties(self) -> None:
+        """Set the properties of the device from the calibration file."""
         self.name = self.ionq_calibration["name"]
         self.gateset = Gateset("ionq", self.ionq_calibration["basis_gates"])
         self.num_qubits = self.ionq_calibration["num_qubits"]
         self.coupling_map = list(self.ionq_calibration["connectivity"])
 
-    def read_calibration(self) -> None:
-        """Read the calibration data for the device."""
+    def read_json_calibration(self) -> DeviceCalibration:
+        """Build the calibration data for the device from the calibration file."""
         calibration = DeviceCalibration()
         for qubit in range(self.num_qubits):
             calibration.single_qubit_gate_fidelity[qubit] = dict.fromkeys(
@@ -56,7 +54,7 @@ class IonQDevice(Device):
                 "rxx": self.ionq_calibration["fidelity"]["2q"]["mean"]
             }
             calibration.two_qubit_gate_duration[qubit1, qubit2] = {"rxx": self.ionq_calibration["timing"]["2q"]}
-        self.calibration = calibration
+        return calibration
 
 
 class IonQHarmony(IonQDevice):
@@ -10,32 +10,30 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, TypedDict, cast
+from typing import TypedDict, cast
 
 from .calibration import DeviceCalibration, get_device_calibration_path
-from .device import Device, Gateset
+from .calibration_cache import JSONCalibrationDevice
+from .device import Gateset
 
-if TYPE_CHECKING:
-    from pathlib import Path
 
-
-class IQMDevice(Device):
+class IQMDevice(JSONCalibrationDevice):
     """IQM device."""
 
-    def __init__(self, calibration_path: Path) -> None:
-        """Initialize the device."""
-        with calibration_path.open() as json_file:
-            self.iqm_calibration = cast("IQMCalibration", json.load(json_file))
-        self.calibration = None
+    @property
+    def iqm_calibration(self) -> IQMCalibration:
+        """Content of the calibration file of the device."""
+        return cast("IQMCalibration", self.json_calibration)
 
+    def read_properties(self) -> None:
+        """Set the properties of the device from the calibration file."""
         self.name = self.iqm_calibration["name"]
         self.gateset = Gateset("iqm", self.iqm_calibration["basis_gates"])
         self.num_qubits = self.iqm_calibration["num_qubits"]
         self.coupling_map = list(self.iqm_calibration["connectivity"])
 
-    def read_calibration(self) -> None:
-        """Read the calibration data for the device."""
+    def read_json_calibration(self) -> DeviceCalibration:
+        """Build the calibration data for the device from the calibration file."""
         calibration = DeviceCalibration()
         for qubit in range(self.num_qubits):
             calibration.single_qubit_gate_fidelity[qubit] = dict.fromkeys(
@@ -64,7 +62,7 @@ class IQMDevice(Device):
             calibration.two_qubit_gate_fidelity[qubit2, qubit1] = calibration.two_qubit_gate_fidelity[qubit1, qubit2]
             calibration.two_qubit_gate_duration[qubit2, qubit1] = calibration.two_qubit_gate_duration[qubit1, qubit2]
 
-        self.calibration = calibration
+        return calibration
 
 
 class IQMAdonis(IQMDevice):
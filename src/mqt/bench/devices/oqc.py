@@ -10,29 +10,34 @@
 
 from __future__ import annotations
 
-import json
 from typing import TypedDict, cast
 
 from .calibration import DeviceCalibration, get_device_calibration_path
-from .device import Device, Gateset
+from .calibration_cache import JSONCalibrationDevice
+from .device import Gateset
 
 
-class OQCLucy(Device):
+class OQCLucy(JSONCalibrationDevice):
     """OQC Lucy device."""
 
     def __init__(self) -> None:
         """Initialize the OQC device."""
-        with get_device_calibration_path("oqc_lucy").open() as json_file:
-            self.oqc_calibration = cast("OQCCalibration", json.load(json_file))
-        self.calibration = None
+        super().__init__(get_device_calibration_path("oqc_lucy"))
 
+    @property
+    def oqc_calibration(self) -> OQCCalibration:
+        """Content of the calibration file of the device."""
+        return cast("OQCCalibration", self.json_calibration)
+
+    def read_properties(self) -> None:
+        """Set the properties of the device from the calibration file."""
         self.name = self.oqc_calibration["name"]
         self.gateset = Gateset("oqc", self.oqc_calibration["basis_gates"])
         self.num_qubits = self.oqc_calibration["num_qubits"]
         self.coupling_map = list(self.oqc_calibration["connectivity"])
 
-    def read_calibration(self) -> None:
-        """Read the calibration data for the device."""
+    def read_json_calibration(self) -> DeviceCalibration:
+        """Build the calibration data for the device from the calibration file."""
         calibration = DeviceCalibration()
         for qubit in range(self.num_qubits):
             calibration.single_qubit_gate_fidelity[qubit] = {
@@ -47,7 +52,7 @@ class OQCLucy(Device):
             calibration.two_qubit_gate_fidelity[qubit1, qubit2] = dict.fromkeys(
                 ["ecr"], self.oqc_calibration["properties"]["two_qubit"][f"{qubit1}-{qubit2}"]["fECR"]
             )
-        self.calibration = calibration
+        return calibration
 
 
 class QubitProperties(TypedDict):
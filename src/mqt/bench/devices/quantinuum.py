@@ -10,29 +10,34 @@
 
 from __future__ import annotations
 
-import json
 from typing import TypedDict, cast
 
 from .calibration import DeviceCalibration, get_device_calibration_path
-from .device import Device, Gateset
+from .calibration_cache import JSONCalibrationDevice
+from .device import Gateset
 
 
-class QuantinuumH2(Device):
+class QuantinuumH2(JSONCalibrationDevice):
     """Quantinuum H2 device."""
 
     def __init__(self) -> None:
         """Initialize the Quantinuum device."""
-        with get_device_calibration_path("quantinuum_h2").open() as json_file:
-            self.quantinuum_calibration = cast("QuantinuumCalibration", json.load(json_file))
-        self.calibration = None
+        super().__init__(get_device_calibration_path("quantinuum_h2"))
 
+    @property
+    def quantinuum_calibration(self) -> QuantinuumCalibration:
+        """Content of the calibration file of the device."""
+        return cast("QuantinuumCalibration", self.json_calibration)
+
+    def read_properties(self) -> None:
+        """Set the properties of the device from the calibration file."""
         self.name = self.quantinuum_calibration["name"]
         self.gateset = Gateset("quantinuum", self.quantinuum_calibration["basis_gates"])
         self.num_qubits = self.quantinuum_calibration["num_qubits"]
         self.coupling_map = list(self.quantinuum_calibration["connectivity"])
 
-    def read_calibration(self) -> None:
-        """Read the calibration data for the device."""
+    def read_json_calibration(self) -> DeviceCalibration:
+        """Build the calibration data for the device from the calibration file."""
         calibration = DeviceCalibration()
         for qubit in range(self.num_qubits):
             calibration.single_qubit_gate_fidelity[qubit] = dict.fromkeys(
@@ -45,7 +50,7 @@ class QuantinuumH2(Device):
             calibration.two_qubit_gate_fidelity[qubit1, qubit2] = {
                 "rzz": self.quantinuum_calibration["fidelity"]["2q"]["mean"]
             }
-        self.calibration = calibration
+        return calibration
 
 
 class Statistics(TypedDict):
@@ -10,23 +10,28 @@
 
 from __future__ import annotations
 
-import json
 import warnings
 from typing import TypedDict, cast
 
 from .calibration import DeviceCalibration, get_device_calibration_path
-from .device import Device, Gateset
+from .calibration_cache import JSONCalibrationDevice
+from .device import Gateset
 
 
-class RigettiAspenM3(Device):
+class RigettiAspenM3(JSONCalibrationDevice):
     """Rigetti Aspen M3 device."""
 
     def __init__(self) -> None:
         """Initialize the Rigetti Aspen M3 device."""
-        with get_device_calibration_path("rigetti_aspen_m3").open() as json_file:
-            self.rigetti_calibration = cast("RigettiCalibration", json.load(json_file))
-        self.calibration = None
+        super().__init__(get_device_calibration_path("rigetti_aspen_m3"))
 
+    @property
+    def rigetti_calibration(self) -> RigettiCalibration:
+        """Content of the calibration file of the device."""
+        return cast("RigettiCalibration", self.json_calibration)
+
+    def read_properties(self) -> None:
+        """Set the properties of the device from the calibration file."""
         self.name = self.rigetti_calibration["name"]
         self.gateset = Gateset("rigetti", self.rigetti_calibration["basis_gates"])
         self.num_qubits = self.rigetti_calibration["num_qubits"]
@@ -34,8 +39,8 @@ class RigettiAspenM3(Device):
             [from_rigetti_index(a), from_rigetti_index(b)] for a, b in self.rigetti_calibration["connectivity"]
         ]
 
-    def read_calibration(self) -> None:
-        """Read the calibration data for the device."""
+    def read_json_calibration(self) -> DeviceCalibration:
+        """Build the calibration data for the device from the calibration file."""
         calibration = DeviceCalibration()
         for qubit in range(self.num_qubits):
             rigetti_index = to_rigetti_index(qubit)
@@ -101,7 +106,7 @@ class RigettiAspenM3(Device):
 
             # Rigetti calibration data is symmetric, set same values for reverse edge
             calibration.two_qubit_gate_fidelity[qubit2, qubit1] = calibration.two_qubit_gate_fidelity[qubit1, qubit2]
-        self.calibration = calibration
+        return calibration
 
 
 class QubitProperties(TypedDict):
@@ -0,0 +1,258 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Estimation of the execution quality of mapped circuits from the calibration data of the devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+    from qiskit import QuantumCircuit
+
+    from .devices import Device, DeviceCalibration
+
+
+@dataclass
+class _Operations:
+    """Operations of a batch of circuits in circuit order, with each operation tagged by the index of its circuit.
+
+    Operations are encoded by their index in ``gate_names`` and qubits by their index in the circuit, which is the
+    physical qubit for circuits mapped to a device. The second qubit of single-qubit operations is -1. Barriers are not
+    part of the operations, but recorded together with the index of the operation following them.
+    """
+
+    gate_names: list[str]
+    circuits: list[int]
+    gates: list[int]
+    qubits1: list[int]
+    qubits2: list[int]
+    barriers: list[tuple[int, list[int]]]
+
+    @classmethod
+    def gather(cls, circuits: Sequence[QuantumCircuit]) -> _Operations:
+        """Walk the circuits once and gather their operations."""
+        codes: dict[str, int] = {}
+        circuit_indices: list[int] = []
+        gates: list[int] = []
+        qubits1: list[int] = []
+        qubits2: list[int] = []
+        barriers: list[tuple[int, list[int]]] = []
+        for circuit_index, qc in enumerate(circuits):
+            indices = {qubit: index for index, qubit in enumerate(qc.qubits)}
+            for instruction in qc.data:
+                name = instruction.name
+                qubits = instruction.qubits
+                if name == "barrier":
+                    barriers.append((len(gates), [indices[qubit] for qubit in qubits]))
+                    continue
+                if len(qubits) > 2:
+                    msg = (
+                        f"Operation {name} acts on {len(qubits)} qubits, "
+                        "but only single- and two-qubit gates are supported."
+                    )
+                    raise ValueError(msg)
+                circuit_indices.append(circuit_index)
+                gates.append(codes.setdefault(name, len(codes)))
+                qubits1.append(indices[qubits[0]])
+                qubits2.append(indices[qubits[1]] if len(qubits) == 2 else -1)
+        return cls(list(codes), circuit_indices, gates, qubits1, qubits2, barriers)
+
+    def lookup(self, calibration: DeviceCalibration, quantity: Literal["fidelity", "duration"]) -> NDArray[np.float64]:
+        """Look up the fidelity or duration of every operation, which is the readout one for measurements.
+
+        For two-qubit gates that are only calibrated for the reversed qubit pair, e.g., symmetric gates such as CZ, the
+        value of the reversed pair is used.
+        """
+        arrays = calibration.arrays
+        gate_ids = np.full(len(self.gate_names), -1, dtype=np.int64)
+        calibrated = [code for code, name in enumerate(self.gate_names) if name != "measure"]
+        gate_ids[calibrated] = arrays.get_gate_ids(self.gate_names[code] for code in calibrated)
+
+        gates = gate_ids[np.array(self.gates, dtype=np.int64)]
+        qubits1 = np.array(self.qubits1, dtype=np.int64)
+        qubits2 = np.array(self.qubits2, dtype=np.int64)
+        measure = gates < 0
+        two_qubit = qubits2 >= 0
+        single_qubit = ~measure & ~two_qubit
+
+        first, second = qubits1[two_qubit], qubits2[two_qubit]
+        forward = arrays.get_edge_ids(first, second) >= 0
+        first, second = np.where(forward, first, second), np.where(forward, second, first)
+
+        values = np.empty(len(gates))
+        if quantity == "fidelity":
+            values[single_qubit] = calibration.get_single_qubit_gate_fidelity_many(
+                gates[single_qubit], qubits1[single_qubit]
+            )
+            values[two_qubit] = calibration.get_two_qubit_gate_fidelity_many(gates[two_qubit], first, second)
+            values[measure] = calibration.get_readout_fidelity_many(qubits1[measure])
+        else:
+            values[single_qubit] = calibration.get_single_qubit_gate_duration_many(
+                gates[single_qubit], qubits1[single_qubit]
+            )
+            values[two_qubit] = calibration.get_two_qubit_gate_duration_many(gates[two_qubit], first, second)
+            values[measure] = calibration.get_readout_duration_many(qubits1[measure])
+        return values
+
+
+def estimate_success_probability(qc: QuantumCircuit, device: Device, log: bool = False) -> float:
+    """Estimate the success probability of a mapped circuit as the product of the fidelities of its operations.
+
+    The product includes the fidelity of every gate on its qubits and the readout fidelity of every measurement, while
+    barriers are ignored. It is computed as the sum of the logarithms of the fidelities gathered in a single pass over
+    the circuit. For two-qubit gates that are only calibrated for the reversed qubit pair, e.g., symmetric gates such
+    as CZ, the fidelity of the reversed pair is used.
+
+    Arguments:
+        qc: circuit mapped to the device, e.g., by ``get_benchmark(..., level="mapped", ...)``
+        device: device the circuit is mapped to
+        log: whether the natural logarithm of the success probability is returned, which does not underflow to 0 for
+            circuits with many gates
+
+    Returns:
+        the estimated success probability or its logarithm
+    """
+    return float(estimate_success_probability_many([qc], device, log=log)[0])
+
+
+def estimate_success_probability_many(
+    circuits: Sequence[QuantumCircuit], device: Device, log: bool = False
+) -> NDArray[np.float64]:
+    """Estimate the success probabilities of a batch of mapped circuits (see `estimate_success_probability`).
+
+    The fidelities of all circuits are looked up at once, which is considerably faster than estimating the circuits
+    one by one.
+
+    Arguments:
+        circuits: circuits mapped to the device
+        device: device the circuits are mapped to
+        log: whether the natural logarithms of the success probabilities are returned, which do not underflow to 0
+            for circuits with many gates
+
+    Returns:
+        the estimated success probabilities or their logarithms in the order of the circuits
+    """
+    device.check_calibration()
+    assert device.calibration is not None
+
+    operations = _Operations.gather(circuits)
+    with np.errstate(divide="ignore"):
+        log_fidelities = np.log(operations.lookup(device.calibration, "fidelity"))
+    log_success_probabilities = np.bincount(operations.circuits, weights=log_fidelities, minlength=len(circuits))
+    if log:
+        return np.asarray(log_success_probabilities, dtype=np.float64)
+    return np.asarray(np.exp(log_success_probabilities), dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class DurationEstimate:
+    """Estimated execution of a mapped circuit scheduled as soon as possible.
+
+    Idle windows are the gaps between consecutive operations on a qubit, i.e., neither the time before the first nor
+    after the last operation on a qubit counts as idle. Barriers synchronize their qubits, so that the time a qubit
+    waits at a barrier is idle as well.
+
+    Attributes:
+        duration: total duration of the circuit
+        idle_qubits: qubit of each idle window
+        idle_starts: start time of each idle window
+        idle_ends: end time of each idle window
+        idle_time: total idle time of each qubit
+        decay_factor: factor ``exp(-t / T1) * exp(-t / T2)`` for the idle time ``t`` of each qubit, multiplied over all
+            qubits, by which decoherence during the idle windows reduces the success probability
+    """
+
+    duration: float
+    idle_qubits: NDArray[np.int64]
+    idle_starts: NDArray[np.float64]
+    idle_ends: NDArray[np.float64]
+    idle_time: NDArray[np.float64]
+    decay_factor: float
+
+
+def estimate_duration(qc: QuantumCircuit, device: Device) -> DurationEstimate:
+    """Estimate the duration and idle times of a mapped circuit scheduled as soon as possible on a device.
+
+    The durations of all operations (the readout duration for measurements) are looked up at once, after which a single
+    pass over the operations in circuit order, which is a topological order of the circuit DAG, advances the clocks of
+    the qubits. Every operation starts as soon as all of its qubits are available.
+
+    Arguments:
+        qc: circuit mapped to the device, e.g., by ``get_benchmark(..., level="mapped", ...)``
+        device: device the circuit is mapped to
+
+    Returns:
+        the duration, idle windows and decoherence decay factor of the circuit (see `DurationEstimate`)
+
+    Raises:
+        ValueError: if the device has no duration calibration at all (OQC Lucy, Quantinuum H2 and Rigetti Aspen M3),
+            or if the duration of any operation of the circuit is not available
+    """
+    device.check_calibration()
+    assert device.calibration is not None
+    arrays = device.calibration.arrays
+    if all(
+        np.isnan(values).all()
+        for values in (arrays.single_qubit_gate_duration, arrays.two_qubit_gate_duration, arrays.readout_duration)
+    ):
+        msg = f"Device {device.name} has no duration calibration."
+        raise ValueError(msg)
+
+    operations = _Operations.gather([qc])
+    durations = operations.lookup(device.calibration, "duration")
+
+    num_qubits = qc.num_qubits
+    # end of the last operation on each qubit, which is NaN before the first one so that no idle window is opened
+    end = [float("nan")] * num_qubits
+    # earliest start of the next operation on each qubit, which barriers may delay beyond its end
+    ready = [0.0] * num_qubits
+    idle_qubits: list[int] = []
+    idle_starts: list[float] = []
+    idle_ends: list[float] = []
+
+    barriers = iter([*operations.barriers, (-1, [])])
+    barrier_index, barrier_qubits = next(barriers)
+    for index, (qubit1, qubit2, duration) in enumerate(zip(operations.qubits1, operations.qubits2, durations.tolist())):
+        while index == barrier_index:
+            synchronized = max((ready[qubit] for qubit in barrier_qubits), default=0.0)
+            for qubit in barrier_qubits:
+                ready[qubit] = synchronized
+            barrier_index, barrier_qubits = next(barriers)
+
+        start = ready[qubit1] if qubit2 < 0 else max(ready[qubit1], ready[qubit2])
+        stop = start + duration
+        for qubit in (qubit1,) if qubit2 < 0 else (qubit1, qubit2):
+            if start > end[qubit]:
+                idle_qubits.append(qubit)
+                idle_starts.append(end[qubit])
+                idle_ends.append(start)
+            end[qubit] = ready[qubit] = stop
+
+    idle_qubits_array = np.array(idle_qubits, dtype=np.int64)
+    idle_starts_array = np.array(idle_starts, dtype=np.float64)
+    idle_ends_array = np.array(idle_ends, dtype=np.float64)
+    idle_time = np.bincount(idle_qubits_array, weights=idle_ends_array - idle_starts_array, minlength=num_qubits)
+
+    idle = np.flatnonzero(idle_time)
+    calibration = device.calibration
+    exponent = np.sum(idle_time[idle] * (1 / calibration.get_t1_many(idle) + 1 / calibration.get_t2_many(idle)))
+    return DurationEstimate(
+        duration=float(np.fmax.reduce(end, initial=0.0)),
+        idle_qubits=idle_qubits_array,
+        idle_starts=idle_starts_array,
+        idle_ends=idle_ends_array,
+        idle_time=np.asarray(idle_time, dtype=np.float64),
+        decay_factor=float(np.exp(-exponent)),
+    )
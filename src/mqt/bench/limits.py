@@ -0,0 +1,143 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Supervised generation of benchmarks with wall-clock and memory limits."""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from .cache import configure_cache, get_cache
+from .registry import get_runtime_registrations, restore_runtime_registrations
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from multiprocessing.connection import Connection
+
+    from .registry import BenchmarkSpec
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class GenerationFailure:
+    """Record of a supervised generation that did not complete.
+
+    Attributes:
+        reason: "timeout" if the time limit was exceeded, "memory" if the memory limit was exceeded, "error" if an
+            exception was raised and "crash" if the process terminated without a result
+        message: description of the failure
+    """
+
+    reason: Literal["timeout", "memory", "error", "crash"]
+    message: str
+
+
+class GenerationLimitError(RuntimeError):
+    """Raised if a benchmark cannot be generated within the given limits."""
+
+    def __init__(self, failure: GenerationFailure) -> None:
+        """Initialize the error from the failure record, which is kept as attribute ``failure``."""
+        super().__init__(failure.message)
+        self.failure = failure
+
+
+def run_with_limits(
+    function: Callable[..., T],
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
+    timeout_s: float | None = None,
+    max_memory_mb: int | None = None,
+) -> T | GenerationFailure:
+    """Runs a function in a supervised subprocess that is killed once it exceeds the given limits.
+
+    The memory limit is enforced by limiting the address space of the subprocess via ``resource.setrlimit``, which is
+    only available on Unix. The configuration of the circuit cache and the benchmarks registered at runtime (see
+    `mqt.bench.registry.register_benchmark`) are passed on to the subprocess.
+
+    Arguments:
+        function: picklable function to run
+        args: positional arguments of the function
+        kwargs: keyword arguments of the function
+        timeout_s: maximum wall-clock time of the subprocess in seconds (including its start-up)
+        max_memory_mb: maximum address space of the subprocess in MiB
+
+    Returns:
+        the result of the function or the failure record if it did not complete
+    """
+    if max_memory_mb is not None and sys.platform == "win32":
+        msg = "max_memory_mb is only supported on Unix."
+        raise ValueError(msg)
+
+    cache = get_cache()
+    cache_config = None if cache is None else (str(cache.directory), cache.max_size_bytes)
+
+    # Qiskit's internal thread pools do not survive a fork, hence, the subprocess is spawned
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_run_limited,
+        args=(sender, function, args, kwargs or {}, max_memory_mb, cache_config, get_runtime_registrations()),
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout_s):
+            return GenerationFailure("timeout", f"Generation exceeded the time limit of {timeout_s}s.")
+        status, value = receiver.recv()
+    except EOFError:
+        process.join()
+        return GenerationFailure("crash", f"Generation terminated with exit code {process.exitcode}.")
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+    if status == "ok":
+        return value  # type: ignore[no-any-return]
+    return GenerationFailure(status, value)
+
+
+def _run_limited(
+    sender: Connection,
+    function: Callable[..., object],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    max_memory_mb: int | None,
+    cache_config: tuple[str, int] | None,
+    registrations: list[BenchmarkSpec],
+) -> None:
+    """Entry point of the supervised subprocess that sends the result or the failure back to the parent."""
+    if cache_config is not None:
+        configure_cache(Path(cache_config[0]), cache_config[1])
+    restore_runtime_registrations(registrations)
+
+    if max_memory_mb is not None:
+        import resource  # noqa: PLC0415
+
+        limit = max_memory_mb * 1024**2
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    try:
+        result = function(*args, **kwargs)
+    except MemoryError:
+        sender.send(("memory", f"Generation exceeded the memory limit of {max_memory_mb} MiB."))
+    except Exception:
+        sender.send(("error", traceback.format_exc()))
+    else:
+        sender.send(("ok", result))
+    finally:
+        sender.close()
@@ -0,0 +1,224 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Per-directory index of the saved benchmark files, used to skip files that are already up to date."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from qiskit import __version__ as __qiskit_version__
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .output import OutputFormat
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "mqt_bench_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    filename TEXT PRIMARY KEY,
+    config_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    mqt_bench_version TEXT NOT NULL,
+    qiskit_version TEXT NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Record of a saved benchmark file.
+
+    Attributes:
+        config_hash: hash of the settings the file was saved with (see `config_hash`)
+        size: size of the file in bytes
+        content_hash: SHA-256 hash of the file content
+        mqt_bench_version: version of mqt.bench that generated the file
+        qiskit_version: version of Qiskit that generated the file
+    """
+
+    config_hash: str
+    size: int
+    content_hash: str
+    mqt_bench_version: str
+    qiskit_version: str
+
+    def is_current(self) -> bool:
+        """Return whether the file was generated with the installed versions of mqt.bench and Qiskit."""
+        return (self.mqt_bench_version, self.qiskit_version) == get_generator_versions()
+
+
+@cache
+def get_generator_versions() -> tuple[str, str]:
+    """Return the installed versions of mqt.bench and Qiskit."""
+    try:
+        version = metadata.version("mqt.bench")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return version, __qiskit_version__
+
+
+def config_hash(
+    output_format: OutputFormat, gateset: list[str] | None = None, c_map: list[list[int]] | None = None
+) -> str:
+    """Compute the hash of the settings a file is saved with, i.e., everything besides the circuit that ends up in it.
+
+    The gates and edges are sorted, since their order may differ between processes, e.g., for the gates of IBM devices,
+    which Qiskit provides as a set.
+    """
+    # the coupling map may also be given as Qiskit CouplingMap, which iterates over its edges as well
+    edges = None if c_map is None else sorted(list(edge) for edge in c_map)
+    gates = None if gateset is None else sorted(gateset)
+    serialized = json.dumps([output_format.value, gates, edges])
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class Manifest:
+    """Index of the benchmark files saved in one directory, stored in an SQLite database within the directory.
+
+    The index is read once when the manifest is created and kept in memory afterwards. Every saved file is recorded
+    in a transaction of its own, so that concurrent writers never corrupt the index. Recorded files are only considered
+    up to date if they still exist with the recorded size, which takes a single ``stat`` of the requested file instead
+    of listing the whole directory.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the manifest by reading the index of the directory (if there is one).
+
+        Arguments:
+            directory: directory of the benchmark files
+
+        Raises:
+            sqlite3.OperationalError: if the index cannot be read, e.g., since it is locked by another process
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_FILENAME
+        self.entries = self._load()
+
+    def _load(self) -> dict[str, ManifestEntry]:
+        if not self.path.is_file():  # no index yet
+            return {}
+        try:
+            with closing(
+                sqlite3.connect(f"{self.path.absolute().as_uri()}?mode=ro", uri=True, timeout=60)
+            ) as connection:
+                if not connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'files'"
+                ).fetchone():
+                    return {}
+                rows = connection.execute(
+                    "SELECT filename, config_hash, size, content_hash, mqt_bench_version, qiskit_version FROM files"
+                ).fetchall()
+        except sqlite3.OperationalError:
+            # e.g., the index is still locked by another process after the timeout, which must not read as empty index
+            raise
+        except sqlite3.DatabaseError:
+            logger.warning("Ignoring unreadable manifest %s.", self.path)
+            self.path.unlink(missing_ok=True)
+            return {}
+        return {filename: ManifestEntry(*entry) for filename, *entry in rows}
+
+    def is_up_to_date(self, filename: str, config_hash: str) -> bool:
+        """Return whether the file exists as recorded with the given settings and by the installed versions.
+
+        Arguments:
+            filename: name of the file (including extension)
+            config_hash: hash of the settings the file is expected to be saved with (see `config_hash`)
+        """
+        entry = self.entries.get(filename)
+        if entry is None or entry.config_hash != config_hash or not entry.is_current():
+            return False
+        try:
+            return (self.directory / filename).stat().st_size == entry.size
+        except OSError:  # e.g., the file was removed
+            return False
+
+    def stale_files(self) -> list[str]:
+        """Return the recorded files that were generated by other versions of mqt.bench or Qiskit."""
+        return sorted(filename for filename, entry in self.entries.items() if not entry.is_current())
+
+    def record(self, filename: str, config_hash: str) -> None:
+        """Record a file that has just been saved to the directory.
+
+        Failing to update the index is logged but not raised, since it only causes the file to be generated again.
+
+        Arguments:
+            filename: name of the file (including extension)
+            config_hash: hash of the settings the file was saved with (see `config_hash`)
+        """
+        content = (self.directory / filename).read_bytes()
+        entry = ManifestEntry(config_hash, len(content), hashlib.sha256(content).hexdigest(), *get_generator_versions())
+        try:
+            with closing(sqlite3.connect(self.path, timeout=60)) as connection, connection:
+                connection.execute(_SCHEMA)
+                connection.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        filename,
+                        entry.config_hash,
+                        entry.size,
+                        entry.content_hash,
+                        entry.mqt_bench_version,
+                        entry.qiskit_version,
+                    ),
+                )
+        except sqlite3.DatabaseError:
+            logger.warning("Could not record %s in manifest %s.", filename, self.path)
+            return
+        self.entries[filename] = entry
+
+
+def get_manifest(directory: str | Path) -> Manifest:
+    """Return the manifest of a directory, which is read only once per process (see `clear_manifests`)."""
+    return _get_manifest(Path(directory).absolute())
+
+
+@cache
+def _get_manifest(directory: Path) -> Manifest:
+    return Manifest(directory)
+
+
+def clear_manifests() -> None:
+    """Forget all manifests read so far, e.g., after the directories have been modified by other means."""
+    _get_manifest.cache_clear()
+
+
+def is_up_to_date(
+    target_directory: str,
+    filename: str,
+    output_format: OutputFormat,
+    gateset: list[str] | None = None,
+    c_map: list[list[int]] | None = None,
+) -> bool:
+    """Check via the manifest of the directory whether a file is already saved and up to date.
+
+    Arguments:
+        target_directory: directory of the file
+        filename: name of the file (excluding extension)
+        output_format: format of the file
+        gateset: gateset the file is saved with
+        c_map: coupling map the file is saved with
+
+    Returns:
+        True if the file is recorded with the same settings and was generated by the installed versions
+    """
+    return get_manifest(target_directory).is_up_to_date(
+        f"{filename}.{output_format.extension()}", config_hash(output_format, gateset, c_map)
+    )
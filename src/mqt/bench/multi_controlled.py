@@ -0,0 +1,209 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Process-wide cache of multi-controlled X and phase gates and their decompositions."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Union
+
+from qiskit.circuit import Gate, ParameterExpression
+from qiskit.circuit.library import MCPhaseGate, MCXGate, MCXGrayCode, MCXRecursive, MCXVChain
+
+from .bulk import append_instructions
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+    from qiskit import QuantumCircuit
+    from qiskit._accelerate.circuit import StandardGate
+    from qiskit.circuit import ControlledGate, Operation, Qubit
+
+MCX_MODES = ("noancilla", "recursion", "v-chain", "v-chain-dirty")
+
+# ("mcx", number of controls, mode) or ("mcphase", number of controls, angle)
+GateKey = tuple[str, int, Union[str, float]]
+Decomposition = tuple[tuple[tuple["StandardGate", tuple[int, ...], tuple[float, ...]], ...], float]
+
+
+@cache
+def get_mcx_gate(num_controls: int, mode: str = "noancilla") -> ControlledGate:
+    """Returns the shared multi-controlled X gate, which is equivalent to the one appended by ``QuantumCircuit.mcx``.
+
+    Arguments:
+        num_controls: number of control qubits
+        mode: decomposition scheme, either "noancilla", "recursion", "v-chain" or "v-chain-dirty"
+
+    Returns:
+        the gate acting on the controls, the target and ``num_ancilla_qubits`` ancillas (in this order)
+    """
+    if mode == "noancilla":
+        return MCXGate(num_controls)
+    if mode == "recursion":
+        return MCXRecursive(num_controls)
+    if mode in ("v-chain", "v-chain-dirty"):
+        return MCXVChain(num_controls, dirty_ancillas=mode == "v-chain-dirty")
+    msg = f"Unsupported mode ({mode}) selected, choose one of {list(MCX_MODES)}."
+    raise ValueError(msg)
+
+
+@cache
+def get_mcp_gate(lam: float, num_controls: int) -> ControlledGate:
+    """Returns the shared multi-controlled phase gate, which is equivalent to the one appended by ``QuantumCircuit.mcp``.
+
+    Arguments:
+        lam: phase angle
+        num_controls: number of control qubits
+
+    Returns:
+        the gate acting on the controls and the target (in this order)
+    """
+    return MCPhaseGate(lam, num_controls)
+
+
+def append_mcx(
+    circuit: QuantumCircuit,
+    control_qubits: Sequence[Qubit],
+    target_qubit: Qubit,
+    mode: str = "noancilla",
+    ancilla_qubits: Sequence[Qubit] | None = None,
+) -> None:
+    """Appends a shared multi-controlled X gate, which is the cached counterpart of ``QuantumCircuit.mcx``.
+
+    Arguments:
+        circuit: circuit to append the gate to
+        control_qubits: control qubits of the gate
+        target_qubit: target qubit of the gate
+        mode: decomposition scheme, either "noancilla", "recursion", "v-chain" or "v-chain-dirty"
+        ancilla_qubits: ancilla qubits, of which only as many as required by the mode are used
+    """
+    gate = get_mcx_gate(len(control_qubits), mode)
+    required = getattr(gate, "num_ancilla_qubits", 0)
+    ancillas = list(ancilla_qubits or [])
+    if len(ancillas) < required:
+        msg = f"At least {required} ancillas required, but {len(ancillas)} given."
+        raise ValueError(msg)
+    circuit.append(gate, [*control_qubits, target_qubit, *ancillas[:required]])
+
+
+def expand_multi_controlled_gates(qc: QuantumCircuit) -> QuantumCircuit:
+    """Replaces all multi-controlled X and phase gates by their decompositions into standard gates.
+
+    Every distinct gate (i.e., kind, number of controls and mode or angle) is decomposed only once per process and
+    spliced into the circuit for each of its occurrences, whereas the transpiler synthesizes the definition of each
+    occurrence anew. The gates are searched within the definitions of custom gates as well, e.g., the Grover operator.
+    The resulting circuit is equivalent to the original one.
+
+    Multi-controlled X gates without ancillas (i.e., named "mcx") are kept on the top level of the circuit, since the
+    transpiler synthesizes them by borrowing idle qubits of the circuit, which their definition does not.
+
+    Arguments:
+        qc: circuit whose gates are replaced
+
+    Returns:
+        the circuit with the replaced gates or the original circuit if it does not contain such gates
+    """
+    return _expand(qc, top_level=True)
+
+
+def _expand(qc: QuantumCircuit, top_level: bool) -> QuantumCircuit:
+    if not _contains_multi_controlled_gates(qc):
+        return qc
+    new_qc = qc.copy_empty_like()
+    for instruction in qc.data:
+        operation = instruction.operation
+        gate_key = _get_gate_key(operation)
+        if gate_key is not None and not (top_level and operation.name == "mcx"):
+            _append_decomposition(new_qc, _get_decomposition(gate_key), instruction.qubits)
+        elif _is_expandable(operation):
+            definition = _expand(operation.definition, top_level=False)
+            qubit_map = dict(zip(definition.qubits, instruction.qubits))
+            for inner in definition.data:
+                new_qc._append(inner.replace(qubits=[qubit_map[qubit] for qubit in inner.qubits]))  # noqa: SLF001
+            new_qc.global_phase += definition.global_phase
+        else:
+            new_qc._append(instruction)  # noqa: SLF001
+    return new_qc
+
+
+def _get_gate_key(operation: Operation) -> GateKey | None:
+    """Returns the key of a cached multi-controlled gate or ``None`` for all other operations."""
+    if getattr(operation, "_standard_gate", None) is not None:
+        return None
+    if type(operation) in (MCXGate, MCXGrayCode, MCXRecursive, MCXVChain):
+        if operation.ctrl_state != 2**operation.num_ctrl_qubits - 1:
+            return None
+        if type(operation) is MCXVChain:
+            if operation._relative_phase or operation._action_only:  # noqa: SLF001
+                return None
+            mode = "v-chain-dirty" if operation._dirty_ancillas else "v-chain"  # noqa: SLF001
+        else:
+            mode = "recursion" if type(operation) is MCXRecursive else "noancilla"
+        return "mcx", operation.num_ctrl_qubits, mode
+    if type(operation) is MCPhaseGate and operation.ctrl_state == 2**operation.num_ctrl_qubits - 1:
+        lam = operation.params[0]
+        if isinstance(lam, ParameterExpression):
+            return None
+        return "mcphase", operation.num_ctrl_qubits, float(lam)
+    return None
+
+
+def _is_expandable(operation: Operation) -> bool:
+    """Returns whether the operation is a custom gate whose definition contains multi-controlled gates."""
+    return (
+        type(operation) is Gate
+        and operation.definition is not None
+        and _contains_multi_controlled_gates(operation.definition)
+    )
+
+
+def _contains_multi_controlled_gates(qc: QuantumCircuit) -> bool:
+    return any(
+        _get_gate_key(instruction.operation) is not None or _is_expandable(instruction.operation)
+        for instruction in qc.data
+    )
+
+
+@cache
+def _get_decomposition(gate_key: GateKey) -> Decomposition:
+    """Decomposes a cached multi-controlled gate into standard gates, given by their qubit indices and parameters."""
+    kind, num_controls, setting = gate_key
+    gate = get_mcx_gate(num_controls, str(setting)) if kind == "mcx" else get_mcp_gate(float(setting), num_controls)
+    steps: list[tuple[StandardGate, tuple[int, ...], tuple[float, ...]]] = []
+    global_phase = _flatten(gate.definition, tuple(range(gate.num_qubits)), steps)
+    return tuple(steps), global_phase
+
+
+def _flatten(
+    definition: QuantumCircuit,
+    qubits: tuple[int, ...],
+    steps: list[tuple[StandardGate, tuple[int, ...], tuple[float, ...]]],
+) -> float:
+    """Appends the standard gates of the definition on the given qubits to the steps and returns its global phase."""
+    indices = {qubit: qubits[i] for i, qubit in enumerate(definition.qubits)}
+    global_phase = float(definition.global_phase)
+    for instruction in definition.data:
+        operation = instruction.operation
+        operands = tuple(indices[qubit] for qubit in instruction.qubits)
+        gate_key = _get_gate_key(operation)
+        if gate_key is not None:
+            inner_steps, inner_phase = _get_decomposition(gate_key)
+            steps.extend((gate, tuple(operands[i] for i in targets), params) for gate, targets, params in inner_steps)
+            global_phase += inner_phase
+        elif operation._standard_gate is not None:  # noqa: SLF001
+            steps.append((operation._standard_gate, operands, tuple(float(param) for param in operation.params)))  # noqa: SLF001
+        else:
+            global_phase += _flatten(operation.definition, operands, steps)
+    return global_phase
+
+
+def _append_decomposition(circuit: QuantumCircuit, decomposition: Decomposition, qubits: Sequence[Qubit]) -> None:
+    steps, global_phase = decomposition
+    append_instructions(circuit, ((gate, [qubits[i] for i in targets], params) for gate, targets, params in steps))
+    circuit.global_phase += global_phase
@@ -23,6 +23,8 @@ from qiskit.qasm2 import dump as dump2
 from qiskit.qasm3 import dump as dump3
 from qiskit.qpy import dump as dump_qpy
 
+from .manifest import config_hash, get_manifest
+
 if TYPE_CHECKING:  # pragma: no cover
     from typing import BinaryIO
 
@@ -198,6 +200,8 @@ def save_circuit(
 ) -> bool:
     """Public API to save a quantum circuit in various formats with MQT Bench header.
 
+    The saved file is recorded in the manifest of the target directory (see `mqt.bench.manifest`).
+
     Arguments:
         qc: Circuit to export
         filename: Base filename without extension
@@ -216,4 +220,5 @@ def save_circuit(
         print(e)
         return False
 
+    get_manifest(target_directory).record(path.name, config_hash(output_format, gateset, c_map))
     return True
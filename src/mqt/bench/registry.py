@@ -0,0 +1,265 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Registry of the available benchmarks, including third-party benchmarks registered via entry points.
+
+Third-party packages register benchmarks by pointing an entry point of the group ``mqt.bench.benchmarks`` to a
+`BenchmarkSpec`, e.g., in their ``pyproject.toml``:
+
+.. code-block:: toml
+
+    [project.entry-points."mqt.bench.benchmarks"]
+    mybenchmark = "my_package.specs:MY_BENCHMARK"
+
+The entry points are loaded on the first access of the registry, but the benchmark modules themselves only when a
+circuit is created. Hence, the module defining the specification should not import the benchmark implementation.
+
+Benchmarks registered at runtime via `register_benchmark` are passed on to the spawned processes of the supervised and
+the batch generation, hence, their specifications must be picklable, e.g., with a factory given by its import path.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import cache
+from importlib import import_module, metadata
+from typing import TYPE_CHECKING, Any, Union, cast
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable, Sequence
+
+    from qiskit import QuantumCircuit
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "mqt.bench.benchmarks"
+
+# a callable or the import path of a callable in the form "module:attribute"
+Loadable = Union[str, "Callable[..., Any]"]
+
+# benchmarks registered at runtime, which spawned processes do not inherit (see `get_runtime_registrations`)
+_runtime_specs: dict[str, BenchmarkSpec] = {}
+
+
+@dataclass(frozen=True)
+class BenchmarkSpec:
+    """Specification of a benchmark and the parameters of its circuit creation.
+
+    Attributes:
+        name: name of the benchmark (without ancillary mode)
+        factory: function creating the algorithm-level circuit, called with the circuit size (or the arguments returned
+            by ``instance_parser``) and the additional keyword arguments of the benchmark generation
+        size: meaning of the circuit size, e.g., "number of qubits"
+        ancillary_modes: ancillary modes of the benchmark, which are appended to its name (e.g., "grover-v-chain") and
+            passed on as ``ancillary_mode`` to the factory
+        instances: named instances of the benchmark if it is selected by instance instead of circuit size
+        instance_parser: function returning the positional arguments of the factory for an instance name and raising a
+            ``ValueError`` for invalid instances; benchmarks with an instance parser are selected by instance
+        has_resource_estimate: whether `mqt.bench.resources.estimate_resources` supports the benchmark, otherwise, the
+            benchmark is exempt from the gate budget
+    """
+
+    name: str
+    factory: Loadable
+    size: str = "number of qubits"
+    ancillary_modes: tuple[str, ...] = ()
+    instances: tuple[str, ...] = ()
+    instance_parser: Loadable | None = None
+    has_resource_estimate: bool = False
+
+    @property
+    def names(self) -> list[str]:
+        """Names under which the benchmark is selected, i.e., one per ancillary mode."""
+        return [f"{self.name}-{mode}" for mode in self.ancillary_modes] or [self.name]
+
+    @property
+    def selected_by_instance(self) -> bool:
+        """Whether the benchmark is selected by instance instead of circuit size."""
+        return self.instance_parser is not None
+
+    def parse_instance(self, instance_name: str) -> tuple[Any, ...]:
+        """Return the positional arguments of the factory for an instance (raises a ``ValueError`` if it is invalid)."""
+        if self.instance_parser is None:
+            msg = f"Benchmark {self.name} is not selected by instance."
+            raise ValueError(msg)
+        return tuple(_load(self.instance_parser)(instance_name))
+
+    def create_circuit(
+        self,
+        circuit_size: int | None,
+        instance_name: str | None = None,
+        ancillary_mode: str | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> QuantumCircuit:
+        """Create the algorithm-level circuit of the benchmark.
+
+        Arguments:
+            circuit_size: input for the benchmark creation (ignored for benchmarks selected by instance)
+            instance_name: instance of the benchmark (only for benchmarks selected by instance)
+            ancillary_mode: ancillary mode of the benchmark (only for benchmarks with ancillary modes)
+            kwargs: additional arguments passed on to the factory
+
+        Returns:
+            the quantum circuit on the algorithm level
+        """
+        if self.ancillary_modes:
+            if ancillary_mode not in self.ancillary_modes:
+                msg = f"Either of {list(self.ancillary_modes)} must be specified as ancillary mode of {self.name}."
+                raise ValueError(msg)
+            kwargs["ancillary_mode"] = ancillary_mode
+        if self.selected_by_instance:
+            if not isinstance(instance_name, str):
+                msg = "benchmark_instance_name must be defined for this benchmark."
+                raise ValueError(msg)
+            args = self.parse_instance(instance_name)
+        else:
+            args = (circuit_size,)
+        return cast("QuantumCircuit", _load(self.factory)(*args, **kwargs))
+
+
+def _builtin(name: str, **schema: Any) -> BenchmarkSpec:  # noqa: ANN401
+    return BenchmarkSpec(name, f"mqt.bench.benchmarks.{name}:create_circuit", has_resource_estimate=True, **schema)
+
+
+_BUILTIN_BENCHMARKS = (
+    _builtin("ae"),
+    _builtin("bv"),
+    _builtin("dj"),
+    _builtin("grover", size="number of qubits without ancillas", ancillary_modes=("noancilla", "v-chain")),
+    _builtin("ghz"),
+    _builtin("graphstate"),
+    _builtin("qaoa"),
+    _builtin("qft"),
+    _builtin("qftentangled"),
+    _builtin("qnn"),
+    _builtin("qpeexact"),
+    _builtin("qpeinexact"),
+    _builtin("qwalk", size="number of qubits without ancillas", ancillary_modes=("noancilla", "v-chain")),
+    _builtin("randomcircuit"),
+    _builtin("vqerealamprandom"),
+    _builtin("vqesu2random"),
+    _builtin("vqetwolocalrandom"),
+    _builtin("wstate"),
+    _builtin(
+        "shor",
+        size="none, the instance determines the size",
+        instances=("xsmall", "small", "medium", "large", "xlarge"),
+        instance_parser="mqt.bench.benchmarks.shor:get_instance",
+    ),
+)
+
+
+def register_benchmark(spec: BenchmarkSpec, replace: bool = False) -> None:
+    """Register a benchmark at runtime (see the module documentation for registering benchmarks via entry points).
+
+    Arguments:
+        spec: specification of the benchmark
+        replace: whether an already registered benchmark of the same name is replaced instead of raising an error
+    """
+    registry = _get_registry()
+    if spec.name in registry and not replace:
+        msg = f"A benchmark named {spec.name} is already registered."
+        raise ValueError(msg)
+    registry[spec.name] = spec
+    _runtime_specs[spec.name] = spec
+    _resolve.cache_clear()
+
+
+def get_runtime_registrations() -> list[BenchmarkSpec]:
+    """Return the specifications of the benchmarks registered at runtime, e.g., to pass them on to spawned processes."""
+    return list(_runtime_specs.values())
+
+
+def restore_runtime_registrations(specs: Iterable[BenchmarkSpec]) -> None:
+    """Register the benchmarks returned by `get_runtime_registrations` in a spawned process."""
+    for spec in specs:
+        register_benchmark(spec, replace=True)
+
+
+def get_benchmark_specs() -> list[BenchmarkSpec]:
+    """Return the specifications of all registered benchmarks (built-in ones first)."""
+    return list(_get_registry().values())
+
+
+def get_spec(name: str) -> BenchmarkSpec | None:
+    """Return the specification of the benchmark of the given name (without ancillary mode) or ``None``."""
+    return _get_registry().get(name)
+
+
+def get_benchmark_spec(benchmark_name: str) -> tuple[BenchmarkSpec, str | None]:
+    """Return the specification of a benchmark and the ancillary mode included in its name (if any).
+
+    Arguments:
+        benchmark_name: name of the benchmark, including the ancillary mode for benchmarks such as "grover-v-chain"
+
+    Returns:
+        the specification and the ancillary mode or ``None``
+    """
+    resolved = _resolve(benchmark_name)
+    if resolved is None:
+        msg = f"Selected benchmark is not supported. Valid benchmarks are {get_supported_benchmark_names()}."
+        raise ValueError(msg)
+    return resolved
+
+
+def get_supported_benchmark_names() -> list[str]:
+    """Return the names of all registered benchmarks, including their ancillary modes."""
+    return [name for spec in _get_registry().values() for name in spec.names]
+
+
+@cache
+def _resolve(benchmark_name: str) -> tuple[BenchmarkSpec, str | None] | None:
+    registry = _get_registry()
+    if benchmark_name in registry and not registry[benchmark_name].ancillary_modes:
+        return registry[benchmark_name], None
+    name, _, mode = benchmark_name.partition("-")
+    spec = registry.get(name)
+    if spec is not None and mode in spec.ancillary_modes:
+        return spec, mode
+    return None
+
+
+@cache
+def _get_registry() -> dict[str, BenchmarkSpec]:
+    # runtime registrations are lost together with a previous registry
+    _runtime_specs.clear()
+    registry = {spec.name: spec for spec in _BUILTIN_BENCHMARKS}
+    for entry_point in _get_entry_points():
+        try:
+            spec = entry_point.load()
+        except Exception:
+            logger.exception("Could not load the benchmark %s registered by entry point.", entry_point.name)
+            continue
+        if not isinstance(spec, BenchmarkSpec):
+            logger.warning("Ignoring entry point %s, which does not refer to a BenchmarkSpec.", entry_point.name)
+            continue
+        if spec.name in registry:
+            logger.warning(
+                "Ignoring entry point %s, since benchmark %s is already registered.", entry_point.name, spec.name
+            )
+            continue
+        registry[spec.name] = spec
+    return registry
+
+
+def _get_entry_points() -> Sequence[metadata.EntryPoint]:
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=ENTRY_POINT_GROUP))
+    return list(entry_points.get(ENTRY_POINT_GROUP, []))  # pragma: no cover (Python 3.9)
+
+
+@cache
+def _load_path(path: str) -> Callable[..., Any]:
+    module_name, _, attribute = path.partition(":")
+    return cast("Callable[..., Any]", getattr(import_module(module_name), attribute))
+
+
+def _load(loadable: Loadable) -> Callable[..., Any]:
+    return _load_path(loadable) if isinstance(loadable, str) else loadable
@@ -0,0 +1,370 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Analytic estimation of the resources of benchmark circuits without creating them."""
+
+from __future__ import annotations
+
+import inspect
+import math
+import warnings
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from .registry import get_benchmark_spec
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from typing_extensions import Unpack
+
+    from .benchmark_generation import BenchmarkOptions
+
+DEFAULT_GATE_BUDGET = 10**8
+
+# upper bounds of the number of gates for the generation time classes
+GENERATION_TIME_CLASSES: tuple[tuple[Literal["seconds", "minutes", "hours"], int], ...] = (
+    ("seconds", 10**5),
+    ("minutes", 10**6),
+    ("hours", 10**8),
+)
+
+# gate counts of multi-controlled gates with few controls on the target-independent level (indexed by the number of
+# controls); for more controls, the counts grow quadratically (see `_mcx_gates` and `_grover_iteration_gates`)
+_MCX_NOANCILLA_GATES = (0, 1, 1, 30, 43, 89, 206)
+_GROVER_ITERATION_GATES = {"noancilla": (0, 8, 14, 23, 56, 135, 293), "v-chain": (0, 8, 14, 23, 34, 100)}
+
+# share of two-qubit gates and ratio of depth to gate count of decomposed multi-controlled gates
+_TWO_QUBIT_GATE_SHARE = 0.45
+_DEPTH_PER_GATE = 0.9
+
+
+@dataclass(frozen=True)
+class ResourceEstimate:
+    """Estimated resources of a benchmark circuit on the target-independent level.
+
+    Attributes:
+        num_qubits: number of qubits
+        gate_counts: number of gates by gate name (including measurements and barriers)
+        depth: depth of the circuit
+    """
+
+    num_qubits: int
+    gate_counts: dict[str, int]
+    depth: int
+
+    @property
+    def num_gates(self) -> int:
+        """Total number of operations except for barriers."""
+        return sum(count for name, count in self.gate_counts.items() if name != "barrier")
+
+    @property
+    def generation_time(self) -> Literal["seconds", "minutes", "hours", "infeasible"]:
+        """Expected time class for creating and compiling the circuit."""
+        for time_class, max_gates in GENERATION_TIME_CLASSES:
+            if self.num_gates < max_gates:
+                return time_class
+        return "infeasible"
+
+
+def estimate_resources(
+    benchmark_name: str,
+    circuit_size: int | None = None,
+    benchmark_instance_name: str | None = None,
+    **kwargs: Unpack[BenchmarkOptions],
+) -> ResourceEstimate:
+    """Estimates the resources of a benchmark on the target-independent level using closed-form formulas.
+
+    The estimates are exact for benchmarks with a fixed structure (e.g., "ghz" or "qft") and approximate the gate
+    counts of decomposed multi-controlled gates (e.g., for "grover" and "qwalk"), randomly generated structures (e.g.,
+    for "qaoa" and "randomcircuit") and Shor's algorithm. Their purpose is to tell feasible from infeasible sizes
+    before generating a benchmark. For "qaoa" on sparse graphs, the depth is only a lower bound. For circuits with a
+    for loop (``use_for_loop`` of "grover" and "qwalk"), the gates of the loop body are counted once, as they are
+    created and compiled once, and the ``for_loop`` operation itself is counted as well.
+
+    Arguments:
+        benchmark_name: name of the benchmark (including the ancillary mode for grover and qwalk)
+        circuit_size: input for the benchmark creation, in most cases this is equal to the qubit number
+        benchmark_instance_name: input selection for some benchmarks, namely "shor"
+        kwargs: additional arguments of the benchmark creation, which must be supported by the estimate of the
+            benchmark, i.e., be taken into account (e.g., the ``degree`` of "graphstate") or not change the structure
+            of the circuit (e.g., ``parameterized``)
+
+    Returns:
+        the estimated resources
+
+    Raises:
+        ValueError: if there is no estimate for the benchmark or for one of the additional arguments (e.g., the
+            ``coin_state_preparation`` of "qwalk")
+    """
+    if benchmark_name == "shor":
+        from .benchmarks.shor import get_instance  # noqa: PLC0415
+
+        if not isinstance(benchmark_instance_name, str):
+            msg = "benchmark_instance_name must be defined for this benchmark."
+            raise ValueError(msg)
+        return _estimate_shor(get_instance(benchmark_instance_name)[0].bit_length())
+    if benchmark_name not in _ESTIMATORS:
+        msg = f"No resource estimate available for benchmark {benchmark_name}."
+        raise ValueError(msg)
+    if not (isinstance(circuit_size, int) and circuit_size > 0):
+        msg = "circuit_size must be None or int for this benchmark."
+        raise ValueError(msg)
+    options = cast("dict[str, Any]", kwargs)
+    unsupported = _get_unsupported_options(benchmark_name, options)
+    if unsupported:
+        msg = f"No resource estimate available for benchmark {benchmark_name} with the arguments {unsupported}."
+        raise ValueError(msg)
+    return _ESTIMATORS[benchmark_name](circuit_size, **options)
+
+
+def check_gate_budget(
+    benchmark_name: str,
+    circuit_size: int | None = None,
+    benchmark_instance_name: str | None = None,
+    gate_budget: int | None = DEFAULT_GATE_BUDGET,
+    **kwargs: Unpack[BenchmarkOptions],
+) -> ResourceEstimate | None:
+    """Refuses benchmarks whose estimated number of gates exceeds the budget and warns about slow ones.
+
+    Benchmarks without a resource estimate (see ``BenchmarkSpec.has_resource_estimate``), e.g., registered third-party
+    benchmarks, and benchmarks with additional arguments that the estimate does not support are always admitted.
+
+    Arguments:
+        benchmark_name: name of the benchmark (including the ancillary mode for grover and qwalk)
+        circuit_size: input for the benchmark creation, in most cases this is equal to the qubit number
+        benchmark_instance_name: input selection for some benchmarks, namely "shor"
+        gate_budget: maximum estimated number of gates or ``None`` to admit every benchmark
+        kwargs: additional arguments of the benchmark creation (see `estimate_resources`)
+
+    Returns:
+        the estimated resources of the benchmark or ``None`` if there is no estimate for it
+    """
+    spec, _ = get_benchmark_spec(benchmark_name)
+    if not spec.has_resource_estimate or _get_unsupported_options(benchmark_name, cast("dict[str, Any]", kwargs)):
+        return None
+    estimate = estimate_resources(benchmark_name, circuit_size, benchmark_instance_name, **kwargs)
+    if gate_budget is not None and estimate.num_gates > gate_budget:
+        msg = (
+            f"Benchmark {benchmark_name} is estimated to consist of {estimate.num_gates} gates, which exceeds the gate "
+            f"budget of {gate_budget} gates."
+        )
+        raise ValueError(msg)
+    if estimate.generation_time in ("hours", "infeasible"):
+        warnings.warn(
+            f"Benchmark {benchmark_name} is estimated to consist of {estimate.num_gates} gates; generating it may take "
+            "hours.",
+            stacklevel=2,
+        )
+    return estimate
+
+
+def _get_unsupported_options(benchmark_name: str, options: dict[str, Any]) -> list[str]:
+    """Returns the additional arguments of a benchmark that its estimator does not accept."""
+    estimator = _ESTIMATORS.get(benchmark_name)
+    if estimator is None:
+        return []
+    # the first parameter is the circuit size, while the keywords bound by `partial` select the variant of the benchmark
+    supported = list(inspect.signature(estimator).parameters)[1:]
+    bound = estimator.keywords if isinstance(estimator, partial) else {}
+    return sorted(set(options).difference(supported).union(bound.keys() & options.keys()))
+
+
+def _mcx_gates(num_controls: int, mode: str) -> int:
+    """Number of gates of a decomposed multi-controlled X gate."""
+    if mode == "v-chain":
+        return max(1, 2 * num_controls - 3)
+    if num_controls < len(_MCX_NOANCILLA_GATES):
+        return _MCX_NOANCILLA_GATES[num_controls]
+    return 16 * num_controls**2 - 108 * num_controls + 301
+
+
+def _grover_iteration_gates(num_search_qubits: int, mode: str) -> int:
+    """Number of gates of one decomposed Grover iteration (oracle and diffusion operator)."""
+    m = num_search_qubits
+    small = _GROVER_ITERATION_GATES[mode]
+    if m < len(small):
+        return small[m]
+    if mode == "v-chain":
+        return 16 * m**2 - 105 * m + 296
+    return 32 * m**2 - 248 * m + 726
+
+
+def _decomposed(num_gates: int) -> dict[str, int]:
+    """Splits the gates of decomposed multi-controlled gates into two-qubit and single-qubit gates."""
+    two_qubit_gates = round(_TWO_QUBIT_GATE_SHARE * num_gates)
+    return {"cx": two_qubit_gates, "u": num_gates - two_qubit_gates}
+
+
+def _with_measurements(
+    num_qubits: int, gate_counts: dict[str, int], depth: int, num_measurements: int | None = None, barrier: bool = True
+) -> ResourceEstimate:
+    """Adds the final measurements (of all qubits by default) to an estimate."""
+    gate_counts = {name: count for name, count in gate_counts.items() if count > 0}
+    gate_counts["measure"] = num_qubits if num_measurements is None else num_measurements
+    if barrier:
+        gate_counts["barrier"] = 1
+    return ResourceEstimate(num_qubits, gate_counts, depth + 1)
+
+
+def _estimate_ae(n: int, probability: float = 0.2) -> ResourceEstimate:  # noqa: ARG001
+    m = n - 1  # evaluation qubits
+    gates = {"h": 2 * m, "ry": 1, "cu": 2**m - 1, "cp": m * (m - 1) // 2}
+    return _with_measurements(n, gates, 2**m + 2 * m - 1)
+
+
+def _estimate_bv(n: int) -> ResourceEstimate:
+    ones = (n - 1) // 2  # the default hidden string alternates between 0 and 1
+    gates = {"x": 1, "h": 2 * ones, "cz": ones}
+    return _with_measurements(n, gates, ones + 2, num_measurements=n - 1, barrier=False)
+
+
+def _estimate_dj(n: int) -> ResourceEstimate:
+    m = n - 1
+    return _with_measurements(n, {"h": 2 * m + 1, "cx": m}, m + 2, num_measurements=m)
+
+
+def _estimate_ghz(n: int) -> ResourceEstimate:
+    return _with_measurements(n, {"h": 1, "cx": n - 1}, n)
+
+
+def _estimate_graphstate(n: int, degree: int = 2, color_edges: bool = False) -> ResourceEstimate:  # noqa: ARG001
+    return _with_measurements(n, {"h": n, "cz": n * degree // 2}, degree + 2)
+
+
+def _estimate_grover(n: int, mode: str, use_for_loop: bool = False) -> ResourceEstimate:
+    m = n - 1  # search qubits
+    iterations = 1 if use_for_loop else int(math.pi / 4 * math.sqrt(2**m))
+    num_qubits = n + max(0, m - 4) if mode == "v-chain" else n
+    iteration_gates = iterations * _grover_iteration_gates(m, mode)
+    gates = {"h": m, "x": 1, **_decomposed(iteration_gates), "for_loop": int(use_for_loop)}
+    return _with_measurements(num_qubits, gates, round(_DEPTH_PER_GATE * iteration_gates) + 1)
+
+
+def _estimate_qaoa(
+    n: int,
+    repetitions: int = 2,
+    seed: int = 42,  # noqa: ARG001
+    graph: str = "dense",
+    edge_probability: float = 0.5,
+    degree: int = 3,
+    parameterized: bool = False,  # noqa: ARG001
+) -> ResourceEstimate:
+    if graph == "dense":
+        edges, max_degree = round(n * (n - 1) / 4), n  # the edges are included with probability 1/2
+    elif graph == "erdos-renyi":
+        edges, max_degree = round(edge_probability * n * (n - 1) / 2), math.ceil(edge_probability * (n - 1))
+    elif graph == "regular":
+        edges, max_degree = n * degree // 2, degree
+    elif graph == "lattice":
+        rows = max(1, math.isqrt(n))
+        columns = math.ceil(n / rows)
+        edges, max_degree = 2 * n - math.ceil(n / columns) - columns, 4
+    else:
+        edges, max_degree = round(6 * n / 5), 3  # two out of five nodes of the heavy-hex lattice have degree 3
+    edges = max(0, edges)
+    max_degree = min(max_degree, n - 1)
+    gates = {"h": n, "rzz": repetitions * edges, "rx": repetitions * n}
+    depth = repetitions * (max_degree + 2) + 1
+    return ResourceEstimate(n, {name: count for name, count in gates.items() if count > 0}, depth)
+
+
+def _estimate_qft(n: int, entangled: bool = False) -> ResourceEstimate:
+    gates = {"h": n, "cp": n * (n - 1) // 2, "swap": n // 2}
+    if entangled:
+        gates["h"] += 1
+        gates["cx"] = n - 1
+    return _with_measurements(n, gates, 2 * n + (2 if entangled else 0))
+
+
+def _estimate_qnn(n: int, parameterized: bool = False) -> ResourceEstimate:  # noqa: ARG001
+    gates = {"u2": 2 * n, "p": n * (n - 1), "cx": 2 * n * (n - 1) + n - 1, "ry": 2 * n}
+    return _with_measurements(n, gates, 10 * n - 6)
+
+
+def _estimate_qpe(n: int, exact: bool) -> ResourceEstimate:
+    m = n - 1  # evaluation qubits
+    controlled_phases = m - 1 if exact else m  # the exact phase makes the last controlled phase vanish
+    gates = {"x": 1, "h": 2 * m, "cp": controlled_phases + m * (m - 1) // 2, "swap": m // 2}
+    return _with_measurements(n, gates, 3 * m + 1, num_measurements=m)
+
+
+def _estimate_qwalk(n: int, mode: str, depth: int = 3, use_for_loop: bool = False) -> ResourceEstimate:
+    m = n - 1  # node qubits
+    steps = 1 if use_for_loop else depth
+    num_qubits = n + m - 2 if mode == "v-chain" and m > 2 else n
+    mcx_gates = steps * 2 * sum(_mcx_gates(num_controls, mode) for num_controls in range(2, m + 1))
+    gates = {"h": steps, "x": steps * 2 * m, **_decomposed(mcx_gates), "for_loop": int(use_for_loop)}
+    gates["cx"] += 2 * steps
+    return _with_measurements(num_qubits, gates, round(_DEPTH_PER_GATE * mcx_gates) + 5 * steps)
+
+
+def _estimate_randomcircuit(
+    n: int,
+    native: bool = False,
+    depth_ratio: float = 2.0,
+    two_qubit_gate_density: float = 0.5,
+    seed: int = 10,  # noqa: ARG001
+) -> ResourceEstimate:
+    depth = max(1, round(depth_ratio * n))
+    if not native:
+        return _with_measurements(n, {"u3": n * depth // 2, "cx": n * depth // 2}, n * (depth + 4) // 2)
+    # every layer acts on every qubit, with two-qubit gates on the given fraction of the qubits
+    two_qubit_gates = round(depth * (n // 2) * two_qubit_gate_density)
+    return _with_measurements(n, {"u3": depth * n - 2 * two_qubit_gates, "cx": two_qubit_gates}, depth)
+
+
+def _estimate_shor(n: int) -> ResourceEstimate:
+    # 2n controlled multipliers, each consisting of 2n modular adders and four QFTs on the n + 1 qubits of the adders
+    m = n + 1
+    num_adders = 4 * n**2
+    gates = {
+        "cp": num_adders * (2 * m**2 + 8 * m) + 4 * n * m * (m - 1) + n * (2 * n - 1),
+        "h": num_adders * 4 * m + 8 * n * m + 4 * n,
+        "p": num_adders * m,
+        "cx": num_adders * 8,
+        "cswap": 2 * n**2,
+        "swap": n,
+    }
+    return _with_measurements(4 * n + 2, gates, 56 * n**3 + 109 * n**2)
+
+
+def _estimate_vqe(n: int, rotation: str, parameterized: bool = False) -> ResourceEstimate:  # noqa: ARG001
+    repetitions = 3  # repetitions of the ansatz
+    gates = {rotation: (repetitions + 1) * n, "cx": repetitions * n * (n - 1) // 2}
+    return _with_measurements(n, gates, 4 * n + 1)
+
+
+def _estimate_wstate(n: int) -> ResourceEstimate:
+    return _with_measurements(n, {"x": 1, "ry": 2 * (n - 1), "cz": n - 1, "cx": n - 1}, 2 * n)
+
+
+# the estimators take the circuit size and the additional arguments of the benchmark creation that they support
+_ESTIMATORS: dict[str, Callable[..., ResourceEstimate]] = {
+    "ae": _estimate_ae,
+    "bv": _estimate_bv,
+    "dj": _estimate_dj,
+    "ghz": _estimate_ghz,
+    "graphstate": _estimate_graphstate,
+    "grover-noancilla": partial(_estimate_grover, mode="noancilla"),
+    "grover-v-chain": partial(_estimate_grover, mode="v-chain"),
+    "qaoa": _estimate_qaoa,
+    "qft": partial(_estimate_qft, entangled=False),
+    "qftentangled": partial(_estimate_qft, entangled=True),
+    "qnn": _estimate_qnn,
+    "qpeexact": partial(_estimate_qpe, exact=True),
+    "qpeinexact": partial(_estimate_qpe, exact=False),
+    "qwalk-noancilla": partial(_estimate_qwalk, mode="noancilla"),
+    "qwalk-v-chain": partial(_estimate_qwalk, mode="v-chain"),
+    "randomcircuit": _estimate_randomcircuit,
+    "vqerealamprandom": partial(_estimate_vqe, rotation="ry"),
+    "vqesu2random": partial(_estimate_vqe, rotation="u3"),
+    "vqetwolocalrandom": partial(_estimate_vqe, rotation="ry"),
+    "wstate": _estimate_wstate,
+}
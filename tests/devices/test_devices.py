@@ -10,20 +10,34 @@
 
 from __future__ import annotations
 
+import json
+import logging
 import re
+import subprocess
+import sys
+import time
+from pathlib import Path
 from typing import cast
 
+import numpy as np
 import pytest
 
 from mqt.bench.devices import (
     Device,
     IBMWashington,
+    calibration_cache,
+    get_available_device_names,
     get_available_devices,
+    get_available_native_gatesets,
     get_device_by_name,
     get_native_gateset_by_name,
 )
 from mqt.bench.devices.calibration import get_device_calibration_path
-from mqt.bench.devices.ionq import DeviceCalibration, IonQHarmony
+from mqt.bench.devices.ionq import DeviceCalibration, IonQDevice, IonQHarmony
+from mqt.bench.devices.iqm import IQMAdonis
+from mqt.bench.devices.oqc import OQCLucy
+from mqt.bench.devices.quantinuum import QuantinuumH2
+from mqt.bench.devices.rigetti import RigettiAspenM3
 
 
 @pytest.mark.parametrize("device", get_available_devices(), ids=lambda device: cast("str", device.name))
@@ -46,6 +60,70 @@ def test_sanitized_devices(device: Device) -> None:
             assert device.calibration.two_qubit_gate_fidelity[qubit1, qubit2][gate] > 0
 
 
+@pytest.mark.parametrize("device", get_available_devices(), ids=lambda device: cast("str", device.name))
+def test_calibration_arrays(device: Device) -> None:
+    """Test that the vectorized lookups of the calibration data match the getters of the device."""
+    device.check_calibration()
+    assert device.calibration is not None
+    calibration = device.calibration
+    qubits = np.arange(device.num_qubits)
+    for gate in device.get_single_qubit_gates():
+        gate_ids = calibration.arrays.get_gate_ids([gate])
+        fidelities = calibration.get_single_qubit_gate_fidelity_many(gate_ids, qubits)
+        assert fidelities.tolist() == [device.get_single_qubit_gate_fidelity(gate, qubit) for qubit in qubits.tolist()]
+
+    edges = np.array([list(edge) for edge in device.coupling_map]).reshape(-1, 2)
+    gates = sorted(device.get_two_qubit_gates())
+    gate_ids = calibration.arrays.get_gate_ids(gates)
+    fidelities = calibration.get_two_qubit_gate_fidelity_many(gate_ids[:, np.newaxis], edges[:, 0], edges[:, 1])
+    assert fidelities.shape == (len(gates), len(edges))
+    for gate, gate_fidelities in zip(gates, fidelities.tolist()):
+        assert gate_fidelities == [
+            device.get_two_qubit_gate_fidelity(gate, qubit1, qubit2) for qubit1, qubit2 in edges.tolist()
+        ]
+
+    assert calibration.get_readout_fidelity_many(qubits).tolist() == [
+        device.get_readout_fidelity(qubit) for qubit in qubits.tolist()
+    ]
+    if calibration.t1:
+        assert calibration.get_t1_many(qubits).tolist() == [calibration.get_t1(qubit) for qubit in qubits.tolist()]
+
+
+def test_calibration_arrays_missing_values() -> None:
+    """Test the array representation of incomplete calibration data."""
+    calibration = DeviceCalibration(
+        single_qubit_gate_fidelity={0: {"x": 0.9}, 2: {"x": 0.8, "y": 0.7}},
+        two_qubit_gate_fidelity={(2, 0): {"cz": 0.95}, (0, 1): {"cz": 0.9}, (0, 2): {"cz": 0.85}},
+        t1={1: 1e-4},
+    )
+    arrays = calibration.arrays
+    assert arrays.gate_names == ("cz", "x", "y")
+    assert arrays.edge_offsets.tolist() == [0, 2, 2, 3]
+    assert arrays.edge_targets.tolist() == [1, 2, 0]
+    assert arrays.get_edge_ids([0, 2, 1, -1, 5], [2, 0, 0, 0, 0]).tolist() == [1, 2, -1, -1, -1]
+    assert calibration.get_two_qubit_gate_fidelity_many(0, [0, 2], [1, 0]).tolist() == [0.9, 0.95]
+    assert calibration.get_single_qubit_gate_fidelity_many([1, 2], 2).tolist() == [0.8, 0.7]
+
+    with pytest.raises(ValueError, match=r"Two-qubit fidelity not available for 1 of the requested values."):
+        calibration.get_two_qubit_gate_fidelity_many(0, [0, 1], [1, 0])
+    with pytest.raises(ValueError, match=r"Single-qubit fidelity not available for 2 of the requested values."):
+        calibration.get_single_qubit_gate_fidelity_many(2, [0, 1, 2])
+    with pytest.raises(ValueError, match=r"T1 not available for 1 of the requested values."):
+        calibration.get_t1_many([0, 1])
+    with pytest.raises(ValueError, match=r"Readout duration not available"):
+        calibration.get_readout_duration_many([0])
+    with pytest.raises(ValueError, match=r"Calibration data for gates \['rz'\] not available."):
+        arrays.get_gate_ids(["x", "rz"])
+
+    # the array representation is rebuilt after modifying the tables and invalidating it
+    calibration.t1[0] = 2e-4
+    calibration.two_qubit_gate_fidelity[0, 1]["cz"] = 0.5
+    assert calibration.arrays is arrays
+    calibration.reset_arrays()
+    assert calibration.get_t1_many([0, 1]).tolist() == [2e-4, 1e-4]
+    assert calibration.get_two_qubit_gate_fidelity_many(0, [0], [1]).tolist() == [0.5]
+
+
 def test_unsupported_device() -> None:
     """Test that unsupported devices raise errors."""
     with pytest.raises(ValueError, match=r"Device unsupported not found in available devices."):
@@ -54,6 +132,119 @@ def test_unsupported_device() -> None:
         get_native_gateset_by_name("unsupported")
 
 
+def test_device_registry() -> None:
+    """Test that the devices and gatesets looked up by name are the ones of the lists of all devices and gatesets."""
+    devices = get_available_devices()
+    assert [device.name for device in devices] == get_available_device_names()
+    for device in devices:
+        assert get_device_by_name(device.name) is device
+    for gateset in get_available_native_gatesets():
+        assert get_native_gateset_by_name(gateset.name) == gateset
+
+
+def test_devices_loaded_lazily() -> None:
+    """Test that looking up a device only imports the module of that device."""
+    code = (
+        "import sys\n"
+        "import mqt.bench\n"
+        "from mqt.bench.devices import get_device_by_name, get_native_gateset_by_name\n"
+        "assert get_device_by_name('iqm_adonis').name == 'iqm_adonis'\n"
+        "assert get_native_gateset_by_name('iqm').name == 'iqm'\n"
+        "print(sorted(name for name in sys.modules if name.startswith(('mqt.bench.devices.', 'qiskit_ibm_runtime'))))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == str([
+        "mqt.bench.devices.calibration",
+        "mqt.bench.devices.calibration_cache",
+        "mqt.bench.devices.device",
+        "mqt.bench.devices.iqm",
+    ])
+
+
+def test_calibration_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, recwarn: pytest.WarningsRecorder
+) -> None:
+    """Test that JSON-backed devices are restored from the calibration cache without reading their JSON files."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_dir = tmp_path / "mqt.bench" / "calibrations"
+
+    for device_class in (IonQHarmony, IQMAdonis, OQCLucy, QuantinuumH2, RigettiAspenM3):
+        device = device_class()
+        device.read_calibration()
+        cached = device_class()
+        assert "json_calibration" in device.__dict__
+        assert "json_calibration" not in cached.__dict__
+        assert (cached.name, cached.gateset, cached.num_qubits) == (device.name, device.gateset, device.num_qubits)
+        assert cached.coupling_map == [list(edge) for edge in device.coupling_map]
+        recwarn.clear()
+        cached.read_calibration()
+        assert not recwarn.list
+        assert cached.calibration is not None
+        assert "t1" not in cached.calibration.__dict__  # the tables are built from the arrays on first access
+        assert cached.calibration == device.calibration
+        assert "json_calibration" not in cached.__dict__
+    assert len(list(cache_dir.glob("*.bin"))) == 5
+
+    # modified (or user-supplied) calibration files are cached separately
+    calibration_path = tmp_path / "ionq_custom_calibration.json"
+    calibration_data = json.loads(get_device_calibration_path("ionq_harmony").read_text(encoding="utf-8"))
+    calibration_data["fidelity"]["2q"]["mean"] = 0.9
+    calibration_path.write_text(json.dumps(calibration_data), encoding="utf-8")
+    custom = IonQDevice(calibration_path)
+    assert custom.get_two_qubit_gate_fidelity("rxx", 0, 1) == pytest.approx(0.9)
+    assert IonQDevice(calibration_path).get_two_qubit_gate_fidelity("rxx", 0, 1) == pytest.approx(0.9)
+    assert len(list(cache_dir.glob("ionq_custom_calibration_*.bin"))) == 1
+
+    # unreadable cache files are ignored and replaced
+    for data in (b"invalid", b'{"arrays": [["t1", "<f8", [1000]]]}\n'):
+        for path in cache_dir.glob("iqm_adonis_*.bin"):
+            path.write_bytes(data)
+        caplog.clear()
+        with caplog.at_level(logging.WARNING):
+            device = IQMAdonis()
+        assert "Ignoring unreadable calibration cache entry" in caplog.text
+        device.read_calibration()
+        assert "json_calibration" not in IQMAdonis().__dict__
+
+    # failed writes do not leave temporary files behind
+    def fail(*_args: object, **_kwargs: object) -> None:
+        msg = "No space left on device"
+        raise OSError(msg)
+
+    calibration_data["fidelity"]["2q"]["mean"] = 0.8
+    calibration_path.write_text(json.dumps(calibration_data), encoding="utf-8")
+    monkeypatch.setattr(Path, "replace", fail)
+    with caplog.at_level(logging.WARNING):
+        assert IonQDevice(calibration_path).get_two_qubit_gate_fidelity("rxx", 0, 1) == pytest.approx(0.8)
+    assert "Calibration data cannot be cached" in caplog.text
+    assert not list(cache_dir.glob("*.tmp"))
+
+
+def test_calibration_cache_speedup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> None:
+    """Test that restoring a device from the calibration cache is faster than reading its JSON file."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    QuantinuumH2().read_calibration()
+
+    def best_time() -> float:
+        times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            QuantinuumH2().read_calibration()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    warm = best_time()
+    with monkeypatch.context() as context:
+        context.setattr(calibration_cache, "load_cached_calibration", lambda _calibration_path: None)
+        context.setattr(calibration_cache, "save_cached_calibration", lambda _calibration_path, _cached: None)
+        cold = best_time()
+    request.node.user_properties.append(("json_ms", round(cold * 1e3, 3)))
+    request.node.user_properties.append(("cache_ms", round(warm * 1e3, 3)))
+    assert warm < cold
+
+
 def test_device_calibration_autoread() -> None:
     """Test that all device calibration methods raise errors when no calibration data is available."""
     IBMWashington()
@@ -11,7 +11,18 @@
 from __future__ import annotations
 
 import builtins
+import gc
+import hashlib
 import io
+import itertools
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import closing
 from datetime import date
 from importlib import metadata
 from pathlib import Path
@@ -19,18 +30,43 @@ from typing import TYPE_CHECKING, NoReturn
 
 if TYPE_CHECKING:  # pragma: no cover
     import types
+    from collections.abc import Iterator
 
 from enum import Enum
 
+import networkx as nx
+import numpy as np
 import pytest
-from qiskit import QuantumCircuit, qpy
+from qiskit import QuantumCircuit, QuantumRegister, qpy, transpile
+from qiskit.circuit.library import GraphState
+from qiskit.qasm3 import dumps as dumps_qasm3
 from qiskit.qasm3 import load as load_qasm3
-
+from qiskit.quantum_info import Operator, Statevector
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import UnrollForLoops
+from qiskit.transpiler.passes.synthesis import SolovayKitaev
+
+from mqt.bench import (
+    batch,
+    benchmark_generation,
+    bind,
+    bind_many,
+    compilation,
+    estimate_duration,
+    estimate_success_probability,
+    estimate_success_probability_many,
+    manifest,
+    multi_controlled,
+    registry,
+)
+from mqt.bench.batch import BenchmarkJob, expand_benchmark_configs, generate_benchmarks, iter_benchmarks
 from mqt.bench.benchmark_generation import (
+    Benchmark,
     CompilerSettings,
     QiskitSettings,
     generate_filename,
     get_alg_level,
+    get_all_levels,
     get_benchmark,
     get_indep_level,
     get_mapped_level,
@@ -62,12 +98,28 @@ from mqt.bench.benchmarks import (
     vqetwolocalrandom,
     wstate,
 )
+from mqt.bench.bulk import append_measurements
+from mqt.bench.cache import CircuitCache, circuit_fingerprint, configure_cache, get_user_cache_dir
+from mqt.bench.compilation import (
+    compile_circuits,
+    get_pass_manager,
+    load_basic_approximations,
+    synthesize_single_qubit_gates,
+)
 from mqt.bench.devices import (
     get_available_devices,
     get_available_native_gatesets,
     get_device_by_name,
     get_native_gateset_by_name,
 )
+from mqt.bench.limits import GenerationFailure, GenerationLimitError, run_with_limits
+from mqt.bench.manifest import (
+    MANIFEST_FILENAME,
+    Manifest,
+    clear_manifests,
+    config_hash,
+    is_up_to_date,
+)
 from mqt.bench.output import (
     MQTBenchExporterError,
     OutputFormat,
@@ -76,6 +128,7 @@ from mqt.bench.output import (
     save_circuit,
     write_circuit,
 )
+from mqt.bench.resources import check_gate_budget, estimate_resources
 
 
 @pytest.fixture
@@ -421,10 +474,10 @@ def test_get_benchmark_faulty_parameters() -> None:
         get_benchmark("wrong_name", 2, 6)
     match = "Selected level must be in"
     with pytest.raises(ValueError, match=match):
-        get_benchmark(  # type: ignore[call-overload]
+        get_benchmark(
             "qpeexact",
             8,
-            "wrong_size",
+            "wrong_size",  # type: ignore[arg-type]
             None,
             CompilerSettings(qiskit=QiskitSettings(optimization_level=1)),
             "rigetti",
@@ -444,11 +497,11 @@ def test_get_benchmark_faulty_parameters() -> None:
 
     match = "benchmark_instance_name must be defined for this benchmark."
     with pytest.raises(ValueError, match=match):
-        get_benchmark(  # type: ignore[call-overload]
+        get_benchmark(
             "shor",
             1,
             3,
-            2,
+            2,  # type: ignore[arg-type]
             CompilerSettings(qiskit=QiskitSettings(optimization_level=1)),
             "rigetti",
             "rigetti_aspen_m3",
@@ -456,12 +509,12 @@ def test_get_benchmark_faulty_parameters() -> None:
 
     match = "compiler_settings must be of type CompilerSettings or None"
     with pytest.raises(ValueError, match=match):
-        get_benchmark(  # type: ignore[call-overload]
+        get_benchmark(
             "qpeexact",
             1,
             3,
             None,
-            "wrong_compiler_settings",
+            "wrong_compiler_settings",  # type: ignore[arg-type]
             "rigetti",
             "rigetti_aspen_m3",
         )
@@ -581,12 +634,568 @@ def test_clifford_t() -> None:
         assert gate_type in get_native_gateset_by_name("clifford+t").gates
 
 
+@pytest.mark.parametrize(("gateset", "device_name"), [("ibm_falcon", "ibm_montreal"), ("ionq", "ibm_montreal")])
+def test_get_all_levels(gateset: str, device_name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that all levels are compiled from the previous level and that the algorithm level is created once."""
+    create_circuit = benchmark_generation.create_circuit
+    calls = []
+
+    def count_calls(*args: object, **kwargs: object) -> QuantumCircuit:
+        calls.append(args)
+        return create_circuit(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(benchmark_generation, "create_circuit", count_calls)
+    circuits = get_all_levels("grover-noancilla", 3, gateset=gateset, device_name=device_name)
+    assert len(calls) == 1
+    assert list(circuits) == ["alg", "indep", "nativegates", "mapped"]
+
+    assert circuits["alg"].name == "grover-noancilla"
+    assert set(circuits["indep"].count_ops()) <= {*get_openqasm_gates(), "measure", "barrier"}
+    native_gates = get_native_gateset_by_name(gateset).gates
+    assert set(circuits["nativegates"].count_ops()) <= {*native_gates, "measure", "barrier"}
+    device = get_device_by_name(device_name)
+    assert set(circuits["mapped"].count_ops()) <= {*device.gateset.gates, "measure", "barrier"}
+    assert circuits["mapped"].num_qubits == device.num_qubits
+
+
+def test_get_all_levels_faulty_parameters() -> None:
+    """Test that get_all_levels validates its parameters."""
+    with pytest.raises(ValueError, match="Selected benchmark is not supported"):
+        get_all_levels("wrong_name", 3)
+    with pytest.raises(ValueError, match="benchmark_instance_name must be defined"):
+        get_all_levels("shor")
+    with pytest.raises(ValueError, match="Selected device_name must be in"):
+        get_all_levels("ghz", 3, device_name="wrong_device")
+
+
+def test_pass_manager_registry() -> None:
+    """Test that pass managers are shared per configuration and compile like transpile."""
+    device = get_device_by_name("ibm_montreal")
+    pm = get_pass_manager(device.gateset.gates, 1, device.coupling_map)
+    assert get_pass_manager(list(device.gateset.gates), 1, [list(edge) for edge in device.coupling_map]) is pm
+    assert get_pass_manager(device.gateset.gates, 2, device.coupling_map) is not pm
+    assert get_pass_manager(device.gateset.gates, 1) is not pm
+
+    circuits = [ghz.create_circuit(n) for n in range(3, 6)]
+    compiled = compile_circuits(circuits, device, 1)
+    for qc, compiled_qc in zip(circuits, compiled):
+        expected = transpile(
+            qc,
+            basis_gates=device.gateset.gates,
+            coupling_map=device.coupling_map,
+            optimization_level=1,
+            seed_transpiler=10,
+        )
+        assert compiled_qc == expected
+
+    gateset = get_native_gateset_by_name("clifford+t")
+    for compiled_qc in compile_circuits([qft.create_circuit(3), qft.create_circuit(4)], gateset, 1):
+        assert set(compiled_qc.count_ops()) <= {*gateset.gates, "measure", "barrier"}
+
+
+def test_basic_approximations_stored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the Solovay-Kitaev basic approximations are generated once and loaded from disk afterwards."""
+    approximations = load_basic_approximations(["h", "t"], 3, directory=tmp_path)
+    path = tmp_path / "h_t_depth3.npy"
+    assert path.is_file()
+    assert "h t h" in approximations
+
+    monkeypatch.setattr(compilation, "generate_basic_approximations", lambda *_args: pytest.fail("not stored"))
+    loaded = load_basic_approximations(["h", "t"], 3, directory=tmp_path)
+    assert list(loaded) == list(approximations)
+    for label, (product, phase) in approximations.items():
+        assert np.allclose(loaded[label][0], product)
+        assert loaded[label][1] == pytest.approx(phase)
+
+    monkeypatch.undo()
+    path.write_bytes(b"corrupt")
+    assert list(load_basic_approximations(["h", "t"], 3, directory=tmp_path)) == list(approximations)
+    assert "Regenerating unreadable basic approximations" in caplog.text
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_user_cache_dir() == tmp_path / "mqt.bench"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_synthesize_single_qubit_gates(jobs: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that every distinct single-qubit gate is synthesized once and that the sequences are reused."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(compilation, "MIN_PARALLEL_SYNTHESES", 1)
+    compilation._get_synthesis_memo.cache_clear()  # noqa: SLF001
+
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    for qubit in range(3):
+        qc.rz(0.25, qubit)
+        qc.rx(1.5, qubit)
+        qc.cx(qubit, (qubit + 1) % 3)
+    qc.ry(0.25, 2)
+    expected = PassManager(SolovayKitaev(basic_approximations=load_basic_approximations())).run(qc)
+
+    if jobs == 1:
+        # without explicitly requested jobs, no worker processes are started
+        monkeypatch.setattr(compilation, "ProcessPoolExecutor", lambda *_args, **_kwargs: pytest.fail("parallel"))
+        assert synthesize_single_qubit_gates([qc]) == [expected]
+    else:
+        assert synthesize_single_qubit_gates([qc], jobs=jobs) == [expected]
+    (memo_path,) = (tmp_path / "mqt.bench" / "solovay_kitaev").glob("*_sequences.jsonl")
+    assert len([line for line in memo_path.read_text(encoding="utf-8").splitlines() if line]) == 4
+
+    # new gates are appended, while incomplete lines, e.g., of interrupted writers, are skipped
+    with memo_path.open("a", encoding="utf-8") as f:
+        f.write('["rz", [0.5')
+    compilation._get_synthesis_memo.cache_clear()  # noqa: SLF001
+    qc.rz(0.75, 0)
+    expected = PassManager(SolovayKitaev(basic_approximations=load_basic_approximations())).run(qc)
+    assert synthesize_single_qubit_gates([qc], jobs=1) == [expected]
+
+    # the sequences are loaded from disk instead of being synthesized again
+    compilation._get_synthesis_memo.cache_clear()  # noqa: SLF001
+    monkeypatch.setattr(compilation, "_synthesize_gate", lambda *_args: pytest.fail("not memoized"))
+    assert synthesize_single_qubit_gates([qc, qc], jobs=1) == [expected, expected]
+    compilation._get_synthesis_memo.cache_clear()  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    "benchmark_name",
+    [name for name in get_supported_benchmarks() if name not in ("shor", "graphstate", "randomcircuit")],
+)
+def test_estimate_resources(benchmark_name: str) -> None:
+    """Test that the estimated resources match the target-independent circuits."""
+    for circuit_size in (3, 6):
+        qc = get_benchmark(benchmark_name, "indep", circuit_size)
+        estimate = estimate_resources(benchmark_name, circuit_size)
+        assert estimate.num_qubits == qc.num_qubits
+        num_gates = sum(count for name, count in qc.count_ops().items() if name != "barrier")
+        assert num_gates / 1.5 <= estimate.num_gates <= 1.5 * num_gates
+        assert qc.depth() / 1.5 <= estimate.depth <= 1.5 * qc.depth()
+        assert estimate.generation_time == "seconds"
+
+
+def test_estimate_resources_options() -> None:
+    """Test that the arguments changing the structure of a benchmark are estimated and unsupported ones rejected."""
+
+    def count_gates(qc: QuantumCircuit) -> int:
+        # the gates of loop bodies are counted once
+        return sum(
+            1 + sum(count_gates(block) for block in getattr(instruction.operation, "blocks", ()))
+            for instruction in qc.data
+            if instruction.name != "barrier"
+        )
+
+    for degree in (3, 4):
+        qc = get_benchmark("graphstate", "indep", 8, degree=degree, color_edges=True)
+        estimate = estimate_resources("graphstate", 8, degree=degree, color_edges=True)
+        assert estimate.gate_counts["cz"] == qc.count_ops()["cz"]
+    for benchmark_name, options in [
+        ("grover-noancilla", {"use_for_loop": True}),
+        ("grover-v-chain", {"use_for_loop": True}),
+        ("qwalk-noancilla", {"use_for_loop": True}),
+        ("qwalk-noancilla", {"depth": 6}),
+        ("qwalk-v-chain", {"depth": 2, "use_for_loop": True}),
+    ]:
+        qc = get_benchmark(benchmark_name, "indep", 6, **options)  # type: ignore[arg-type]
+        estimate = estimate_resources(benchmark_name, 6, **options)  # type: ignore[arg-type]
+        assert estimate.gate_counts.get("for_loop", 0) == qc.count_ops().get("for_loop", 0)
+        assert count_gates(qc) / 1.5 <= estimate.num_gates <= 1.5 * count_gates(qc)
+
+    with pytest.raises(ValueError, match=r"with the arguments \['coin_state_preparation'\]"):
+        estimate_resources("qwalk-noancilla", 6, coin_state_preparation=QuantumCircuit(1))
+    with pytest.raises(ValueError, match=r"with the arguments \['dynamic'\]"):
+        estimate_resources("bv", 6, dynamic=True)
+    assert check_gate_budget("bv", 6, gate_budget=0, dynamic=True) is None
+
+
+def test_gate_budget() -> None:
+    """Test that benchmarks exceeding the gate budget are refused and slow ones cause a warning."""
+    assert estimate_resources("shor", None, "xsmall").num_qubits == 18
+    assert estimate_resources("grover-noancilla", 30).generation_time == "infeasible"
+    with pytest.raises(ValueError, match="exceeds the gate budget of 100000000 gates"):
+        get_benchmark("grover-noancilla", "alg", 30)
+    with pytest.raises(ValueError, match="exceeds the gate budget of 10 gates"):
+        get_benchmark("ghz", "alg", 10, gate_budget=10)
+    with pytest.warns(UserWarning, match="may take hours"):
+        estimate = check_gate_budget("grover-noancilla", 20)
+    assert estimate is not None
+    assert estimate.generation_time == "hours"
+    with pytest.raises(ValueError, match="No resource estimate available"):
+        estimate_resources("wrong_name", 3)
+
+
+@pytest.mark.parametrize("graph", qaoa.GRAPH_MODELS)
+def test_qaoa_graph_models(graph: str) -> None:
+    """Test the graph models of QAOA regarding their structure, reproducibility and estimated resources."""
+    num_qubits = 30
+    edges = qaoa.get_edges(num_qubits, np.random.default_rng(1), graph, edge_probability=0.2, degree=4)
+    assert np.all(edges[:, 0] < edges[:, 1])
+    assert len({tuple(edge) for edge in edges.tolist()}) == len(edges)
+    degrees = np.bincount(edges.ravel(), minlength=num_qubits)
+    if graph == "regular":
+        assert np.all(degrees == 4)
+    elif graph == "lattice":
+        # 5 rows of 6 nodes
+        assert len(edges) == 5 * 5 + 4 * 6
+    elif graph == "heavy-hex":
+        assert degrees.max() == 3
+        assert len(edges) >= num_qubits - 1
+
+    qc = qaoa.create_circuit(num_qubits, graph=graph, edge_probability=0.2, degree=4)
+    assert qc == qaoa.create_circuit(num_qubits, graph=graph, edge_probability=0.2, degree=4)
+    estimate = estimate_resources("qaoa", num_qubits, graph=graph, edge_probability=0.2, degree=4)
+    assert qc.count_ops()["rzz"] / 1.5 <= estimate.gate_counts["rzz"] <= 1.5 * qc.count_ops()["rzz"]
+
+
+def test_qaoa_large_sparse_graphs() -> None:
+    """Test that QAOA on sparse graphs scales to many qubits, i.e., that no dense adjacency matrix is built."""
+    qc = get_benchmark("qaoa", "alg", 10_000, graph="erdos-renyi", edge_probability=3 / 10_000, repetitions=1)
+    assert qc.num_qubits == 10_000
+    assert 10_000 < qc.count_ops()["rzz"] < 20_000
+
+    # a dense adjacency matrix of 10^4 nodes would take at least 100 MB
+    for graph in [model for model in qaoa.GRAPH_MODELS if model != "dense"]:
+        tracemalloc.start()
+        try:
+            edges = qaoa.get_edges(10_000, np.random.default_rng(), graph, edge_probability=3 / 10_000, degree=3)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(edges) <= 2 * 10_000
+        assert peak < 20 * 1024**2
+
+    complete = qaoa.get_edges(50, np.random.default_rng(), "erdos-renyi", edge_probability=1)
+    assert complete.tolist() == [list(edge) for edge in itertools.combinations(range(50), 2)]
+    with pytest.raises(ValueError, match="does not exist"):
+        qaoa.get_edges(5, np.random.default_rng(), "regular", degree=3)
+    with pytest.raises(ValueError, match="Unknown graph model"):
+        qaoa.get_edges(5, np.random.default_rng(), "star")
+
+
+def test_graphstate_edge_list() -> None:
+    """Test that the graph state built from the edge list matches Qiskit's graph state and its edge coloring."""
+    random.seed(7)
+    qc = graphstate.create_circuit(12, degree=3)
+    random.seed(7)
+    graph = nx.random_regular_graph(3, 12)
+    expected = QuantumCircuit(QuantumRegister(12, "q"), name="graphstate")
+    expected.compose(GraphState(nx.to_numpy_array(graph)), inplace=True)
+    expected.measure_all()
+    assert qc == expected.decompose(gates_to_decompose="graph_state")
+
+    random.seed(7)
+    colored = graphstate.create_circuit(12, degree=3, color_edges=True)
+    assert Operator(colored.remove_final_measurements(inplace=False)).equiv(
+        Operator(qc.remove_final_measurements(inplace=False))
+    )
+    # one layer of Hadamard gates, at most degree + 1 layers of CZ gates and the measurements
+    assert colored.depth() <= 1 + 4 + 1
+
+    edges = sorted(nx.gnp_random_graph(40, 0.3, seed=1).edges)
+    colors = graphstate.get_edge_coloring(edges, 40)
+    max_degree = max(sum(node in edge for edge in edges) for node in range(40))
+    assert max(colors) <= max_degree
+    for node in range(40):
+        node_colors = [color for edge, color in zip(edges, colors) if node in edge]
+        assert len(node_colors) == len(set(node_colors))
+
+
+@pytest.mark.parametrize("benchmark", [ghz, wstate, bv, dj])
+def test_linear_benchmarks_construction(benchmark: types.ModuleType, request: pytest.FixtureRequest) -> None:
+    """Test that the peak memory of constructing linear-size benchmarks grows linearly.
+
+    The construction time and the peak memory are reported as user properties of the test report (e.g., for
+    ``pytest --report-log``). The time is only reported, since wall-clock ratios are unreliable on shared CI runners.
+    """
+    peak_memories = {}
+    for num_qubits in (2_000, 8_000):
+        # best of three runs without garbage collection, which would otherwise dominate the timing noise
+        durations = []
+        gc.disable()
+        try:
+            for _ in range(3):
+                start = time.perf_counter()
+                qc = benchmark.create_circuit(num_qubits)
+                durations.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        duration = min(durations)
+        assert qc.num_qubits == num_qubits
+
+        tracemalloc.start()
+        try:
+            benchmark.create_circuit(num_qubits)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        request.node.user_properties.append((f"construction_time_s_{num_qubits}", round(duration, 4)))
+        request.node.user_properties.append((f"peak_memory_mib_{num_qubits}", round(peak_memory / 2**20, 2)))
+        peak_memories[num_qubits] = peak_memory
+
+    # four times as many qubits
+    assert peak_memories[8_000] < 6 * peak_memories[2_000]
+
+
+@pytest.mark.parametrize("benchmark", [vqesu2random, vqerealamprandom, vqetwolocalrandom, qnn])
+def test_parameterized_templates(benchmark: types.ModuleType) -> None:
+    """Test that binding the parameterized templates to the random values yields the default circuits."""
+    template = benchmark.create_circuit(4, parameterized=True)
+    assert template.num_parameters > 0
+    values = 2 * np.pi * np.random.default_rng(10).random(template.num_parameters)
+    assert bind(template, values) == benchmark.create_circuit(4)
+
+
+def test_parameterized_benchmarks_bind_after_compile() -> None:
+    """Test that parameterized benchmarks are compiled once and bound to many parameter values afterwards."""
+    qc = qaoa.create_circuit(5, parameterized=True)
+    assert [parameter.name for parameter in qc.parameters] == ["beta[0]", "beta[1]", "gamma[0]", "gamma[1]"]
+    rng = np.random.default_rng(42)
+    rng.integers(0, 2, size=(5, 5))
+    gamma_values = rng.uniform(0, np.pi, 2)
+    beta_values = rng.uniform(0, np.pi, 2)
+    assert bind(qc, [*beta_values, *gamma_values]) == qaoa.create_circuit(5)
+
+    values = np.random.default_rng(0).uniform(0, 2 * np.pi, size=(3, 4))
+    for level in ("indep", "nativegates", "mapped"):
+        template = get_benchmark("qaoa", level, 5, parameterized=True)
+        assert template.num_parameters == 4
+        circuits = bind_many(template, values)
+        assert len(circuits) == 3
+        assert all(circuit.num_parameters == 0 for circuit in circuits)
+        assert circuits[0] != circuits[1]
+    assert bind(template, values[2]) == circuits[2]
+
+    with pytest.raises(ValueError, match="Expected parameter values of shape"):
+        bind_many(template, values[:, :3])
+    with pytest.raises(ValueError, match="cannot be compiled to the clifford"):
+        get_benchmark("qnn", "nativegates", 3, gateset="clifford+t", parameterized=True)
+
+
+@pytest.mark.parametrize("device_name", ["ibm_torino", "ionq_aria1", "iqm_adonis", "quantinuum_h2"])
+def test_estimate_success_probability(device_name: str) -> None:
+    """Test the success probability estimate against the product of the fidelities looked up per operation."""
+    device = get_device_by_name(device_name)
+    device.check_calibration()
+    assert device.calibration is not None
+    circuits = [get_benchmark(name, "mapped", 4, device_name=device_name) for name in ("ghz", "qft", "wstate")]
+
+    expected = []
+    for qc in circuits:
+        success_probability = 1.0
+        for instruction in qc.data:
+            qubits = [qc.find_bit(qubit).index for qubit in instruction.qubits]
+            if instruction.name == "measure":
+                success_probability *= device.get_readout_fidelity(qubits[0])
+            elif instruction.name != "barrier" and len(qubits) == 1:
+                success_probability *= device.get_single_qubit_gate_fidelity(instruction.name, qubits[0])
+            elif instruction.name != "barrier":
+                if (qubits[0], qubits[1]) not in device.calibration.two_qubit_gate_fidelity:
+                    qubits.reverse()
+                success_probability *= device.get_two_qubit_gate_fidelity(instruction.name, *qubits)
+        expected.append(success_probability)
+
+    assert estimate_success_probability(circuits[0], device) == pytest.approx(expected[0])
+    assert np.allclose(estimate_success_probability_many(circuits, device), expected)
+    assert np.allclose(estimate_success_probability_many(circuits[::-1], device), expected[::-1])
+    assert estimate_success_probability_many([], device).shape == (0,)
+    assert estimate_success_probability(QuantumCircuit(2), device) == pytest.approx(1.0)
+    assert np.allclose(estimate_success_probability_many(circuits, device, log=True), np.log(expected))
+    assert estimate_success_probability(circuits[0], device, log=True) == pytest.approx(np.log(expected[0]))
+
+
+def test_estimate_success_probability_log() -> None:
+    """Test that the log success probability does not underflow for circuits with many operations."""
+    device = get_device_by_name("ibm_torino")
+    qc = QuantumCircuit(1, 1)
+    append_measurements(qc, [(qc.qubits[0], qc.clbits[0])] * 100_000)
+    log_success_probability = 100_000 * np.log(device.get_readout_fidelity(0))
+
+    assert log_success_probability < np.log(np.finfo(np.float64).tiny)
+    assert estimate_success_probability(qc, device) == 0.0
+    assert estimate_success_probability(qc, device, log=True) == pytest.approx(log_success_probability)
+
+
+def test_estimate_success_probability_unsupported_operations() -> None:
+    """Test that operations without calibration data are rejected."""
+    device = get_device_by_name("ibm_torino")
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    with pytest.raises(ValueError, match=r"Calibration data for gates \['h'\] not available"):
+        estimate_success_probability(qc, device)
+    qc = QuantumCircuit(3)
+    qc.ccx(0, 1, 2)
+    with pytest.raises(ValueError, match="acts on 3 qubits"):
+        estimate_success_probability(qc, device)
+    qc = QuantumCircuit(3)
+    qc.cz(0, 2)
+    with pytest.raises(ValueError, match="Two-qubit fidelity not available"):
+        estimate_success_probability(qc, device)
+
+
+def test_estimate_duration() -> None:
+    """Test the as-soon-as-possible schedule of a small circuit against durations looked up per operation."""
+    device = get_device_by_name("ibm_washington")
+    device.check_calibration()
+    calibration = device.calibration
+    assert calibration is not None
+    a, b = next(iter(calibration.two_qubit_gate_duration))
+    qc = QuantumCircuit(device.num_qubits, 1)
+    qc.sx(a)
+    qc.sx(a)
+    qc.x(b)
+    qc.cx(a, b)
+    qc.sx(a)
+    qc.barrier(a, b)
+    qc.measure(b, 0)
+
+    sx_a = device.get_single_qubit_gate_duration("sx", a)
+    cx_end = 2 * sx_a + device.get_two_qubit_gate_duration("cx", a, b)
+    estimate = estimate_duration(qc, device)
+    assert estimate.duration == pytest.approx(cx_end + sx_a + device.get_readout_duration(b))
+    assert estimate.idle_qubits.tolist() == [b, b]
+    assert np.allclose(estimate.idle_starts, [device.get_single_qubit_gate_duration("x", b), cx_end])
+    assert np.allclose(estimate.idle_ends, [2 * sx_a, cx_end + sx_a])
+    idle_time = estimate.idle_ends - estimate.idle_starts
+    assert estimate.idle_time[b] == pytest.approx(idle_time.sum())
+    assert np.count_nonzero(estimate.idle_time) == 1
+    rate = 1 / calibration.get_t1(b) + 1 / calibration.get_t2(b)
+    assert estimate.decay_factor == pytest.approx(np.exp(-idle_time.sum() * rate))
+
+    empty = estimate_duration(QuantumCircuit(2), device)
+    assert empty.duration == pytest.approx(0.0)
+    assert empty.decay_factor == pytest.approx(1.0)
+    assert not empty.idle_qubits.size
+
+
+@pytest.mark.parametrize("device_name", ["ibm_torino", "ionq_aria1", "iqm_apollo"])
+def test_estimate_duration_benchmarks(device_name: str) -> None:
+    """Test the duration estimate of mapped benchmarks, whose measurements are preceded by a barrier."""
+    device = get_device_by_name(device_name)
+    qc = get_benchmark("qft", "mapped", 5, device_name=device_name)
+    estimate = estimate_duration(qc, device)
+    assert estimate.duration > 0
+    assert 0 < estimate.decay_factor <= 1
+    assert np.all(estimate.idle_starts < estimate.idle_ends)
+    assert np.all(estimate.idle_ends <= estimate.duration)
+    assert np.allclose(
+        np.bincount(estimate.idle_qubits, estimate.idle_ends - estimate.idle_starts, minlength=qc.num_qubits),
+        estimate.idle_time,
+    )
+
+    qc = QuantumCircuit(device.num_qubits + 1, 1)
+    qc.measure(device.num_qubits, 0)
+    with pytest.raises(ValueError, match="Readout duration not available"):
+        estimate_duration(qc, device)
+
+
+@pytest.mark.parametrize("device_name", ["oqc_lucy", "quantinuum_h2", "rigetti_aspen_m3"])
+def test_estimate_duration_without_durations(device_name: str) -> None:
+    """Test that devices without duration calibration are rejected up front."""
+    qc = get_benchmark("qft", "mapped", 6, device_name=device_name)
+    with pytest.raises(ValueError, match=f"Device {device_name} has no duration calibration"):
+        estimate_duration(qc, get_device_by_name(device_name))
+
+
+def test_random_circuit_native() -> None:
+    """Test the native random circuit generator, which samples the OpenQASM gates without transpilation."""
+    qc = randomcircuit.create_circuit(20, native=True, depth_ratio=1.5, two_qubit_gate_density=0.8)
+    assert qc.num_qubits == 20
+    assert qc.depth() == 30 + 1
+    allowed = set(get_openqasm_gates()) - randomcircuit.EXCLUDED_GATES | {"measure", "barrier"}
+    assert set(qc.count_ops()) <= allowed
+    two_qubit_gates = sum(instruction.operation.num_qubits == 2 for instruction in qc.data)
+    assert 0.6 < 2 * two_qubit_gates / (20 * 30) < 1
+    assert qc == randomcircuit.create_circuit(20, native=True, depth_ratio=1.5, two_qubit_gate_density=0.8)
+    assert qc != randomcircuit.create_circuit(20, native=True, depth_ratio=1.5, two_qubit_gate_density=0.8, seed=11)
+
+    only_one_qubit_gates = randomcircuit.generate_random_circuit(5, 4, two_qubit_gate_density=0)
+    assert all(instruction.operation.num_qubits == 1 for instruction in only_one_qubit_gates.data)
+    assert only_one_qubit_gates.size() == 20
+    with pytest.raises(ValueError, match="two_qubit_gate_density must be between 0 and 1"):
+        randomcircuit.generate_random_circuit(5, 4, two_qubit_gate_density=1.5)
+
+    estimate = estimate_resources("randomcircuit", 20, native=True, depth_ratio=1.5, two_qubit_gate_density=0.8)
+    assert estimate.depth == qc.depth()
+    assert estimate.num_qubits == 20
+    indep = get_benchmark("randomcircuit", "indep", 6, native=True)
+    assert indep.num_qubits == 6
+
+
 def test_get_module_for_benchmark() -> None:
     """Test the get_module_for_benchmark function."""
     for benchmark in get_supported_benchmarks():
         assert get_module_for_benchmark(benchmark.split("-")[0]) is not None
 
 
+def test_benchmark_registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """Test registering benchmarks at runtime and via entry points."""
+    (tmp_path / "my_benchmarks.py").write_text(
+        "from mqt.bench.registry import BenchmarkSpec\n"
+        "SPEC = BenchmarkSpec('mybell', 'my_benchmarks_impl:create_circuit', ancillary_modes=('a', 'b'))\n"
+    )
+    (tmp_path / "my_benchmarks_impl.py").write_text(
+        "from qiskit import QuantumCircuit\n"
+        "def create_circuit(num_qubits, ancillary_mode):\n"
+        "    qc = QuantumCircuit(num_qubits, name='mybell_' + ancillary_mode)\n"
+        "    qc.h(0)\n"
+        "    return qc\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    entry_points = [
+        metadata.EntryPoint("mybell", "my_benchmarks:SPEC", registry.ENTRY_POINT_GROUP),
+        metadata.EntryPoint("invalid", "my_benchmarks:BenchmarkSpec", registry.ENTRY_POINT_GROUP),
+        metadata.EntryPoint("missing", "my_missing_benchmarks:SPEC", registry.ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(registry, "_get_entry_points", lambda: entry_points)
+    registry._get_registry.cache_clear()  # noqa: SLF001
+    registry._resolve.cache_clear()  # noqa: SLF001
+    try:
+        assert get_supported_benchmarks()[-2:] == ["mybell-a", "mybell-b"]
+        assert "my_benchmarks_impl" not in sys.modules
+        assert "does not refer to a BenchmarkSpec" in caplog.text
+        assert "Could not load the benchmark missing" in caplog.text
+        assert get_benchmark("mybell-b", "alg", 3).name == "mybell_b"
+        with pytest.raises(ValueError, match="Selected benchmark is not supported"):
+            get_benchmark("mybell-c", "alg", 3)
+
+        registry.register_benchmark(registry.BenchmarkSpec("mybell2", QuantumCircuit))
+        assert get_benchmark("mybell2", "indep", 4).num_qubits == 4
+        # benchmarks without a resource estimate are exempt from the gate budget
+        assert check_gate_budget("mybell2", 4, gate_budget=0) is None
+        # runtime registrations are passed on to spawned processes
+        assert get_benchmark("mybell2", "alg", 3, timeout_s=60).num_qubits == 3
+        configs = [Benchmark(name="mybell2", min_qubits=2, max_qubits=3)]
+        results = iter_benchmarks(configs, level="alg", jobs=2)
+        assert sorted(qc.num_qubits for _, qc in results) == [2, 3]
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register_benchmark(registry.BenchmarkSpec("ghz", "my_benchmarks_impl:create_circuit"))
+    finally:
+        registry._get_registry.cache_clear()  # noqa: SLF001
+        registry._resolve.cache_clear()  # noqa: SLF001
+
+    spec, mode = registry.get_benchmark_spec("qwalk-v-chain")
+    assert (spec.name, mode) == ("qwalk", "v-chain")
+    assert registry.get_spec("qwalk") is spec
+    assert registry.get_spec("qwalk-v-chain") is None
+    assert spec.has_resource_estimate
+    assert registry.get_benchmark_spec("shor")[0].selected_by_instance
+    with pytest.raises(ValueError, match="Selected benchmark is not supported"):
+        registry.get_benchmark_spec("grover")
+
+
+def test_import_does_not_load_benchmarks() -> None:
+    """Test that neither importing mqt.bench nor listing the benchmarks imports the benchmark modules."""
+    code = (
+        "import sys\n"
+        "from mqt.bench.benchmark_generation import get_supported_benchmarks\n"
+        "assert len(get_supported_benchmarks()) > 20\n"
+        "print(sorted(name for name in sys.modules if name.startswith('mqt.bench.benchmarks.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
 def test_benchmark_helper_shor() -> None:
     """Testing the Shor benchmarks."""
     shor_instances = ["xsmall", "small", "medium", "large", "xlarge"]
@@ -595,6 +1204,101 @@ def test_benchmark_helper_shor() -> None:
         assert res_shor
 
 
+@pytest.mark.parametrize(("a", "period"), [(2, 4), (4, 2)])
+def test_shor_period_finding(a: int, period: int) -> None:
+    """Test that the Shor circuit for N = 5 measures multiples of 2^6 / r for the period r of a^x mod 5."""
+    qc = shor.Shor().construct_circuit(5, a)
+    probabilities = Statevector(qc).probabilities_dict(qargs=range(6))
+    expected = {format(k * 64 // period, "06b"): 1 / period for k in range(period)}
+    assert {key: value for key, value in probabilities.items() if value > 1e-6} == pytest.approx(expected)
+
+
+def test_shor_angles() -> None:
+    """Test the vectorized angles of the additions in Fourier space against their definition."""
+    n = 9
+    constants = [0, 1, 5, 255, 321, 511]
+    expected = [
+        [np.pi * sum(2.0 ** (j - i) for j in range(i + 1) if (c >> j) & 1) for i in range(n)] for c in constants
+    ]
+    assert np.allclose(shor.Shor._get_angles_many(constants, n), expected)  # noqa: SLF001
+
+
+def test_shor_custom_instances() -> None:
+    """Test Shor instances with a custom number to be factorized and an automatically chosen integer a."""
+    assert shor.choose_a(15) == 2
+    # 2^6 = -1 (mod 65), hence, 2 does not reveal a factor of 65
+    assert shor.choose_a(65) == 3
+    # no a reveals a factor of a prime (power), 2 has order 2 modulo 3
+    assert shor.choose_a(9) == 2
+    assert shor.choose_a(3) == 2
+    assert shor.get_instance("65") == [65, 3]
+    assert shor.get_instance(shor.instance_name(65, 2)) == [65, 2]
+    with pytest.raises(ValueError, match="Unknown instance 65_"):
+        shor.get_instance("65_")
+
+    qc = get_benchmark("shor", "alg", N=21)
+    assert qc.name == "shor_21_2"
+    assert qc.num_qubits == 4 * 5 + 2
+    assert get_benchmark("shor", "alg", N=21, a=5).name == "shor_21_5"
+    assert get_benchmark("shor", "alg", benchmark_instance_name="21_5").name == "shor_21_5"
+    with pytest.raises(ValueError, match="not both"):
+        get_benchmark("shor", "alg", benchmark_instance_name="xsmall", N=21)
+    with pytest.raises(ValueError, match="gcd"):
+        get_benchmark("shor", "alg", N=21, a=7)
+
+
+@pytest.mark.parametrize("benchmark_name", ["grover-noancilla", "grover-v-chain", "qwalk-noancilla", "qwalk-v-chain"])
+def test_for_loop_iterations(benchmark_name: str) -> None:
+    """Test that the for-loop representation of the Grover and QWalk iterations is equivalent but more compact."""
+    unrolled = get_benchmark(benchmark_name, "alg", 5)
+    looped = get_benchmark(benchmark_name, "alg", 5, use_for_loop=True)
+    assert looped.count_ops()["for_loop"] == 1
+    assert Operator(PassManager(UnrollForLoops()).run(looped.remove_final_measurements(inplace=False))).equiv(
+        Operator(unrolled.remove_final_measurements(inplace=False))
+    )
+    assert "for _ in [0:" in dumps_qasm3(looped)
+    assert len(dumps_qasm3(looped)) < len(dumps_qasm3(unrolled))
+
+    # the loop is kept throughout the compilation flow
+    for qc in (
+        get_benchmark(benchmark_name, "nativegates", 5, gateset="clifford+t", use_for_loop=True),
+        get_benchmark(benchmark_name, "mapped", 5, device_name="ibm_montreal", use_for_loop=True),
+    ):
+        assert qc.count_ops()["for_loop"] == 1
+
+
+def test_multi_controlled_gates() -> None:
+    """Test that the shared multi-controlled gates are decomposed once and expand to equivalent circuits."""
+    assert multi_controlled.get_mcx_gate(4, "v-chain") is multi_controlled.get_mcx_gate(4, "v-chain")
+    with pytest.raises(ValueError, match="Unsupported mode"):
+        multi_controlled.get_mcx_gate(4, "unknown")
+
+    qc = QuantumCircuit(7)
+    multi_controlled.append_mcx(qc, qc.qubits[:4], qc.qubits[4], mode="v-chain", ancilla_qubits=qc.qubits[5:])
+    multi_controlled.append_mcx(qc, qc.qubits[2:5], qc.qubits[1], mode="recursion", ancilla_qubits=qc.qubits[5:])
+    multi_controlled.append_mcx(qc, qc.qubits[:3], qc.qubits[6])
+    qc.append(multi_controlled.get_mcp_gate(0.5, 3), qc.qubits[3:7])
+    with pytest.raises(ValueError, match="At least 2 ancillas required"):
+        multi_controlled.append_mcx(qc, qc.qubits[:4], qc.qubits[4], mode="v-chain")
+
+    expanded = multi_controlled.expand_multi_controlled_gates(qc)
+    # multi-controlled X gates without ancillas are left to the transpiler on the top level
+    assert set(expanded.count_ops()) - set(get_openqasm_gates()) == {"mcx"}
+    assert Operator(expanded).equiv(Operator(qc))
+    plain = QuantumCircuit(2)
+    plain.cx(0, 1)
+    assert multi_controlled.expand_multi_controlled_gates(plain) is plain
+
+    # the gates within the Grover operator are expanded as well, yielding the same compiled circuit
+    grover_qc = get_benchmark("grover-noancilla", "alg", 5)
+    assert Operator(
+        multi_controlled.expand_multi_controlled_gates(grover_qc).remove_final_measurements(inplace=False)
+    ).equiv(Operator(grover_qc.remove_final_measurements(inplace=False)))
+    assert benchmark_generation._compile_indep(grover_qc) == compilation.get_pass_manager(  # noqa: SLF001
+        get_openqasm_gates(), optimization_level=1
+    ).run(grover_qc)
+
+
 def test_validate_input() -> None:
     """Test the _validate_input() method for various edge cases."""
     # Case 1: to_be_factored_number (N) < 3.
@@ -800,6 +1504,86 @@ def test_save_circuit_success(tmp_path: Path) -> None:
     assert (tmp_path / "bar.qpy").exists()
 
 
+def test_manifest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that saved files are recorded in the manifest and that the precheck detects stale files."""
+    qc = QuantumCircuit(1, name="foo")
+    qc.h(0)
+    directory = str(tmp_path)
+
+    assert save_circuit(qc, "foo", OutputFormat.QASM3, target_directory=directory)
+    content = (tmp_path / "foo.qasm").read_bytes()
+    entry = Manifest(tmp_path).entries["foo.qasm"]
+    assert entry.size == len(content)
+    assert entry.content_hash == hashlib.sha256(content).hexdigest()
+    assert entry.is_current()
+    assert is_up_to_date(directory, "foo", OutputFormat.QASM3)
+    assert not is_up_to_date(directory, "foo", OutputFormat.QASM3, gateset=["cx"])
+    assert not is_up_to_date(directory, "foo", OutputFormat.QPY)
+
+    # the precheck only consults the manifest and the requested file, without listing the directory
+    monkeypatch.setattr(benchmark_generation, "save_circuit", lambda **_kwargs: pytest.fail("file is up to date"))
+    monkeypatch.setattr(os, "scandir", lambda *_args: pytest.fail("directory is listed"))
+    (tmp_path / "other.qasm").write_bytes(b"")
+    assert get_alg_level(qc, 1, True, False, directory, "foo")
+    monkeypatch.undo()
+
+    # files that were removed or modified by other means are generated again
+    (tmp_path / "foo.qasm").unlink()
+    assert not is_up_to_date(directory, "foo", OutputFormat.QASM3)
+    assert get_alg_level(qc, 1, True, False, directory, "foo")
+    assert (tmp_path / "foo.qasm").read_bytes() == content
+    assert is_up_to_date(directory, "foo", OutputFormat.QASM3)
+    (tmp_path / "foo.qasm").write_bytes(content + b"// modified")
+    assert not Manifest(tmp_path).is_up_to_date("foo.qasm", config_hash(OutputFormat.QASM3))
+    assert save_circuit(qc, "foo", OutputFormat.QASM3, target_directory=directory)
+
+    # a locked index is not mistaken for an empty one
+    connect = sqlite3.connect
+    with closing(connect(tmp_path / MANIFEST_FILENAME)) as connection:
+        connection.execute("BEGIN EXCLUSIVE")
+        monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: connect(*args, **{**kwargs, "timeout": 0.01}))
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            Manifest(tmp_path)
+        monkeypatch.undo()
+
+    monkeypatch.setattr(manifest, "get_generator_versions", lambda: ("0.0.0", "0.0.0"))
+    assert Manifest(tmp_path).stale_files() == ["foo.qasm"]
+    assert not is_up_to_date(directory, "foo", OutputFormat.QASM3)
+    monkeypatch.undo()
+
+    (tmp_path / MANIFEST_FILENAME).write_bytes(b"corrupted")
+    assert Manifest(tmp_path).entries == {}
+    assert "Ignoring unreadable manifest" in caplog.text
+    clear_manifests()
+    assert save_circuit(qc, "foo", OutputFormat.QASM3, target_directory=directory)
+    assert Manifest(tmp_path).is_up_to_date("foo.qasm", config_hash(OutputFormat.QASM3))
+
+
+def test_config_hash_independent_of_hash_seed() -> None:
+    """Test that the manifest settings hash of the default device is the same in processes with different hash seeds."""
+    code = (
+        "from mqt.bench.devices import get_device_by_name\n"
+        "from mqt.bench.manifest import config_hash\n"
+        "from mqt.bench.output import OutputFormat\n"
+        "device = get_device_by_name('ibm_washington')\n"
+        "print(config_hash(OutputFormat.QASM3, device.gateset.gates, device.coupling_map))\n"
+    )
+    hashes = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(hashes) == 1
+    assert config_hash(OutputFormat.QASM3, ["x", "cx"], [[1, 0], [0, 1]]) == config_hash(
+        OutputFormat.QASM3, ["cx", "x"], [[0, 1], [1, 0]]
+    )
+
+
 def test_save_circuit_write_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """save_circuit returns False when write_circuit fails."""
     qc = QuantumCircuit(1)
@@ -852,3 +1636,332 @@ def test_stream_mode_mismatch_raises() -> None:
     # Text stream + QPY → error
     with pytest.raises(MQTBenchExporterError):
         write_circuit(qc, io.StringIO(), fmt=OutputFormat.QPY)
+
+
+def test_expand_benchmark_configs() -> None:
+    """Test the expansion of benchmark configurations into jobs."""
+    configs = [
+        Benchmark(name="ghz", min_qubits=2, max_qubits=6, stepsize=2, precheck_possible=True),
+        Benchmark(name="grover", min_qubits=3, max_qubits=3, ancillary_mode=["noancilla", "v-chain"]),
+        Benchmark(name="shor", instances=["xsmall", "small"]),
+        Benchmark(name="qft", include=False, min_qubits=2, max_qubits=3),
+    ]
+    assert expand_benchmark_configs(configs) == [
+        BenchmarkJob("ghz", 2, file_precheck=True),
+        BenchmarkJob("ghz", 4, file_precheck=True),
+        BenchmarkJob("ghz", 6, file_precheck=True),
+        BenchmarkJob("grover-noancilla", 3),
+        BenchmarkJob("grover-v-chain", 3),
+        BenchmarkJob("shor", None, "xsmall"),
+        BenchmarkJob("shor", None, "small"),
+    ]
+
+    with pytest.raises(ValueError, match="Selected benchmark is not supported"):
+        expand_benchmark_configs([Benchmark(name="qwalk", min_qubits=3, max_qubits=3, ancillary_mode=["wrong"])])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_benchmarks(tmp_path: Path, jobs: int) -> None:
+    """Test the batch generation of benchmarks on all levels."""
+    configs = [
+        Benchmark(name="ghz", min_qubits=2, max_qubits=3),
+        Benchmark(name="dj", min_qubits=3, max_qubits=3),
+    ]
+    results = generate_benchmarks(
+        configs,
+        devices=["ionq_harmony"],
+        gatesets=["ionq", "ibm_falcon"],
+        opt_levels=[0, 1],
+        jobs=jobs,
+        target_directory=str(tmp_path),
+    )
+    assert results == [True, True, True]
+
+    files = {path.name for path in tmp_path.iterdir()}
+    for name, size in [("ghz", 2), ("ghz", 3), ("dj", 3)]:
+        assert f"{name}_alg_{size}.qasm" in files
+        assert f"{name}_indep_{size}.qasm" in files
+        for opt_level in (0, 1):
+            assert f"{name}_nativegates_ionq_opt{opt_level}_{size}.qasm" in files
+            assert f"{name}_nativegates_ibm_falcon_opt{opt_level}_{size}.qasm" in files
+            assert f"{name}_mapped_ionq_harmony_opt{opt_level}_{size}.qasm" in files
+    assert MANIFEST_FILENAME in files
+    assert len(files) == 3 * 8 + 1
+
+
+def test_generate_benchmarks_failures(tmp_path: Path) -> None:
+    """Test that invalid targets are rejected and failing jobs are reported."""
+    configs = [Benchmark(name="ghz", min_qubits=2, max_qubits=2)]
+    with pytest.raises(ValueError, match="Selected level must be in"):
+        generate_benchmarks(configs, levels=["wrong"], jobs=1, target_directory=str(tmp_path))
+    with pytest.raises(ValueError, match=r"Device wrong not found in available devices."):
+        generate_benchmarks(configs, devices=["wrong"], jobs=1, target_directory=str(tmp_path))
+
+    # 'qasm2' is not supported for the algorithm level
+    results = generate_benchmarks(
+        configs, levels=[0], jobs=1, target_directory=str(tmp_path), output_format=OutputFormat.QASM2
+    )
+    assert results == [False]
+
+
+def test_generate_benchmarks_precheck(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the target-independent circuit is only built for levels whose files are not up to date."""
+    configs = [Benchmark(name="ghz", min_qubits=3, max_qubits=3, precheck_possible=True)]
+
+    def generate() -> list[bool]:
+        return generate_benchmarks(
+            configs,
+            levels=["indep", "nativegates", "mapped"],
+            devices=["ionq_harmony"],
+            gatesets=["ionq"],
+            jobs=1,
+            target_directory=str(tmp_path),
+        )
+
+    assert generate() == [True]
+
+    monkeypatch.setattr(batch, "get_indep_level", lambda *_args: pytest.fail("indep circuit built"))
+    assert generate() == [True]
+
+    (tmp_path / "ghz_mapped_ionq_harmony_opt1_3.qasm").unlink()
+    monkeypatch.undo()
+    assert generate() == [True]
+    assert (tmp_path / "ghz_mapped_ionq_harmony_opt1_3.qasm").is_file()
+
+
+def test_generate_benchmarks_synthesis_jobs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the number of synthesis workers is passed through to the Solovay-Kitaev synthesis."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    compilation._get_synthesis_memo.cache_clear()  # noqa: SLF001
+    synthesize_gates = compilation._synthesize_gates  # noqa: SLF001
+    requested_jobs: list[int | None] = []
+
+    def record_jobs(
+        gate_keys: list[compilation.GateKey], jobs: int | None
+    ) -> list[tuple[compilation.GateKey, tuple[list[str], float]]]:
+        requested_jobs.append(jobs)
+        return synthesize_gates(gate_keys, None)
+
+    monkeypatch.setattr(compilation, "_synthesize_gates", record_jobs)
+    configs = [Benchmark(name="qft", min_qubits=3, max_qubits=3)]
+    results = generate_benchmarks(
+        configs,
+        levels=["nativegates"],
+        gatesets=["clifford+t"],
+        jobs=1,
+        target_directory=str(tmp_path),
+        synthesis_jobs=4,
+    )
+    assert results == [True]
+    assert requested_jobs == [4]
+    compilation._get_synthesis_memo.cache_clear()  # noqa: SLF001
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_iter_benchmarks(jobs: int) -> None:
+    """Test that iter_benchmarks yields every circuit of the sweep."""
+    configs = [Benchmark(name="ghz", min_qubits=2, max_qubits=4), Benchmark(name="bv", min_qubits=3, max_qubits=3)]
+    results = list(iter_benchmarks(configs, level="nativegates", gateset="ionq", jobs=jobs, max_in_flight=2))
+
+    assert sorted((job.benchmark_name, job.circuit_size) for job, _ in results) == [
+        ("bv", 3),
+        ("ghz", 2),
+        ("ghz", 3),
+        ("ghz", 4),
+    ]
+    for job, qc in results:
+        assert qc.num_qubits == job.circuit_size
+        assert set(qc.count_ops()) <= {*get_native_gateset_by_name("ionq").gates, "measure", "barrier"}
+
+
+def test_iter_benchmarks_lazy_and_failures() -> None:
+    """Test that iter_benchmarks consumes the configurations lazily and skips circuits that cannot be generated."""
+
+    def configs() -> Iterator[Benchmark]:
+        yield Benchmark(name="ghz", min_qubits=10, max_qubits=12)
+        pytest.fail("configurations must be consumed lazily")
+
+    results = iter_benchmarks(configs(), level="mapped", device_name="ionq_harmony", jobs=1)
+    assert [job.circuit_size for job, _ in itertools.islice(results, 2)] == [10, 11]
+    # the device has 11 qubits only
+    with pytest.raises(pytest.fail.Exception, match="configurations must be consumed lazily"):
+        next(results)
+
+    with pytest.raises(ValueError, match="Selected level must be in"):
+        next(iter_benchmarks(configs(), level="wrong"))
+
+
+def test_run_with_limits() -> None:
+    """Test that supervised generations are stopped once they exceed their limits."""
+    assert run_with_limits(sum, ([1, 2, 3],), timeout_s=60) == 6
+
+    timeout = run_with_limits(time.sleep, (60,), timeout_s=1)
+    assert timeout == GenerationFailure("timeout", "Generation exceeded the time limit of 1s.")
+
+    memory = run_with_limits(bytearray, (4 * 1024**3,), max_memory_mb=1024)
+    assert isinstance(memory, GenerationFailure)
+    assert memory.reason == "memory"
+
+    error = run_with_limits(int, ("no number",))
+    assert isinstance(error, GenerationFailure)
+    assert error.reason == "error"
+    assert "invalid literal" in error.message
+
+
+def test_benchmarks_with_limits(caplog: pytest.LogCaptureFixture) -> None:
+    """Test the time and memory limits of get_benchmark and the batch generation."""
+    qc = get_benchmark("ghz", "indep", 3, timeout_s=120, max_memory_mb=4096)
+    assert qc.num_qubits == 3
+    with pytest.raises(GenerationLimitError, match="time limit") as exc_info:
+        get_benchmark("ghz", "indep", 3, timeout_s=0.01)
+    assert exc_info.value.failure.reason == "timeout"
+
+    configs = [Benchmark(name="ghz", min_qubits=3, max_qubits=4)]
+    assert generate_benchmarks(configs, levels=["alg"], jobs=2, timeout_s=0.01) == [False, False]
+    assert "failed (timeout)" in caplog.text
+    results = list(iter_benchmarks(configs, jobs=2, timeout_s=120))
+    assert sorted(job.circuit_size or 0 for job, _ in results) == [3, 4]
+
+
+@pytest.fixture
+def circuit_cache(tmp_path: Path) -> Iterator[CircuitCache]:
+    """Fixture to enable the circuit cache in a temporary directory."""
+    cache = configure_cache(tmp_path / "cache")
+    assert cache is not None
+    yield cache
+    configure_cache(None)
+
+
+@pytest.mark.parametrize(
+    ("level", "gateset", "device_name"),
+    [
+        ("alg", "ibm_falcon", "ibm_washington"),
+        ("indep", "ibm_falcon", "ibm_washington"),
+        ("nativegates", "ionq", "ibm_washington"),
+        ("mapped", "ibm_falcon", "ionq_harmony"),
+    ],
+)
+def test_get_benchmark_cached(
+    level: str, gateset: str, device_name: str, circuit_cache: CircuitCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that get_benchmark is served from the circuit cache for repeated configurations."""
+    qc = get_benchmark("ghz", level, 4, gateset=gateset, device_name=device_name)
+    assert len(list(circuit_cache.directory.glob("*.qpy"))) == 1
+
+    def fail(*_args: object, **_kwargs: object) -> NoReturn:
+        msg = "circuit should have been cached"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(benchmark_generation, "create_circuit", fail)
+    monkeypatch.setattr(benchmark_generation, "get_pass_manager", fail)
+    monkeypatch.setattr(benchmark_generation, "compile_circuits", fail)
+    cached = get_benchmark("ghz", level, 4, gateset=gateset, device_name=device_name)
+    assert cached == qc
+
+    # a different configuration is not served from the cache
+    with pytest.raises(AssertionError, match="circuit should have been cached"):
+        get_benchmark("ghz", level, 5, gateset=gateset, device_name=device_name)
+
+
+def test_level_functions_cached(circuit_cache: CircuitCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the level functions are served from the circuit cache for repeated inputs."""
+    qc = ghz.create_circuit(4)
+    gateset = get_native_gateset_by_name("ibm_falcon")
+    device = get_device_by_name("ibm_montreal")
+    indep = get_indep_level(qc, 4, False, True)
+    native = get_native_gates_level(qc, gateset, 4, 1, False, True)
+    mapped = get_mapped_level(qc, 4, device, 1, False, True)
+    assert len(list(circuit_cache.directory.glob("*.qpy"))) == 3
+
+    monkeypatch.setattr(benchmark_generation, "get_pass_manager", lambda *_args, **_kwargs: pytest.fail("not cached"))
+    monkeypatch.setattr(benchmark_generation, "compile_circuits", lambda *_args, **_kwargs: pytest.fail("not cached"))
+    assert get_indep_level(ghz.create_circuit(4), 4, False, True) == indep
+    assert get_native_gates_level(ghz.create_circuit(4), gateset, 4, 1, False, True) == native
+    cached_mapped = get_mapped_level(ghz.create_circuit(4), 4, device, 1, False, True)
+    assert cached_mapped == mapped
+    assert cached_mapped.layout is not None
+
+
+def test_cache_key_independent_of_hash_seed() -> None:
+    """Test that the cache keys of the default targets are the same in processes with different hash seeds."""
+    code = (
+        "from mqt.bench.benchmark_generation import _serializable_key_parts\n"
+        "from mqt.bench.cache import CircuitCache\n"
+        "from mqt.bench.devices import get_device_by_name, get_native_gateset_by_name\n"
+        "parts = {'gateset': get_native_gateset_by_name('ibm_falcon'), 'device': get_device_by_name('ibm_washington')}\n"
+        "print(CircuitCache.make_key(**_serializable_key_parts(parts)))\n"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(keys) == 1
+
+
+def test_circuit_fingerprint_custom_gates(circuit_cache: CircuitCache) -> None:
+    """Test that custom gates and unitaries are told apart by their definitions rather than by their names."""
+    circuits = []
+    for gate in ("h", "x"):
+        block = QuantumCircuit(1, name="blk")
+        getattr(block, gate)(0)
+        qc = QuantumCircuit(1)
+        qc.append(block.to_gate(), [0])
+        circuits.append(qc)
+    assert circuit_fingerprint(circuits[0]) != circuit_fingerprint(circuits[1])
+    for qc in circuits:
+        assert Operator(get_indep_level(qc, 1, False, True)).equiv(Operator(qc))
+    assert len(list(circuit_cache.directory.glob("*.qpy"))) == 2
+
+    # the unitaries only differ beyond the precision of the string representation of their arrays
+    unitaries = []
+    for angle in (0.1, 0.1 + 1e-12):
+        qc = QuantumCircuit(1)
+        qc.unitary(np.diag([1, np.exp(1j * angle)]), [0])
+        unitaries.append(qc)
+    assert str(unitaries[0].data[0].operation.params[0]) == str(unitaries[1].data[0].operation.params[0])
+    assert circuit_fingerprint(unitaries[0]) != circuit_fingerprint(unitaries[1])
+    assert circuit_fingerprint(unitaries[0]) == circuit_fingerprint(unitaries[0].copy())
+
+
+def test_circuit_cache_eviction(tmp_path: Path) -> None:
+    """Test that the least recently used circuits are evicted once the cache is full."""
+    cache = CircuitCache(tmp_path, max_size_bytes=10**9)
+    keys = [cache.make_key(benchmark_name="ghz", circuit_size=n) for n in range(2, 5)]
+    assert len(set(keys)) == 3
+    for n, key in zip(range(2, 5), keys):
+        cache.put(key, ghz.create_circuit(n))
+    entry_size = max(path.stat().st_size for path in tmp_path.glob("*.qpy"))
+
+    # entries are used in the order of their creation, then the first entry is used again
+    for timestamp, key in enumerate(keys):
+        os.utime(tmp_path / f"{key}.qpy", (timestamp, timestamp))
+    assert cache.get(keys[0]) is not None
+
+    cache.max_size_bytes = 2 * entry_size
+    cache.evict()
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+    cache.clear()
+    assert not list(tmp_path.glob("*.qpy"))
+
+
+def test_circuit_cache_failed_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that failed writes are raised without leaving temporary files behind."""
+    cache = CircuitCache(tmp_path)
+
+    def fail(*_args: object) -> None:
+        msg = "No space left on device"
+        raise OSError(msg)
+
+    monkeypatch.setattr(Path, "replace", fail)
+    with pytest.raises(OSError, match="No space left on device"):
+        cache.put(cache.make_key(benchmark_name="ghz", circuit_size=2), ghz.create_circuit(2))
+    assert not list(tmp_path.iterdir())
@@ -38,6 +38,12 @@ if TYPE_CHECKING:
              "--num-qubits", "10",
             "--output-format", "qasm2",
          ], "OPENQASM 2.0;"),  # Note: shor is non-deterministic, so just a basic sanity check
+        ([
+             "--level", "alg",
+             "--algorithm", "shor",
+             "--shor-n", "21",
+             "--shor-a", "5",
+         ], dumps(get_benchmark(level="alg", benchmark_name="shor", N=21, a=5))),
         ([
              "--level", "alg",
              "--algorithm", "ghz",
@@ -105,6 +111,9 @@ def test_cli(args: list[str], expected_output: str, script_runner: ScriptRunner)
              "--algorithm", "not-a-valid-benchmark",
              "--num-qubits", "20",
          ], ""),
+        (["--level", "alg", "--algorithm", "ghz"], "--num-qubits is required"),
+        (["--level", "alg", "--algorithm", "ghz", "--num-qubits", "5", "--shor-n", "21"], "--shor-n can only be used"),
+        (["--level", "alg", "--algorithm", "shor", "--shor-a", "2"], "--shor-a requires --shor-n"),
     ],
 )
 def test_cli_errors(args: list[str], expected_output: str, script_runner: ScriptRunner) -> None: